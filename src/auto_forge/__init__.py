@@ -35,9 +35,9 @@ try:
     from auto_forge.common.local_types import (
         AIKeyType, AIModelType, AIProviderType, AIProvidersType, AddressInfoType,
         AutoForgCommandType, AutoForgFolderType, AutoForgeModuleType, AutoForgeWorkModeType,
-        BuildAnalyzedContextType, BuildAnalyzedEventType, BuildProfileType,
+        BuildAnalyzedContextType, BuildAnalyzedEventType, BuildParallelismType, BuildProfileType,
         CommandFailedException, CommandResultType,
-        DataSizeFormatter, EventManager, ExceptionGuru, ExecutionModeType, ExpectedVersionInfoType,
+        DataSizeFormatter, ElfSymbolsType, EventManager, ExceptionGuru, ExecutionModeType, ExpectedVersionInfoType,
         FieldColorType, InputBoxButtonType, InputBoxLineType, InputBoxTextType,
         LinuxShellType, LogHandlersType,
         MessageBoxType, MethodLocationType, ModuleInfoType,
@@ -55,6 +55,21 @@ try:
     from auto_forge.common.progress_tracker import (ProgressTracker)
     from auto_forge.common.crypto import (Crypto)
     from auto_forge.common.summary_patcher import (SummaryPatcher)
+    from auto_forge.common.sequence_journal import (SequenceCheckpoint, SequenceJournal)
+    from auto_forge.common.http_session import (HTTPSession)
+    from auto_forge.common.git_mirror_cache import (GitMirrorCache)
+    from auto_forge.common.python_wheelhouse import (PythonWheelhouse)
+    from auto_forge.common.venv_snapshot import (VenvSnapshots)
+    from auto_forge.common.tool_probe_cache import (ToolProbeCache)
+    from auto_forge.common.build_jobserver import (BuildJobServer)
+    from auto_forge.common.build_resources import (BuildResources)
+    from auto_forge.common.build_pipeline import (BuildPipeline)
+    from auto_forge.common.elf_symbols import (ElfSymbols)
+    from auto_forge.common.compiler_cache import (CompilerCache)
+    from auto_forge.common.artifacts_cache import (ArtifactsCache)
+    from auto_forge.common.artifacts_publisher import (ArtifactsPublisher)
+    from auto_forge.common.ninja_log_analytics import (NinjaLogAnalytics, NinjaProgressEstimator)
+    from auto_forge.common.download_engine import (DownloadEngine)
 
     # Protocols
     from auto_forge.core.protocols.protocols import (
@@ -71,6 +86,7 @@ try:
                                                               BuildLogAnalyzerInterface, BuilderToolChain)
 
     # Build output analyzers
+    from auto_forge.builders.analyzers.diagnostics_store import BuildDiagnosticsStore
     from auto_forge.builders.analyzers.gcc_log_analyzer import GCCLogAnalyzer
 
     # WARNING: Core modules — import order is critical. Do not reorder.
@@ -107,26 +123,31 @@ except Exception as exception:
 
 # Exported symbols
 __all__ = [
-    "AIKeyType", "AIModelType", "AIProviderType", "AIProvidersType", "AddressInfoType",
+    "AIKeyType", "AIModelType", "AIProviderType", "AIProvidersType", "AddressInfoType", "ArtifactsCache",
+    "ArtifactsPublisher",
     "AutoForgCommandType", "AutoForgFolderType", "AutoForgeModuleType", "AutoForgeWorkModeType",
-    "BuildAnalyzedContextType", "BuildAnalyzedEventType", "BuildLogAnalyzerInterface", "BuildProfileType",
+    "BuildAnalyzedContextType", "BuildAnalyzedEventType", "BuildDiagnosticsStore", "BuildJobServer",
+    "BuildLogAnalyzerInterface", "BuildParallelismType", "BuildPipeline", "BuildProfileType", "BuildResources",
     "BuilderArtifactsValidator", "BuilderRunnerInterface", "BuilderToolChain",
-    "CommandFailedException", "CommandInterface", "CommandInterfaceProtocol", "CommandResultType",
+    "CommandFailedException", "CommandInterface", "CommandInterfaceProtocol", "CommandResultType", "CompilerCache",
     "CoreAIBridge", "CoreBuildShell", "CoreContext", "CoreDynamicLoader", "CoreGUI", "CoreJSONCProcessor",
     "CoreJSONCProcessorProtocol", "CoreLinuxAliases", "CoreLinuxAliasesProtocol", "CoreLogger",
     "CoreLoggerProtocol", "CoreMCPService", "CoreModuleInterface", "CorePlatform", "CoreRegistry", "CoreSignatures",
     "CoreSolution", "CoreSystemInfo", "CoreTelemetry", "CoreToolBox", "CoreToolBoxProtocol",
     "CoreVariables", "CoreVariablesProtocol", "CoreWatchdog", "CoreXRayDB", "Crypto",
-    "DataSizeFormatter", "EventManager", "ExceptionGuru", "ExecutionModeType", "ExpectedVersionInfoType",
-    "FieldColorType", "GCCLogAnalyzer", "HasConfigurationProtocol",
+    "DataSizeFormatter", "DownloadEngine", "ElfSymbols", "ElfSymbolsType", "EventManager", "ExceptionGuru",
+    "ExecutionModeType",
+    "ExpectedVersionInfoType",
+    "FieldColorType", "GCCLogAnalyzer", "GitMirrorCache", "HTTPSession", "HasConfigurationProtocol",
     "InputBoxButtonType", "InputBoxLineType", "InputBoxTextType",
     "LinuxShellType", "LogHandlersType", "LoggerSettingsType",
-    "MessageBoxType", "MethodLocationType", "ModuleInfoType",
-    "PackageGlobals", "ProgressTracker", "PromptStatusType", "ProxyServerType",
-    "SDKType", "SequenceErrorActionType", "Signature", "SignatureFieldType", "SignatureFileHandler",
+    "MessageBoxType", "MethodLocationType", "ModuleInfoType", "NinjaLogAnalytics", "NinjaProgressEstimator",
+    "PackageGlobals", "ProgressTracker", "PromptStatusType", "ProxyServerType", "PythonWheelhouse",
+    "SDKType", "SequenceCheckpoint", "SequenceErrorActionType", "SequenceJournal", "Signature",
+    "SignatureFieldType", "SignatureFileHandler",
     "SignatureSchemaType", "SourceFileInfoType", "SourceFileLanguageType", "StatusNotifType",
     "SummaryPatcher", "SysInfoLinuxDistroType", "SysInfoPackageManagerType",
     "TelemetryTrackedCounter", "TerminalAnsiGuru", "TerminalEchoType", "TerminalSpinner",
-    "TerminalTeeStream", "VariableFieldType", "VariableType", "VersionCompare",
+    "TerminalTeeStream", "ToolProbeCache", "VariableFieldType", "VariableType", "VenvSnapshots", "VersionCompare",
     "XRayStateType",
 ]
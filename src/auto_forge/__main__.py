@@ -101,6 +101,15 @@ def arguments_process() -> Optional[argparse.Namespace]:
         parser.add_argument("--log-file", type=str, required=False,
                             help="Optional Specify log fie name.")
 
+        parser.add_argument("--force", action="store_true",
+                            help="Sequence mode: ignore the steps journal and execute every step.")
+
+        parser.add_argument("--resume", action="store_true",
+                            help="Sequence mode: resume the last failed run from its first incomplete step.")
+
+        parser.add_argument("--dry-run", action="store_true",
+                            help="Sequence mode: validate the sequence and print its execution plan, run nothing.")
+
         # AutoForge supports two mutually exclusive non-interactive modes:
         # (1) Running step recipe data (typically used to set up a fresh workspace),
         # (2) Running a single command from an existing workspace.
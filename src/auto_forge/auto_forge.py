@@ -90,6 +90,9 @@ class AutoForge(CoreModuleInterface):
         self._raw_command: Optional[str] = None
         self._run_commands: Optional[list[str]] = None
         self._run_sequence_ref_name: Optional[str] = None
+        self._run_sequence_force: bool = False
+        self._run_sequence_resume: bool = False
+        self._run_sequence_dry_run: bool = False
         self._solution_package_path: Optional[str] = None
         self._solution_package_file: Optional[str] = None
         self._solution_url: Optional[str] = None
@@ -477,6 +480,9 @@ class AutoForge(CoreModuleInterface):
         if self._run_sequence_ref_name is not None:
             self._work_mode = AutoForgeWorkModeType.NON_INTERACTIVE_SEQUENCE
             self._logger.debug(f"Sequence ref name '{self._run_sequence_ref_name}'")
+            self._run_sequence_force = kwargs.get("force", False)
+            self._run_sequence_resume = kwargs.get("resume", False)
+            self._run_sequence_dry_run = kwargs.get("dry_run", False)
         else:
             # Received raw command(s) to execute — one or more commands or aliases, possibly with arguments,
             # separated by comma.
@@ -826,7 +832,10 @@ class AutoForge(CoreModuleInterface):
                             f"sequence reference name '{self._run_sequence_ref_name}' was not found in '{self._solution_name}'")
 
                     # Execute sequence
-                    self._exit_code = self._platform.run_sequence(sequence_data=sequence_data)
+                    self._exit_code = self._platform.run_sequence(sequence_data=sequence_data,
+                                                                  force=self._run_sequence_force,
+                                                                  resume=self._run_sequence_resume,
+                                                                  dry_run=self._run_sequence_dry_run)
 
                 else:
                     raise RuntimeError(f"work mode '{self._work_mode}' not supported")
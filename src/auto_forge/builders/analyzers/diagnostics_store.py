@@ -0,0 +1,165 @@
+"""
+Script:         diagnostics_store.py
+Author:         AutoForge Team
+
+Description:
+    SQLite backed baseline of build diagnostics. Each diagnostic is reduced to a stable fingerprint
+    (normalized message, file and enclosing function) so consecutive builds can be classified into
+    new, existing and fixed diagnostics without re-reporting everything every time.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Optional, Union
+
+AUTO_FORGE_MODULE_NAME = "DiagnosticsStore"
+AUTO_FORGE_MODULE_DESCRIPTION = "Persistent build diagnostics baseline"
+
+
+class BuildDiagnosticsStore:
+    """
+    Persistent, per-scope (typically 'project.configuration') store of diagnostics fingerprints.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS diagnostics (
+            scope TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            file TEXT,
+            function TEXT,
+            type TEXT,
+            message TEXT,
+            first_seen REAL NOT NULL,
+            last_seen REAL NOT NULL,
+            occurrences INTEGER NOT NULL DEFAULT 1,
+            fixed_at REAL,
+            PRIMARY KEY (scope, fingerprint)
+        );
+        CREATE INDEX IF NOT EXISTS idx_diagnostics_open ON diagnostics(scope, fixed_at);
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Opens (or creates) the diagnostics database.
+        Args:
+            db_path: Path to the SQLite database file.
+        """
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with suppress(sqlite3.DatabaseError):
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self._SCHEMA)
+        self._conn.commit()
+
+        self._number_re = re.compile(r'\b\d+\b')
+        self._spaces_re = re.compile(r'\s+')
+
+    def _normalize_message(self, message: Optional[str]) -> str:
+        """ Drop volatile parts (numbers, spacing, case) so that trivial changes keep the same fingerprint. """
+        if not message:
+            return ""
+        message = self._number_re.sub("#", message)
+        return self._spaces_re.sub(" ", message).strip().lower()
+
+    def fingerprint(self, event: dict[str, Any]) -> str:
+        """
+        Computes the stable fingerprint of a single diagnostic.
+        Args:
+            event: Diagnostic dictionary as exported by 'BuildAnalyzedEventType'.
+        Returns:
+            str: Hex digest identifying the diagnostic across builds.
+        """
+        file_name = os.path.normpath(event.get("file") or "")
+        key = "|".join((event.get("type") or "", self._normalize_message(event.get("message")), file_name,
+                        event.get("function") or ""))
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def classify(self, scope: str, events: list[dict[str, Any]], compiled_files: Optional[set[str]] = None,
+                 base_path: Optional[str] = None) -> dict[str, list[dict[str, Any]]]:
+        """
+        Classifies the diagnostics of a build against the stored baseline and updates it.
+        A known diagnostic which was not reported this time is only considered fixed when its file (a source, or a
+        header included by one) was actually compiled during the build. Otherwise, as with incremental builds which
+        didn't rebuild it, whether it is still there is unknown and it is kept open.
+        Args:
+            scope: Baseline scope, typically the build dot notation.
+            events: Diagnostics reported by the current build.
+            compiled_files: Normalized absolute paths of the files compiled by this build.
+            base_path: Directory the compiler ran in, relative diagnostic paths are resolved against it.
+        Returns:
+            dict: 'new' and 'existing' event lists, and 'fixed' and 'unknown' lists of stored records.
+        """
+        now = time.time()
+        compiled_files = compiled_files or set()
+        base_path = base_path or os.getcwd()
+        classification: dict[str, list[dict[str, Any]]] = {"new": [], "existing": [], "fixed": [], "unknown": []}
+
+        with self._lock:
+            open_rows = {row["fingerprint"]: dict(row) for row in self._conn.execute(
+                "SELECT * FROM diagnostics WHERE scope = ? AND fixed_at IS NULL", (scope,))}
+
+            seen: dict[str, str] = {}
+            for event in events:
+                fingerprint = self.fingerprint(event)
+                event["fingerprint"] = fingerprint
+                if fingerprint in seen:
+                    # Same diagnostic reported again (e.g. a header included by several sources)
+                    event["baseline"] = seen[fingerprint]
+                    classification[seen[fingerprint]].append(event)
+                    continue
+
+                if fingerprint in open_rows:
+                    event["baseline"] = seen[fingerprint] = "existing"
+                    classification["existing"].append(event)
+                    self._conn.execute(
+                        "UPDATE diagnostics SET last_seen = ?, occurrences = occurrences + 1 "
+                        "WHERE scope = ? AND fingerprint = ?", (now, scope, fingerprint))
+                else:
+                    event["baseline"] = seen[fingerprint] = "new"
+                    classification["new"].append(event)
+                    self._conn.execute(
+                        "INSERT INTO diagnostics (scope, fingerprint, file, function, type, message, first_seen, "
+                        "last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT(scope, fingerprint) DO UPDATE SET fixed_at = NULL, first_seen = excluded.first_seen, "
+                        "last_seen = excluded.last_seen, occurrences = 1",
+                        (scope, fingerprint, event.get("file"), event.get("function"), event.get("type"),
+                         event.get("message"), now, now))
+
+            # Known diagnostics that disappeared from files we've just rebuilt
+            for fingerprint, row in open_rows.items():
+                if fingerprint in seen:
+                    continue
+                if row.get("file") and os.path.normpath(os.path.join(base_path, row["file"])) in compiled_files:
+                    self._conn.execute("UPDATE diagnostics SET fixed_at = ? WHERE scope = ? AND fingerprint = ?",
+                                       (now, scope, fingerprint))
+                    classification["fixed"].append(row)
+                else:
+                    classification["unknown"].append(row)
+
+            self._conn.commit()
+
+        return classification
+
+    def get_open(self, scope: str) -> list[dict[str, Any]]:
+        """
+        Returns all the diagnostics currently known (not fixed) for a scope.
+        Args:
+            scope: Baseline scope, typically the build dot notation.
+        """
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(
+                "SELECT * FROM diagnostics WHERE scope = ? AND fixed_at IS NULL ORDER BY file, type", (scope,))]
+
+    def close(self) -> None:
+        """ Closes the database connection. """
+        with self._lock, suppress(sqlite3.Error):
+            self._conn.close()
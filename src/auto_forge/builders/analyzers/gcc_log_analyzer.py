@@ -9,52 +9,232 @@ Description:
     analysis to different build systems or compilers.
 """
 import asyncio
+import bisect
+import glob
 import json
+import os
 import re
+import shlex
+import shutil
+import subprocess
 import textwrap
 import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import suppress
+from dataclasses import asdict
 from pathlib import Path
 from typing import IO
 from typing import Union, Optional, Any
 
 # AutoForge imports
 from auto_forge import (AutoForgeModuleType, BuildLogAnalyzerInterface, PromptStatusType, BuildAnalyzedEventType,
-                        BuildAnalyzedContextType)
+                        BuildAnalyzedContextType, BuildDiagnosticsStore)
 
 # Third-party
+_TS_C_LANGUAGE = None
+with suppress(ImportError):
+    import tree_sitter_c as ts_c
+    from tree_sitter import Language, Parser
+
+    _TS_C_LANGUAGE = Language(ts_c.language())
 
 AUTO_FORGE_MODULE_NAME = "GCCLogAnalyzer"
 AUTO_FORGE_MODULE_DESCRIPTION = "GCC Output Analyzer"
+AUTO_FORGE_MAX_CACHED_SOURCES = 512  # Maximum number of source files kept by the source context cache
 
 
-# noinspection GrazieInspection
-class GCCLogAnalyzer(BuildLogAnalyzerInterface):
+class _SourceFileEntry:
     """
-    A utility class for analyzing GCC compilation output.
-    Can handle GCC outputs with or without Ninja/CMake wrappers.
+    A single cached source file: its lines and a sorted, non-overlapping index of function spans.
     """
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, lines: list[str], spans: list[tuple[int, int, str]], stamp: tuple[int, int]):
+        self.lines = lines
+        self.stamp = stamp  # (mtime_ns, size)
+        self.spans = spans  # (start_index, end_index, function_name), 0-based and inclusive
+        self.span_starts = [span[0] for span in spans]
+        self.snippets: dict[int, str] = {}  # Compressed function snippets, keyed by span start
 
-        self._last_error: Optional[str] = None
-        self._ai_context: str = (
-            "This is a structured diagnostic log from a C project. Each item includes:\n"
-            "- Source file, line, column, and diagnostic type\n"
-            "- The error/warning message (cleaned)\n"
-            "- List of source files that triggered it ('derived_files')\n"
-            "- Optional function name and code snippet for context\n"
-            "- Toolchain info (e.g., compiler/Ninja)\n"
-            "- Similar diagnostics across multiple files will be consolidated into a single entry with a list of derived sources.\n"
-            "- Suggest root causes and fixes as a developer would, including code edits.\n\n"
-        )
+    def find_span(self, line_index: int) -> Optional[tuple[int, int, str]]:
+        """
+        Bisect the function index for the span enclosing a 0-based line index.
+        Args:
+            line_index: 0-based line index.
+        Returns:
+            The enclosing (start, end, name) span, or None when the line is outside any function.
+        """
+        position = bisect.bisect_right(self.span_starts, line_index) - 1
+        if position >= 0:
+            span = self.spans[position]
+            if span[0] <= line_index <= span[1]:
+                return span
+        return None
 
-        self._module_info = self.sdk.registry.register_module(  # and these lines are handled by the user's setup
-            name=AUTO_FORGE_MODULE_NAME,
-            description=AUTO_FORGE_MODULE_DESCRIPTION,
-            auto_forge_module_type=AutoForgeModuleType.ANALYZER
-        )
+
+class _SourceContextCache:
+    """
+    Per-file cache used by the analyzer when extracting source context for diagnostics.
+    Files are keyed by path and invalidated by modification time and size, each entry holds the file lines and a
+    function-span index built once (Tree-sitter C grammar when available, a brace scanner otherwise).
+    Object-to-source path resolutions are cached as well.
+    """
+
+    def __init__(self, max_entries: int = AUTO_FORGE_MAX_CACHED_SOURCES):
+        self._max_entries = max_entries
+        self._files: OrderedDict[str, _SourceFileEntry] = OrderedDict()
+        self._objects: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._ts_parser = Parser(_TS_C_LANGUAGE) if _TS_C_LANGUAGE is not None else None
+        self._sig_pattern = re.compile(r'^\s*(\w[\w\s*]*?\**)\s+(\w+)\s*\([^)]*\)\s*(\{.*)?$')
+        # GNU style, where the return type sits alone on the previous line
+        self._bare_sig_pattern = re.compile(r'^(\w+)\s*\([^)]*\)\s*(\{.*)?$')
+        self._return_type_pattern = re.compile(r'^\s*\w[\w\s*]*$')
+
+    def _index_with_tree_sitter(self, source: bytes) -> list[tuple[int, int, str]]:
+        """ Collect function definition spans using the Tree-sitter C grammar. """
+        spans: list[tuple[int, int, str]] = []
+        tree = self._ts_parser.parse(source)
+        pending = [tree.root_node]
+
+        while pending:
+            node = pending.pop()
+            if node.type != "function_definition":
+                pending.extend(node.children)
+                continue
+
+            # Walk down the declarator chain (pointers, attributes..) to the function name
+            name = None
+            declarator = node.child_by_field_name("declarator")
+            while declarator is not None and name is None:
+                if declarator.type == "identifier":
+                    name = declarator.text.decode("utf-8", errors="ignore")
+                else:
+                    declarator = declarator.child_by_field_name("declarator")
+            spans.append((node.start_point[0], node.end_point[0], name or "<anonymous>"))
+
+        spans.sort()
+        return spans
+
+    def _index_with_braces(self, lines: list[str]) -> list[tuple[int, int, str]]:
+        """ Collect function spans with a single pass brace scanner, used when Tree-sitter is not available. """
+        spans: list[tuple[int, int, str]] = []
+        depth = 0
+        signature: Optional[tuple[int, str]] = None
+        span_start: Optional[tuple[int, str]] = None
+
+        for index, line in enumerate(lines):
+            if depth == 0:
+                match = self._sig_pattern.match(line)
+                bare_match = self._bare_sig_pattern.match(line) if match is None else None
+                if match:
+                    signature = (index, match.group(2))
+                elif bare_match and index > 0 and self._return_type_pattern.match(lines[index - 1]):
+                    signature = (index - 1, bare_match.group(1))
+                elif line.rstrip().endswith(";"):
+                    signature = None
+
+            opened = line.count("{")
+            if depth == 0 and opened and signature is not None:
+                span_start = signature
+            depth = max(0, depth + opened - line.count("}"))
+
+            if depth == 0 and span_start is not None and opened + line.count("}") > 0:
+                spans.append((span_start[0], index, span_start[1]))
+                span_start = None
+                signature = None
+
+        return spans
+
+    def get_source(self, file_path: Union[Path, str]) -> Optional[_SourceFileEntry]:
+        """
+        Get the cached entry for a source file, (re)building it when the file changed on disk.
+        Args:
+            file_path: Path to the source file.
+        Returns:
+            The cached entry, or None if the file could not be read.
+        """
+        key = str(file_path)
+        try:
+            stat = Path(file_path).stat()
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is not None and entry.stamp == stamp:
+                self._files.move_to_end(key)
+                return entry
+
+        try:
+            source = Path(file_path).read_bytes()
+        except OSError:
+            return None
+
+        lines = source.decode("utf-8", errors="ignore").splitlines()
+        spans: Optional[list[tuple[int, int, str]]] = None
+        if self._ts_parser is not None:
+            with suppress(Exception):
+                spans = self._index_with_tree_sitter(source)
+        if spans is None:
+            spans = self._index_with_braces(lines)
+
+        entry = _SourceFileEntry(lines=lines, spans=spans, stamp=stamp)
+        with self._lock:
+            self._files[key] = entry
+            self._files.move_to_end(key)
+            while len(self._files) > self._max_entries:
+                self._files.popitem(last=False)
+        return entry
+
+    def get_source_from_object(self, obj_path: str) -> str:
+        """
+        Heuristically converts an object file path to its likely source file path, caching the result.
+        Args:
+            obj_path: Object file path taken from a Ninja / Make 'FAILED:' line.
+        Returns:
+            str: The likely source file path.
+        """
+        resolved = self._objects.get(obj_path)
+        if resolved is not None:
+            return resolved
+
+        base = obj_path.rsplit('.', 1)[0]  # remove '.o'
+        resolved = f"{base}.c"  # fallback if nothing exists
+        # Add other known extensions if needed
+        for src in (f"{base}.c", f"{base}.cpp", f"{base}.cc", f"{base}.s", f"{base}.S"):
+            if Path(src).exists():
+                resolved = src
+                break
+
+        self._objects[obj_path] = resolved
+        return resolved
+
+    def clear(self) -> None:
+        """ Drop all cached entries. """
+        with self._lock:
+            self._files.clear()
+            self._objects.clear()
+
+
+class _GCCLineParser:
+    """
+    Stateful, line by line parser of GCC output (with or without Ninja/CMake wrappers).
+    It only extracts the diagnostics themselves and has no dependency on the SDK, so it could be used
+    from worker processes as well. Source context (function, snippet) is attached later by the analyzer.
+    """
+
+    def __init__(self, source_cache: Optional[_SourceContextCache] = None):
+        self._source_cache = source_cache if source_cache is not None else _SourceContextCache()
+        self._event: Optional[BuildAnalyzedEventType] = None
+        self._pending_function: Optional[str] = None
+        self._message_lines: list[str] = []
+        self._obj_path: Optional[str] = None
+        self.errors_count: int = 0
+        self.compiled_objects: set[str] = set()  # Objects built while parsing, as named by Ninja / Make
+        self.compiled_sources: set[str] = set()  # Sources of the compiler command lines seen while parsing
 
         # --- Regex patterns for parsing GCC logs ---
         # Main diagnostic line: file:line:column: type: message
@@ -77,6 +257,8 @@ class GCCLogAnalyzer(BuildLogAnalyzerInterface):
 
         # Build system chatter patterns to ignore
         self._build_prefix_re = re.compile(r'^\[\d+/\d+]\s+Building ')  # Ninja/Make building progress
+        self._building_object_re = re.compile(r'^\[\d+/\d+]\s+Building \w+ object (?P<obj_path>\S+?\.o(?:bj)?)$')
+        self._source_extensions = (".c", ".cc", ".cp", ".cpp", ".cxx", ".c++", ".s", ".S", ".sx")
         self._failed_line_re = re.compile(r'.*?\bFAILED:\s+(?P<obj_path>.+\.o)')  # Ninja/Make FAILED line
         self._compiler_invocation_re = re.compile(r'^\s*/.+gcc\b.*-c\s+')  # Compiler command line
         self._ninja_summary_re = re.compile(
@@ -93,6 +275,165 @@ class GCCLogAnalyzer(BuildLogAnalyzerInterface):
             r")"
         )
 
+    def flush(self) -> Optional[BuildAnalyzedEventType]:
+        """
+        Closes the currently open diagnostic event (if any).
+        Returns:
+            BuildAnalyzedEventType: The completed event, or None when no event was open.
+        """
+        event_info = self._event
+        if event_info is not None:
+            # Extract first line and strip type prefix like "warning:"
+            full_message = "\n".join(self._message_lines).strip().split('\n', 1)[0]
+            type_prefix = f"{event_info.type.lower()}:" if event_info.type else ""
+            if full_message.lower().startswith(type_prefix):
+                full_message = full_message[len(type_prefix):].strip()
+            event_info.message = full_message or None
+        self._event = None
+        self._message_lines = []
+        return event_info
+
+    def feed(self, line: str) -> Optional[BuildAnalyzedEventType]:
+        """
+        Parses a single line of output.
+        Args:
+            line: A single line of build output, stripped of ANSI sequences.
+        Returns:
+            BuildAnalyzedEventType: A diagnostic event which was completed by this line, None otherwise.
+        """
+        stripped_line = line.strip()
+
+        # Match FAILED line to capture the object file path
+        failed_match = self._failed_line_re.match(stripped_line)
+        if failed_match:
+            self._obj_path = failed_match.group('obj_path').strip()
+            return None
+
+        # Match diagnostic entry (file:line:col: warning|error|note: ...)
+        diag_match = self._diag_regex.match(stripped_line)
+        if diag_match:
+            completed = self.flush()  # Close previous event if open
+
+            # Create new structured diagnostic
+            event_info = BuildAnalyzedEventType()
+            event_info.file = diag_match.group('file').strip()
+            if self._obj_path:
+                derived = self._source_cache.get_source_from_object(self._obj_path)
+                event_info.derived_file = re.sub(r'\.(c|cpp|s|S)\.\1$', r'.\1', derived).strip()
+
+            event_info.line = int(diag_match.group('line'))
+            event_info.column = int(diag_match.group('column')) if diag_match.group('column') else None
+            event_info.type = diag_match.group('type').strip()
+            event_info.function = self._pending_function
+            self._pending_function = None
+
+            if event_info.type in ("error", "fatal error"):
+                self.errors_count += 1
+
+            # Extract and append message portion (e.g., "warning: something")
+            msg_index = stripped_line.find(f"{event_info.type}:")
+            message_text = stripped_line[msg_index:].strip() if msg_index != -1 else stripped_line
+            self._message_lines.append(message_text)
+            self._event = event_info
+            return completed
+
+        # Match "In function 'foo':"
+        func_match = self._function_regex.match(stripped_line)
+        if func_match:
+            self._pending_function = func_match.group('function').strip().rstrip(':')
+            return None
+
+        # Match build system lines (not part of diagnostics)
+        is_non_diagnostic_line = any((
+            self._build_prefix_re.match(stripped_line),
+            self._compiler_invocation_re.match(stripped_line),
+            self._ninja_summary_re.match(stripped_line),
+            "[ninja" in stripped_line.lower(),
+        ))
+
+        # Verbose builds (e.g. 'ninja -v') print the compiler command lines, which name the compiled source
+        if " -c " in stripped_line:
+            with suppress(ValueError):
+                arguments = shlex.split(stripped_line)
+                for index, argument in enumerate(arguments[:-1]):
+                    if argument == "-c" and arguments[index + 1].endswith(self._source_extensions):
+                        self.compiled_sources.add(arguments[index + 1])
+                        is_non_diagnostic_line = True
+
+        if is_non_diagnostic_line:
+            building_match = self._building_object_re.match(stripped_line)
+            if building_match:
+                self.compiled_objects.add(building_match.group('obj_path'))
+            return self.flush()
+
+        # Accumulate message body
+        if self._event is not None:
+            self._message_lines.append(stripped_line)
+        return None
+
+
+def _parse_log_worker(log_path: str) -> tuple[str, list[dict[str, Any]], Optional[str]]:
+    """
+    Process pool worker: parses a single log file into raw diagnostics (no source context).
+    Args:
+        log_path: Path to the log file.
+    Returns:
+        tuple: The log path, the list of diagnostics as dictionaries and an error message or None.
+    """
+    events: list[dict[str, Any]] = []
+    try:
+        parser = _GCCLineParser()
+        with open(log_path, 'r', encoding='utf-8', errors='ignore') as log_file:
+            for line in log_file:
+                event_info = parser.feed(line)
+                if event_info is not None:
+                    events.append(asdict(event_info))
+        event_info = parser.flush()
+        if event_info is not None:
+            events.append(asdict(event_info))
+        return log_path, events, None
+    except Exception as parse_error:
+        return log_path, events, str(parse_error)
+
+
+# noinspection GrazieInspection
+class GCCLogAnalyzer(BuildLogAnalyzerInterface):
+    """
+    A utility class for analyzing GCC compilation output.
+    Can handle GCC outputs with or without Ninja/CMake wrappers.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self._last_error: Optional[str] = None
+        self._source_cache = _SourceContextCache()
+        self._baseline_stores: dict[str, BuildDiagnosticsStore] = {}
+        self._last_classification: Optional[dict[str, list[dict[str, Any]]]] = None
+
+        # Incremental (streaming) parsing state, see 'start_stream()'
+        self._stream_active: bool = False
+        self._stream_context: Optional[BuildAnalyzedContextType] = None
+        self._stream_parser: Optional[_GCCLineParser] = None
+        self._stream_max_errors: int = 0
+
+        self._ai_context: str = (
+            "This is a structured diagnostic log from a C project. Each item includes:\n"
+            "- Source file, line, column, and diagnostic type\n"
+            "- The error/warning message (cleaned)\n"
+            "- List of source files that triggered it ('derived_files')\n"
+            "- Optional function name and code snippet for context\n"
+            "- Toolchain info (e.g., compiler/Ninja)\n"
+            "- Similar diagnostics across multiple files will be consolidated into a single entry with a list of derived sources.\n"
+            "- Suggest root causes and fixes as a developer would, including code edits.\n\n"
+        )
+
+        self._module_info = self.sdk.registry.register_module(  # and these lines are handled by the user's setup
+            name=AUTO_FORGE_MODULE_NAME,
+            description=AUTO_FORGE_MODULE_DESCRIPTION,
+            auto_forge_module_type=AutoForgeModuleType.ANALYZER
+        )
+
     @staticmethod
     def _compress_function_body(function_body: str) -> str:
         """
@@ -200,51 +541,39 @@ class GCCLogAnalyzer(BuildLogAnalyzerInterface):
         """
         Generates minimal, AI-optimized context from a source file.
         Returns function if line is inside one, otherwise a range of lines.
+        Source lines and function boundaries come from the per-file cache, so repeated diagnostics
+        in the same file cost a single bisect lookup.
         """
         path = Path(file_path)
-        if not path.exists() or path.suffix not in {".c", ".h", ".s"}:
+        if path.suffix not in {".c", ".h", ".s"}:
+            raise ValueError(f"Unsupported or missing file: {path}")
+
+        entry = self._source_cache.get_source(path)
+        if entry is None:
             raise ValueError(f"Unsupported or missing file: {path}")
 
-        lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
+        lines = entry.lines
         if not (1 <= line_number <= len(lines)):
-            raise ValueError(f"Line number {line_number} is out of bounds (1{len(lines)}).")
+            raise ValueError(f"Line number {line_number} is out of bounds (1{len(lines)}).")
 
         target_idx = line_number - 1
-        sig_pattern = re.compile(r'^\s*(\w[\w\s*]*?\**)\s+(\w+)\s*\([^)]*\)\s*(\{)?\s*$')
-
-        start = None
-        func_name = None
+        span = entry.find_span(target_idx)
 
-        # Search upward for function signature
-        for i in range(target_idx, -1, -1):
-            match = sig_pattern.match(lines[i])
-            if match:
-                start = i
-                func_name = match.group(2)
-                break
-
-        # If function start found, scan forward for closing brace
-        if start is not None:
-            brace_depth = 0
-            end = None
-            for i in range(start, len(lines)):
-                brace_depth += lines[i].count("{") - lines[i].count("}")
-                if brace_depth > 0 or (brace_depth == 0 and "{" not in "".join(lines[start:i])):
-                    continue
-                if brace_depth <= 0 and "{" in "".join(lines[start:i]):
-                    end = i
-                    break
-
-            # Confirm line falls inside function
-            if end is not None and start <= target_idx <= end:
+        # Line falls inside a function, its compressed body is computed once per span
+        if span is not None:
+            start, end, func_name = span
+            compressed_snippet = entry.snippets.get(start)
+            if compressed_snippet is None:
                 raw = lines[start:end + 1]
                 snippet = textwrap.dedent("\n".join(line.rstrip() for line in raw)).strip()
                 compressed_snippet = self._compress_function_body(snippet)
-                return BuildAnalyzedEventType(
-                    function=func_name,
-                    snippet=compressed_snippet,
-                    snippet_line=target_idx - start
-                )
+                entry.snippets[start] = compressed_snippet
+
+            return BuildAnalyzedEventType(
+                function=func_name,
+                snippet=compressed_snippet,
+                snippet_line=target_idx - start
+            )
 
         # Fallback range (outside any function)
         context_start = max(0, target_idx - lines_range)
@@ -260,14 +589,14 @@ class GCCLogAnalyzer(BuildLogAnalyzerInterface):
         )
 
     def _serialize(self, context_data: Union[list[dict[str, Any]], dict[str, Any]],
-                   output_path: Union[str, Path]) -> bool:
+                   output_path: Optional[Union[str, Path]]) -> bool:
         """
         Saves parsed diagnostic entries to a JSON file.
         Args:
             context_data: Either:
                 - a list of structured diagnostic dictionaries, or
                 - a dictionary containing additional metadata (e.g., {"toolchain": ..., "events": [...]})
-            output_path: Destination file path (str or Path).
+            output_path: Destination file path (str or Path), None to only render the JSON into 'context'.
         Returns:
             True if successfully written, False otherwise.
         """
@@ -338,9 +667,6 @@ class GCCLogAnalyzer(BuildLogAnalyzerInterface):
             return _events
 
         with suppress(Exception):
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
             # Clean 'None' entries
             cleaned = _remove_none_recursive(context_data)
 
@@ -362,12 +688,219 @@ class GCCLogAnalyzer(BuildLogAnalyzerInterface):
 
             self._last_error = json_str
 
-            with output_path.open("w", encoding="utf-8") as f:
-                f.write(json_str)
+            if output_path is not None:
+                output_path = Path(output_path)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with output_path.open("w", encoding="utf-8") as f:
+                    f.write(json_str)
 
             return True
         return False
 
+    def _add_stream_event(self, event_info: Optional[BuildAnalyzedEventType]) -> None:
+        """ Attach source context to a completed diagnostic and store it in the analyzed context. """
+        if event_info is None:
+            return
+
+        # A source we can't read should not cost us the diagnostic itself
+        try:
+            context = self._generate_error_context(file_path=event_info.file, line_number=event_info.line)
+            event_info.snippet = context.snippet
+            event_info.snippet_line = context.snippet_line
+            event_info.function = event_info.function if event_info.function else context.function
+        except ValueError as context_error:
+            self._logger.debug(f"No source context for '{event_info.file}:{event_info.line}': {context_error}")
+
+        self._stream_context.add_event(event_info)
+
+    def start_stream(self, context_file_name: Optional[str] = None,
+                     ai_response_file_name: Optional[str] = None,
+                     ai_auto_advise: Optional[bool] = False,
+                     toolchain: Optional[dict[str, Any]] = None,
+                     max_errors: int = 0,
+                     baseline_file_name: Optional[str] = None,
+                     baseline_scope: Optional[str] = None,
+                     build_path: Optional[str] = None) -> None:
+        """
+        Prepares the analyzer to parse GCC output incrementally, one line at a time, while the build is running.
+        Args:
+            context_file_name: Path to store structured diagnostics (JSON).
+            ai_response_file_name: Path for AI response Markdown (optional).
+            ai_auto_advise: Auto forward the error context to an AI
+            toolchain: The tool-chain dictionary used to during this build.
+            max_errors: Request the build to stop once this many errors were seen, 0 to never stop.
+            baseline_file_name: Optional diagnostics baseline database used to classify new / existing / fixed.
+            baseline_scope: Baseline scope, typically the build dot notation.
+            build_path: The build directory the compiler runs in, used to tell which files the build compiled.
+        """
+        self._logger.debug(f"Context will be stored in '{context_file_name}'")
+        self._last_error = None
+        self._last_classification = None
+
+        self._stream_context = BuildAnalyzedContextType(toolchain=toolchain)
+        self._stream_kwargs = dict(context_file_name=context_file_name, ai_response_file_name=ai_response_file_name,
+                                   ai_auto_advise=ai_auto_advise, baseline_file_name=baseline_file_name,
+                                   baseline_scope=baseline_scope, build_path=build_path)
+        self._stream_parser = _GCCLineParser(source_cache=self._source_cache)
+        self._stream_max_errors = max_errors if isinstance(max_errors, int) and max_errors > 0 else 0
+        self._stream_active = True
+
+        # Remove existing context file if present
+        if isinstance(context_file_name, str):
+            Path(context_file_name).unlink(missing_ok=True)
+
+    def feed(self, line: str) -> bool:
+        """
+        Parses a single line of GCC / Ninja output and updates the analyzed context.
+        Args:
+            line: A single line of build output, stripped of ANSI sequences.
+        Returns:
+            bool: False when the configured errors limit was reached and the build should stop, True otherwise.
+        """
+        if not self._stream_active:
+            return True
+
+        errors_count = self._stream_parser.errors_count
+        self._add_stream_event(self._stream_parser.feed(line))
+
+        # Check if this line crossed the configured errors limit
+        if (self._stream_max_errors and errors_count < self._stream_max_errors <=
+                self._stream_parser.errors_count):
+            self._logger.debug(f"Errors limit ({self._stream_max_errors}) reached, requesting early stop")
+            return False
+        return True
+
+    def end_stream(self, ai_auto_advise: Optional[bool] = None) -> Optional[list[dict]]:
+        """
+        Finalizes a streamed analysis: closes the last event, exports the diagnostics to JSON and optionally
+        triggers the background AI request.
+        Args:
+            ai_auto_advise: Optionally override the value given to 'start_stream'.
+        Returns:
+            List of structured diagnostic dictionaries, or None if no diagnostics found.
+        """
+        if not self._stream_active:
+            return None
+
+        self._stream_active = False
+        self._add_stream_event(self._stream_parser.flush())
+
+        context_file_name = self._stream_kwargs.get("context_file_name")
+        ai_response_file_name = self._stream_kwargs.get("ai_response_file_name")
+        if ai_auto_advise is None:
+            ai_auto_advise = self._stream_kwargs.get("ai_auto_advise")
+
+        analyzed_context = self._stream_context
+        baseline_file_name = self._stream_kwargs.get("baseline_file_name")
+        if analyzed_context.count == 0 and baseline_file_name is None:
+            return None
+
+        context_data = analyzed_context.export_data()
+        events = context_data.get("events") if isinstance(context_data, dict) else context_data
+        ai_prompt: Optional[str] = None
+
+        # Classify against the persistent baseline, only new diagnostics are worth an AI request.
+        # Done even for a clean build, which is how known diagnostics get marked as fixed.
+        if baseline_file_name is not None:
+            try:
+                build_path = self._stream_kwargs.get("build_path")
+                self._last_classification = self._get_baseline_store(baseline_file_name).classify(
+                    scope=self._stream_kwargs.get("baseline_scope") or "default", events=events,
+                    compiled_files=self._get_compiled_files(build_path=build_path), base_path=build_path)
+                new_events = self._last_classification["new"]
+                if new_events and ai_auto_advise and self._serialize(
+                        context_data=dict(context_data, events=new_events) if isinstance(context_data, dict)
+                        else new_events, output_path=None):
+                    ai_prompt = self._last_error
+            except Exception as baseline_error:
+                self._logger.warning(f"Diagnostics baseline unavailable: {baseline_error}")
+                self._last_classification = None
+
+        if analyzed_context.count == 0:
+            return None
+
+        # Export parsed diagnostics to JSON
+        if not self._serialize(context_data=context_data, output_path=context_file_name):
+            self._logger.error(
+                f"Could not serialize {analyzed_context.count} events into '{context_file_name}'")
+        if self._last_classification is None:
+            ai_prompt = self._last_error
+
+        # Trigger background AI analysis
+        if isinstance(ai_prompt, str) and ai_auto_advise:
+            self._logger.debug("Starting background AI request")
+            self._get_ai_response_background(
+                prompt=ai_prompt,
+                context=self._ai_context,
+                export_markdown_file=ai_response_file_name
+            )
+        elif ai_auto_advise:
+            self._logger.debug("No new diagnostics, AI request skipped")
+
+        return events
+
+    def _get_compiled_files(self, build_path: Optional[str]) -> set[str]:
+        """
+        Resolves the files compiled by the streamed build: the sources of the compiler command lines, and the sources
+        of the built objects along with the headers they included, from the Ninja deps log ('ninja -t deps') or
+        else from 'compile_commands.json'.
+        Args:
+            build_path: The build directory the compiler runs in, relative paths are resolved against it.
+        Returns:
+            set[str]: Normalized absolute paths.
+        """
+        base_path = build_path or os.getcwd()
+
+        def _resolve(_path: str, _directory: str = base_path) -> str:
+            return os.path.normpath(os.path.join(_directory, _path))
+
+        compiled_files = {_resolve(source) for source in self._stream_parser.compiled_sources}
+        objects = self._stream_parser.compiled_objects
+        if not objects or not build_path:
+            return compiled_files
+
+        # Ninja keeps the dependencies (source and headers) of every object it built
+        pending = set(objects)
+        ninja_binary = shutil.which("ninja")
+        if ninja_binary and os.path.isfile(os.path.join(build_path, ".ninja_deps")):
+            with suppress(OSError, subprocess.SubprocessError):
+                output = subprocess.run([ninja_binary, "-C", build_path, "-t", "deps", *sorted(objects)],
+                                        capture_output=True, text=True, timeout=60).stdout
+                current_object: Optional[str] = None
+                for line in output.splitlines():
+                    if line and not line[0].isspace():  # '<object>: #deps <n>, ...' or '<object>: deps not found'
+                        current_object = line.split(":", 1)[0] if "#deps" in line else None
+                        pending.discard(current_object)
+                    elif line.strip() and current_object is not None:
+                        compiled_files.add(_resolve(line.strip()))
+
+        # Otherwise, map the objects to their sources through the compilation database
+        if pending:
+            with suppress(OSError, ValueError, TypeError):
+                with open(os.path.join(build_path, "compile_commands.json"), encoding="utf-8") as database_file:
+                    database = json.load(database_file)
+                outputs = {_resolve(entry["output"], entry.get("directory", base_path)): _resolve(
+                    entry["file"], entry.get("directory", base_path)) for entry in database if "output" in entry}
+                compiled_files.update(outputs[output] for output in (_resolve(name) for name in pending)
+                                      if output in outputs)
+        return compiled_files
+
+    def _get_baseline_store(self, db_path: Union[str, Path]) -> BuildDiagnosticsStore:
+        """ Get (or open) the diagnostics baseline store for a database path. """
+        store = self._baseline_stores.get(str(db_path))
+        if store is None:
+            store = BuildDiagnosticsStore(db_path=db_path)
+            self._baseline_stores[str(db_path)] = store
+        return store
+
+    @property
+    def classification(self) -> Optional[dict[str, list[dict[str, Any]]]]:
+        """
+        Get the baseline classification ('new', 'existing', 'fixed' and 'unknown' lists) of the last streamed analysis,
+        or None when it was not classified against a baseline.
+        """
+        return self._last_classification
+
     def analyze(self, log_source: Optional[Union[Path, str]],
                 context_file_name: Optional[str] = None,
                 ai_response_file_name: Optional[str] = None,
@@ -381,6 +914,7 @@ class GCCLogAnalyzer(BuildLogAnalyzerInterface):
         type, function context, and a cleaned message string. It handles multi-line diagnostics
         (including caret and source lines), removes duplicated prefixes like "warning:", and
         associates diagnostics with detected function names where available.
+        This is a thin wrapper which feeds a complete log through 'start_stream' / 'feed' / 'end_stream'.
         Args:
             log_source: Path to a file or raw log string containing compiler output.
             context_file_name: Path to store structured diagnostics (JSON).
@@ -391,49 +925,10 @@ class GCCLogAnalyzer(BuildLogAnalyzerInterface):
         Returns:
             List of structured diagnostic dictionaries, or None if no diagnostics found.
         """
-        parsed_entries: Optional[list[dict]] = None
-        event_info: Optional[BuildAnalyzedEventType] = None
-        analyzed_context = BuildAnalyzedContextType(toolchain=toolchain)
-        pending_function: Optional[str] = None
-        current_message_lines = []
         log_lines_iterable: Union[IO, list[str]] = []
         log_source_name: str = ""
 
-        self._logger.debug(f"Context will be stored in '{context_file_name}'")
-        self._last_error = None
-
-        def guess_source_from_object(_obj_path: str) -> str:
-            """
-            Heuristically converts an object file path to its likely source file path.
-            """
-            base = _obj_path.rsplit('.', 1)[0]  # remove '.o'
-            candidates = [f"{base}.c", f"{base}.cpp", f"{base}.cc", f"{base}.s", f"{base}.S"]
-            # Add other known extensions if needed
-            for src in candidates:
-                if Path(src).exists():
-                    return src
-            # fallback if nothing exists
-            return f"{base}.c"
-
-        # Nested helper to finalize and store a diagnostic event
-        def _finalize_event():
-            nonlocal event_info, current_message_lines
-            if event_info is not None:
-                # Extract first line and strip type prefix like "warning:"
-                full_message = "\n".join(current_message_lines).strip().split('\n', 1)[0]
-                type_prefix = f"{event_info.type.lower()}:" if event_info.type else ""
-                if full_message.lower().startswith(type_prefix):
-                    full_message = full_message[len(type_prefix):].strip()
-                event_info.message = full_message or None
-                analyzed_context.add_event(event_info)
-                event_info = None
-                current_message_lines = []
-
         try:
-            # Remove existing context file if present
-            if isinstance(context_file_name, str):
-                Path(context_file_name).unlink(missing_ok=True)
-
             # Read input lines from file or string
             if isinstance(log_source, Path):
                 log_source_name = str(log_source)
@@ -446,93 +941,14 @@ class GCCLogAnalyzer(BuildLogAnalyzerInterface):
             else:
                 raise TypeError("log_source must be a Path or a string.")
 
-            obj_path: Optional[str] = None
+            self.start_stream(context_file_name=context_file_name, ai_response_file_name=ai_response_file_name,
+                              ai_auto_advise=ai_auto_advise, toolchain=toolchain)
 
             # Main parsing loop
             for line in log_lines_iterable:
-                stripped_line = line.strip()
-
-                # Match FAILED line to capture the object file path
-                failed_match = self._failed_line_re.match(stripped_line)
-                if failed_match:
-                    obj_path = failed_match.group('obj_path').strip()
-                    continue
-
-                # Match diagnostic entry (file:line:col: warning|error|note: ...)
-                diag_match = self._diag_regex.match(stripped_line)
-                if diag_match:
-                    _finalize_event()  # Close previous event if open
-
-                    # Extract components
-                    file_name = diag_match.group('file')
-                    line_number = int(diag_match.group('line'))
-
-                    # Create new structured diagnostic
-                    event_info = self._generate_error_context(file_path=file_name, line_number=line_number)
-                    event_info.file = file_name.strip()
-
-                    derived = guess_source_from_object(obj_path)
-                    event_info.derived_file = re.sub(r'\.(c|cpp|s|S)\.\1$', r'.\1', derived).strip()
-
-                    event_info.line = line_number
-                    event_info.column = int(diag_match.group('column')) if diag_match.group('column') else None
-                    event_info.type = diag_match.group('type').strip()
-                    event_info.function = pending_function if pending_function else event_info.function
-                    pending_function = None
-
-                    # Extract and append message portion (e.g., "warning: something")
-                    try:
-                        msg_index = stripped_line.find(f"{event_info.type}:")
-                        message_text = stripped_line[msg_index:].strip() if msg_index != -1 else stripped_line
-                    except Exception as e:
-                        self._logger.warning(f"Failed to clean diagnostic line: {e}")
-                        message_text = stripped_line
-
-                    current_message_lines.append(message_text)
-                    continue
-
-                # Match "In function 'foo':"
-                func_match = self._function_regex.match(stripped_line)
-                if func_match:
-                    pending_function = func_match.group('function').strip().rstrip(':')
-                    continue
-
-                # Match build system lines (not part of diagnostics)
-                is_non_diagnostic_line = any((
-                    self._build_prefix_re.match(stripped_line),
-                    self._compiler_invocation_re.match(stripped_line),
-                    self._ninja_summary_re.match(stripped_line),
-                    "[ninja" in stripped_line.lower(),
-                ))
-
-                if is_non_diagnostic_line:
-                    _finalize_event()
-                    continue
-
-                # Accumulate message body
-                if event_info is not None:
-                    current_message_lines.append(stripped_line)
-
-            # Finalize last diagnostic
-            _finalize_event()
-
-            # Export parsed diagnostics to JSON
-            if analyzed_context.count > 0 and context_file_name is not None:
-                context_data = analyzed_context.export_data()
-                if not self._serialize(context_data=context_data, output_path=context_file_name):
-                    self._logger.error(
-                        f"Could not serialize {analyzed_context.count} events into '{context_file_name}'")
-
-            # Trigger background AI analysis
-            if isinstance(self._last_error, str) and ai_auto_advise:
-                self._logger.debug("Starting background AI request")
-                self._get_ai_response_background(
-                    prompt=self._last_error,
-                    context=self._ai_context,
-                    export_markdown_file=ai_response_file_name
-                )
+                self.feed(line)
 
-            return parsed_entries if parsed_entries else None
+            return self.end_stream()
 
         except (FileNotFoundError, PermissionError) as file_error:
             raise file_error
@@ -540,9 +956,117 @@ class GCCLogAnalyzer(BuildLogAnalyzerInterface):
             raise IOError(
                 f"Unexpected error while processing log source '{log_source_name}': {exception}") from exception
         finally:
-            if isinstance(log_lines_iterable, IO):
+            self._stream_active = False
+            if hasattr(log_lines_iterable, "close"):
                 log_lines_iterable.close()
 
+    def analyze_batch(self, log_sources: Union[str, Path, list[Union[str, Path]]],
+                      report_file_name: Optional[Union[str, Path]] = None,
+                      pattern: str = "*.log",
+                      max_workers: Optional[int] = None) -> Optional[list[dict[str, Any]]]:
+        """
+        Analyzes many build logs at once (e.g. archived CI logs for several configurations) and produces a single
+        merged report. Logs are parsed in a process pool, source context is then resolved once per unique
+        diagnostic location and shared between all logs.
+        Args:
+            log_sources: A directory, glob pattern, log file or a list of those.
+            report_file_name: Optional path to store the merged report (JSON).
+            pattern: Glob pattern used when a directory is given.
+            max_workers: Maximum number of worker processes, defaults to the number of CPUs.
+        Returns:
+            List of merged diagnostics keyed by (file, line, type, message), each holding the list of
+            configurations (log names) it occurred in, or None if no diagnostics found.
+        """
+        sources = log_sources if isinstance(log_sources, list) else [log_sources]
+        log_files: list[str] = []
+
+        # Expand directories and glob patterns into a sorted, unique list of files
+        for source in sources:
+            source_path = Path(self.sdk.tool_box.get_expanded_path(str(source)))
+            if source_path.is_dir():
+                matches = [str(path) for path in source_path.rglob(pattern) if path.is_file()]
+            elif source_path.is_file():
+                matches = [str(source_path)]
+            else:
+                matches = [path for path in glob.glob(str(source_path), recursive=True) if Path(path).is_file()]
+            if not matches:
+                self._logger.warning(f"No logs found for '{source}'")
+            log_files.extend(matches)
+
+        log_files = sorted(set(log_files))
+        if not log_files:
+            raise FileNotFoundError(f"no log files found in {', '.join(str(source) for source in sources)}")
+
+        # Use the shortest unique name to identify each configuration
+        common_root = Path(os.path.commonpath(log_files)) if len(log_files) > 1 else Path(log_files[0]).parent
+        config_names = {log_file: str(Path(log_file).relative_to(common_root).with_suffix(""))
+                        for log_file in log_files}
+
+        # Parse logs, in parallel when it's worth it
+        parsed: list[tuple[str, list[dict[str, Any]], Optional[str]]] = []
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(log_files)))
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    parsed = list(executor.map(_parse_log_worker, log_files))
+            except (OSError, BrokenProcessPool) as pool_error:
+                self._logger.warning(f"Process pool unavailable, parsing sequentially: {pool_error}")
+                parsed = []
+        if not parsed:
+            parsed = [_parse_log_worker(log_file) for log_file in log_files]
+
+        # Merge by diagnostic core, collecting the configurations each one occurred in
+        merged: dict[tuple, dict[str, Any]] = {}
+        for log_file, events, parse_error in parsed:
+            if parse_error:
+                self._logger.warning(f"Could not fully parse '{log_file}': {parse_error}")
+            config_name = config_names[log_file]
+            for event in events:
+                key = (event.get("file"), event.get("line"), event.get("type"), event.get("message"))
+                entry = merged.get(key)
+                if entry is None:
+                    entry = dict(event)
+                    entry.pop("derived_file", None)
+                    entry["derived_files"] = []
+                    entry["occurrences"] = []
+                    merged[key] = entry
+                if event.get("derived_file") and event["derived_file"] not in entry["derived_files"]:
+                    entry["derived_files"].append(event["derived_file"])
+                if config_name not in entry["occurrences"]:
+                    entry["occurrences"].append(config_name)
+
+        if not merged:
+            return None
+
+        # Resolve source context once per unique location
+        contexts: dict[tuple, Optional[BuildAnalyzedEventType]] = {}
+        for entry in merged.values():
+            location = (entry.get("file"), entry.get("line"))
+            if location not in contexts:
+                try:
+                    contexts[location] = self._generate_error_context(file_path=location[0],
+                                                                      line_number=location[1])
+                except ValueError:
+                    contexts[location] = None
+            context = contexts[location]
+            if context is not None:
+                entry["snippet"] = context.snippet
+                entry["snippet_line"] = context.snippet_line
+                entry["function"] = entry.get("function") or context.function
+
+        report = sorted(merged.values(), key=lambda e: (-len(e["occurrences"]), e.get("file") or "",
+                                                        e.get("line") or 0))
+        self._logger.debug(f"Batch analysis of {len(log_files)} logs produced {len(report)} unique diagnostics")
+
+        if report_file_name is not None:
+            report_path = Path(report_file_name)
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_data = {"logs": [config_names[log_file] for log_file in log_files], "events": report}
+            with report_path.open("w", encoding="utf-8") as report_file:
+                json.dump(report_data, report_file, indent=4, ensure_ascii=False)
+
+        return report
+
     @property
     def context(self) -> Optional[str]:
         """Get the last context which was exported to JSON as string."""
@@ -11,8 +11,13 @@ Classes:
     - _CMakeToolChain: Validates and resolves required tools for Make-based tool-chains.
 """
 
+import hashlib
+import json
 import logging
+import os
+import re
 import time
+from contextlib import suppress
 from enum import Enum, auto
 from pathlib import Path
 from typing import Any
@@ -22,12 +27,17 @@ from typing import Optional
 from colorama import Fore, Style
 
 # AutoForge imports
-from auto_forge import (BuilderRunnerInterface, BuilderToolChain, BuildProfileType, CommandFailedException,
-                        BuilderArtifactsValidator, TerminalEchoType, GCCLogAnalyzer, CoreVariables)
+from auto_forge import (AutoForgeWorkModeType, BuilderRunnerInterface, BuilderToolChain, BuildProfileType,
+                        CommandFailedException, BuilderArtifactsValidator, BuildJobServer, CommandResultType,
+                        TerminalEchoType, GCCLogAnalyzer, CoreVariables, NinjaLogAnalytics, NinjaProgressEstimator)
 
 AUTO_FORGE_MODULE_NAME = "cmake"
 AUTO_FORGE_MODULE_DESCRIPTION = "CMake builder"
 AUTO_FORGE_MODULE_VERSION = "1.0"
+AUTO_FORGE_CONFIGURE_FINGERPRINT_FILE = ".autoforge_configure.json"
+
+# Environment variables which affect the outcome of a CMake configuration
+_CONFIGURE_ENVIRONMENT_KEYS = ("CC", "CXX", "ASM", "CFLAGS", "CXXFLAGS", "ASMFLAGS", "LDFLAGS", "PKG_CONFIG_PATH")
 
 
 class _CMakeBuildStep(Enum):
@@ -66,10 +76,17 @@ class CMakeBuilder(BuilderRunnerInterface):
         self._last_rendered_ai_response: Optional[str] = None
         self._state: _CMakeBuildStep = _CMakeBuildStep.PRE_CONFIGURE
         self._gcc_analyzer = GCCLogAnalyzer()
+        self._parallelism_summary: Optional[str] = None
+        self._compiler_cache_summary: Optional[str] = None
         self._variables: CoreVariables = CoreVariables.get_instance()
 
         super().__init__(build_system=AUTO_FORGE_MODULE_NAME)
 
+        # Persistent Ninja build history, kept alongside the diagnostics baseline
+        ninja_history_file: str = self._configuration.get("build_ninja_history_file", "build_ninja_history.json")
+        self._ninja_analytics: Optional[NinjaLogAnalytics] = NinjaLogAnalytics(
+            history_file=str(self.build_logs_path / ninja_history_file)) if self.build_logs_path else None
+
     @staticmethod
     def _is_cmake_configuration_command(cmd: list[str]) -> bool:
         """
@@ -89,6 +106,74 @@ class CMakeBuilder(BuilderRunnerInterface):
                 or any(arg.startswith("-D") for arg in cmd)
         )
 
+    @staticmethod
+    def _get_configure_inputs(build_path: Path) -> Optional[list[str]]:
+        """
+        Lists the files the last CMake configuration depends on, as recorded by the generator: the 'RERUN_CMAKE'
+        dependencies in 'build.ninja', or 'CMAKE_MAKEFILE_DEPENDS' in 'CMakeFiles/Makefile.cmake'.
+        Relative paths are relative to the build directory.
+        Args:
+            build_path (Path): The CMake build directory.
+        Returns:
+            Optional[list[str]]: The input files, None if the build directory was never configured.
+        """
+        with suppress(OSError):
+            content = (build_path / "build.ninja").read_text(encoding="utf-8", errors="replace")
+            content = content.replace("$\n", " ")  # Join continuation lines
+            for line in content.splitlines():
+                if line.startswith("build build.ninja") and "RERUN_CMAKE" in line:
+                    dependencies = line.split("RERUN_CMAKE", 1)[1].split("||", 1)[0].lstrip(" |")
+                    dependencies = dependencies.replace("$ ", "\0").replace("$:", ":").replace("$$", "$")
+                    return [item.replace("\0", " ") for item in dependencies.split()]
+
+        with suppress(OSError):
+            content = (build_path / "CMakeFiles" / "Makefile.cmake").read_text(encoding="utf-8", errors="replace")
+            match = re.search(r"set\(CMAKE_MAKEFILE_DEPENDS\s+(.*?)\)", content, re.DOTALL)
+            if match:
+                return re.findall(r'"([^"]+)"', match.group(1))
+        return None
+
+    def _get_configure_fingerprint(self, command_line: list[str], execute_from: Optional[Path], build_path: Path,
+                                   environment_data: Optional[dict[str, str]]) -> Optional[str]:
+        """
+        Computes the fingerprint of a CMake configuration: the configure command, the resolved toolchain binaries,
+        the relevant environment and the state of every file the configuration depends on.
+        Args:
+            command_line (list[str]): The configure command line.
+            execute_from (Optional[Path]): The configure working directory.
+            build_path (Path): The CMake build directory.
+            environment_data (Optional[dict[str, str]]): Extra environment passed to CMake.
+        Returns:
+            Optional[str]: The fingerprint, None if the build directory was never configured.
+        """
+        inputs = self._get_configure_inputs(build_path)
+        if inputs is None or not (build_path / "CMakeCache.txt").is_file():
+            return None
+
+        def _stamp(_path: str) -> Optional[list[int]]:
+            with suppress(OSError):
+                _stat = os.stat(_path)
+                return [_stat.st_size, _stat.st_mtime_ns]
+            return None
+
+        base_path = str(execute_from) if execute_from else os.getcwd()
+        environment = {key: value for key, value in os.environ.items()
+                       if key in _CONFIGURE_ENVIRONMENT_KEYS or key.startswith("CMAKE_")}
+        environment.update(environment_data or {})
+
+        payload = json.dumps({
+            "command": [str(argument) for argument in command_line],
+            "cwd": base_path,
+            "toolchain": {name: [os.path.realpath(path), _stamp(os.path.realpath(path))]
+                          for name, path in sorted(self._toolchain.tools.items())},
+            "environment": environment,
+            "inputs": {path: _stamp(os.path.join(build_path, path)) for path in inputs},
+            "presets": {name: _stamp(os.path.join(base_path, name))
+                        for name in ("CMakePresets.json", "CMakeUserPresets.json")},
+            "cache": _stamp(str(build_path / "CMakeCache.txt")),
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
     def _execute_build(  # noqa: C901
             self, build_profile: BuildProfileType) -> Optional[int]:
         """
@@ -193,26 +278,93 @@ class CMakeBuilder(BuilderRunnerInterface):
         command_line = [build_command, *merged_options]
         is_config_step = self._is_cmake_configuration_command(cmd=command_line)
 
-        # Execute CMake, note that pending on the compilation options this could be a single
-        # run or the first out of 2 when building with Ninja.
-        try:
-            # Update step and optionally handle extra arguments based on the current state
-            self._set_state(build_state=_CMakeBuildStep.PRE_CONFIGURE, extra_args=build_profile.extra_args,
+        # Outputs are about to be rewritten, let the previous build background steps finish reading them
+        self.wait_post_build_steps(build_profile=build_profile)
+
+        # A build of the very same configuration, toolchain and sources is restored from the artifacts cache
+        artifacts_cache, artifacts_cache_key = self.get_artifacts_cache(build_profile=build_profile,
+                                                                        toolchain=self._toolchain,
+                                                                        build_path=build_path)
+        force_build = any(arg in ("--clean", "--clean_build", "--reconfigure", "--no-artifacts-cache")
+                          for arg in (build_profile.extra_args or []))
+        if artifacts_cache is not None and not force_build and artifacts_cache.restore(key=artifacts_cache_key):
+            self.print_message(message=f"Artifacts of '{build_target_message}' restored from the artifacts cache",
+                               log_level=logging.INFO)
+            steps_data = config.get("post_build_steps", [])
+            if steps_data:
+                self._process_build_steps(steps=steps_data, is_pre=False)
+            BuilderArtifactsValidator(artifact_list=artifacts,
+                                      manifests_path=self._artifacts_manifests_path)
+            self._set_state(build_state=_CMakeBuildStep.DONE_BUILD, extra_args=build_profile.extra_args,
                             config=config)
-            self.print_message(message=f"Configuring in '{execute_from}'")
-            results = self.sdk.platform.execute_shell_command(command_and_args=command_line,
-                                                              echo_type=TerminalEchoType.LINE,
-                                                              cwd=str(execute_from),
-                                                              env=environment_data,
-                                                              apply_colorization=True,
-                                                              leading_text=build_profile.terminal_leading_text)
-        except CommandFailedException as execution_error:
-            results = execution_error.results
-            raise RuntimeError(
-                f"CMake execution error {results.message if results else 'unknown'}") from execution_error
-
-        # Validate CMake results
-        self.print_build_results(results=results, raise_exception=True)
+            self._variables.add(key="LAST_BUILD_CONFIGURATION", value=build_profile.config_name,
+                                update_if_exist=True)
+            self._variables.add(key="LAST_BUILD_PROJECT", value=build_profile.project_name, update_if_exist=True)
+            self._variables.add(key="LAST_BUILD_PATH", value=build_path, update_if_exist=True)
+            return 0
+
+        # Route compilations through the compiler launcher, unless the configuration already sets one
+        compiler_cache = self.get_compiler_cache(build_profile=build_profile)
+        if compiler_cache is not None:
+            environment_data = {**(environment_data or {}), **compiler_cache.environment}
+            if is_config_step and not any("_COMPILER_LAUNCHER=" in str(option) for option in command_line):
+                command_line += [f"-DCMAKE_{language}_COMPILER_LAUNCHER={compiler_cache.launcher}"
+                                 for language in ("C", "CXX")]
+            compiler_cache.begin()
+        elif is_config_step and not any("_COMPILER_LAUNCHER=" in str(option) for option in command_line):
+            # A launcher set by a previous configuration persists in the cache, drop it
+            command_line += [f"-UCMAKE_{language}_COMPILER_LAUNCHER" for language in ("C", "CXX")]
+
+        # A configuration followed by Ninja is skipped when none of its inputs changed since it last ran
+        fingerprint_file = build_path / AUTO_FORGE_CONFIGURE_FINGERPRINT_FILE
+        configure_fingerprint: Optional[str] = None
+        can_skip_configure = (is_config_step and ninja_build_command is not None and not any(
+            arg in ("--clean", "--clean_build", "--reconfigure") for arg in (build_profile.extra_args or [])))
+        if can_skip_configure:
+            configure_fingerprint = self._get_configure_fingerprint(command_line=command_line,
+                                                                    execute_from=execute_from, build_path=build_path,
+                                                                    environment_data=environment_data)
+        stored_fingerprint: Optional[str] = None
+        with suppress(OSError, ValueError):
+            stored_fingerprint = json.loads(fingerprint_file.read_text(encoding="utf-8")).get("fingerprint")
+
+        if configure_fingerprint is not None and configure_fingerprint == stored_fingerprint:
+            self.print_message(message="Configuration is up-to-date, skipping CMake")
+            results = CommandResultType(response="", return_code=0)
+        else:
+            fingerprint_file.unlink(missing_ok=True)
+
+            # Execute CMake, note that pending on the compilation options this could be a single
+            # run or the first out of 2 when building with Ninja.
+            try:
+                # Update step and optionally handle extra arguments based on the current state
+                self._set_state(build_state=_CMakeBuildStep.PRE_CONFIGURE, extra_args=build_profile.extra_args,
+                                config=config)
+                self.print_message(message=f"Configuring in '{execute_from}'")
+                results = self.sdk.platform.execute_shell_command(command_and_args=command_line,
+                                                                  echo_type=TerminalEchoType.LINE,
+                                                                  cwd=str(execute_from),
+                                                                  env=environment_data,
+                                                                  apply_colorization=True,
+                                                                  leading_text=build_profile.terminal_leading_text)
+            except CommandFailedException as execution_error:
+                results = execution_error.results
+                raise RuntimeError(
+                    f"CMake execution error {results.message if results else 'unknown'}") from execution_error
+
+            # Validate CMake results
+            self.print_build_results(results=results, raise_exception=True)
+
+            # Remember the configuration state, so an unchanged configuration would be skipped next time
+            if is_config_step and ninja_build_command is not None:
+                configure_fingerprint = self._get_configure_fingerprint(command_line=command_line,
+                                                                        execute_from=execute_from,
+                                                                        build_path=build_path,
+                                                                        environment_data=environment_data)
+                if configure_fingerprint is not None:
+                    with suppress(OSError):
+                        fingerprint_file.write_text(json.dumps({"fingerprint": configure_fingerprint}),
+                                                    encoding="utf-8")
 
         # Update step and optionally handle extra arguments based on the current state
         self._set_state(build_state=_CMakeBuildStep.PRE_BUILD, extra_args=build_profile.extra_args, config=config)
@@ -225,37 +377,81 @@ class CMakeBuilder(BuilderRunnerInterface):
                 self._set_state(build_state=_CMakeBuildStep.BUILD, extra_args=build_profile.extra_args, config=config)
 
                 ninja_verbose = self.sdk.build_shell.get_settable_param(name="ninja_verbose", default=False)
-                ninja_max_cores = self.sdk.build_shell.get_settable_param(name="ninja_max_cores", default=16)
+                ninja_max_cores = self.sdk.build_shell.get_settable_param(name="ninja_max_cores", default=0)
+                build_max_errors = self.sdk.build_shell.get_settable_param(name="build_max_errors", default=0)
+
+                # A parent multi-configuration build hands over its share of the jobs budget and a load limit,
+                # otherwise unless explicitly set, parallelism is derived from the CPUs and memory we could use.
+                ninja_max_load = os.environ.get(BuildJobServer.LOAD_ENV)
+                if os.environ.get(BuildJobServer.JOBS_ENV):
+                    ninja_max_cores = os.environ[BuildJobServer.JOBS_ENV]
+                    self._parallelism_summary = f"-j{ninja_max_cores} allocated by the parent build"
+                elif not ninja_max_cores or int(ninja_max_cores) <= 0:
+                    parallelism = self._build_resources.get_parallelism(scope=build_profile.build_dot_notation)
+                    ninja_max_cores = parallelism.jobs
+                    ninja_max_load = ninja_max_load or parallelism.load
+                    self._parallelism_summary = (f"-j{ninja_max_cores} -l{ninja_max_load}: "
+                                                 f"{', '.join(parallelism.reasons)}")
+                else:
+                    self._parallelism_summary = f"-j{ninja_max_cores} set by 'ninja_max_cores'"
 
                 # Construct Ninja command using optional settable parameters
                 ninja_cmd = f"{ninja_build_command} -j{ninja_max_cores} -C {build_path}"
+                if ninja_max_load:
+                    ninja_cmd += f" -l{ninja_max_load}"
                 if ninja_verbose:
                     ninja_cmd += " -v"
 
+                # Diagnostics are parsed while Ninja is running, so they are ready as soon as it exits
+                self._gcc_analyzer.start_stream(context_file_name=str(self._build_context_file),
+                                                ai_response_file_name=str(self._build_ai_response_file),
+                                                toolchain=self._toolchain.tools,
+                                                max_errors=build_max_errors,
+                                                baseline_file_name=str(self._build_diagnostics_db_file),
+                                                baseline_scope=build_profile.build_dot_notation,
+                                                build_path=str(build_path))
+
+                # Ninja '[n/m]' status lines are weighted by the durations of previous builds into a progress and ETA
+                progress_estimator = NinjaProgressEstimator(build_path=str(build_path))
+
+                self._build_resources.begin_measure()
                 results = self.sdk.platform.execute_shell_command(command_and_args=ninja_cmd,
                                                                   echo_type=TerminalEchoType.CLEAR_LINE,
                                                                   cwd=str(execute_from),
                                                                   env=environment_data,
                                                                   apply_colorization=True,
-                                                                  leading_text=build_profile.terminal_leading_text)
+                                                                  leading_text=build_profile.terminal_leading_text,
+                                                                  line_sink=self._gcc_analyzer.feed,
+                                                                  progress_parser=progress_estimator.feed)
             except CommandFailedException as execution_error:
                 results = execution_error.results
                 tool_error = True
 
             finally:
-                if None not in (results, results.response):
-                    if tool_error or "warning" in results.response:
-                        # Ninja build error - start GCC log analyzer
-                        if ai_auto_advise:
-                            self.print_message(
-                                message="🤖 AI request submitted in the background. You'll be notified once the response is ready.")
-                            self._gcc_analyzer.analyze(log_source=results.response,
-                                                       context_file_name=str(self._build_context_file),
-                                                       ai_response_file_name=str(self._build_ai_response_file),
-                                                       ai_auto_advise=ai_auto_advise,
-                                                       toolchain=self._toolchain.tools)
-                        else:
-                            self.print_message(message="🤖 AI Advise disabled.")
+                # Restore the shell title, which showed the build progress
+                if self.sdk.auto_forge.work_mode != AutoForgeWorkModeType.NON_INTERACTIVE_AUTOMATION:
+                    self._tool_box.set_terminal_title(f"AutoForge: {build_profile.solution_name}")
+
+                # Learn the peak memory of a single job, which bounds the parallelism of the next build
+                job_rss = self._build_resources.end_measure(scope=build_profile.build_dot_notation)
+                if job_rss is not None and self._parallelism_summary:
+                    self._parallelism_summary += f" (measured {job_rss / 2 ** 20:.0f} MiB per job)"
+
+                # Finalize the streamed analysis and forward it to the AI when enabled
+                events = self._gcc_analyzer.end_stream(ai_auto_advise=ai_auto_advise)
+                classification = self._gcc_analyzer.classification
+                if classification is not None:
+                    self._print_diagnostics_baseline(classification=classification,
+                                                     new_only="--new-warnings-only" in (build_profile.extra_args or []))
+
+                if events and (tool_error or any(event.get("type") == "warning" for event in events)):
+                    if ai_auto_advise and classification is not None and not classification["new"]:
+                        self.print_message(message="🤖 No new diagnostics, AI request skipped.")
+                    elif ai_auto_advise:
+                        self.print_message(
+                            message="🤖 AI request submitted in the background. You'll be notified once the response is ready.")
+                    else:
+                        self.print_message(message="🤖 AI Advise disabled.")
 
                 if tool_error:
                     raise RuntimeError(
@@ -264,26 +460,58 @@ class CMakeBuilder(BuilderRunnerInterface):
             # Echo Ninja build results
             self.print_build_results(results=results, raise_exception=True)
 
+            # Analyze the edges Ninja ran and compare against the previous builds
+            analytics_top = self.sdk.build_shell.get_settable_param(name="build_analytics_top", default=10)
+            if analytics_top and self._ninja_analytics is not None:
+                report = self._ninja_analytics.analyze(build_path=str(build_path),
+                                                       scope=build_profile.build_dot_notation,
+                                                       jobs=int(ninja_max_cores), top_count=int(analytics_top))
+                if report is not None:
+                    self._print_ninja_analytics(report=report, jobs=int(ninja_max_cores))
+
             # Update step and optionally handle extra arguments based on the current state
             self._set_state(build_state=_CMakeBuildStep.POST_BUILD, extra_args=build_profile.extra_args, config=config)
 
+        if compiler_cache is not None:
+            self._compiler_cache_summary = compiler_cache.end()
+
         # Process post build steps if specified
         steps_data: Optional[list[dict[str, Any]]] = config.get("post_build_steps", [])
         if steps_data:
             self._process_build_steps(steps=steps_data, is_pre=False)
 
-        # Validate / process artifacts
-        BuilderArtifactsValidator(artifact_list=artifacts)
-
+        # Validate / process artifacts, the build is usable from here on
+        artifacts_validator = BuilderArtifactsValidator(artifact_list=artifacts,
+                                                        manifests_path=self._artifacts_manifests_path)
+        for group_name, published in artifacts_validator.get_published_artifacts().items():
+            methods = ", ".join(f"{count} {method}" for method, count in published.items() if method != "bytes")
+            self.print_message(message=f"Artifacts '{group_name}' published: {methods} "
+                                       f"({self._tool_box.get_formatted_size(published['bytes'])} copied)")
         self.print_message(message=f"Building of '{build_target_message}' was successful", log_level=logging.INFO)
 
         # Update step and optionally handle extra arguments based on the current state
         self._set_state(build_state=_CMakeBuildStep.DONE_BUILD, extra_args=build_profile.extra_args, config=config)
 
-        # Libraries analysis
-        nm_command = self._toolchain.get_tool('nm')
-        self.analyze_library_exports(path=str(build_path), nm_tool_name=nm_command, max_libs=100,
-                                     json_report_path=str(self._build_duplicate_symbols_file))
+        # Keeping the artifacts for identical builds and the libraries analysis complete in the background
+        if artifacts_cache is not None:
+            resolved_artifacts = artifacts_validator.get_resolved_artifacts()
+            self.submit_post_build_step(
+                build_profile=build_profile, name="artifacts cache",
+                function=lambda: "stored" if artifacts_cache.store(key=artifacts_cache_key,
+                                                                   artifacts=resolved_artifacts) else "not stored")
+
+        json_report_path = str(self._build_duplicate_symbols_file)
+
+        def _analyze_exports() -> str:
+            _exports = self.analyze_library_exports(path=str(build_path), json_report_path=json_report_path,
+                                                    quiet=True)
+            _symbols = [symbol for symbols in _exports.values() for symbol in set(symbols)]
+            _duplicates = len(_symbols) - len(set(_symbols))
+            return (f"{len(_exports)} libraries, "
+                    f"{f'{_duplicates} duplicate symbols' if _duplicates else 'no duplicate symbols'}, "
+                    f"see '{os.path.basename(json_report_path)}'")
+
+        self.submit_post_build_step(build_profile=build_profile, name="exports analysis", function=_analyze_exports)
 
         # Update variables 'last build''
         self._variables.add(key="LAST_BUILD_CONFIGURATION", value=build_profile.config_name, update_if_exist=True)
@@ -292,6 +520,69 @@ class CMakeBuilder(BuilderRunnerInterface):
 
         return results.return_code
 
+    def _print_diagnostics_baseline(self, classification: dict[str, list[dict[str, Any]]],
+                                    new_only: bool = False) -> None:
+        """
+        Prints the build diagnostics classification against the persistent baseline.
+        Args:
+            classification: The 'new', 'existing', 'fixed' and 'unknown' lists produced by the analyzer.
+            new_only: List the new diagnostics one by one ('build --new-warnings-only').
+        """
+        new_events = classification.get("new", [])
+        self.print_message(message=f"Diagnostics: {Fore.LIGHTRED_EX if new_events else ''}"
+                                   f"{len(new_events)} new{Style.RESET_ALL}, "
+                                   f"{len(classification.get('existing', []))} existing, "
+                                   f"{len(classification.get('fixed', []))} fixed, "
+                                   f"{len(classification.get('unknown', []))} not rebuilt", log_level=logging.INFO)
+        if new_only:
+            for event in new_events:
+                location = f"{event.get('file')}:{event.get('line')}"
+                self.print_message(message=f"{Fore.YELLOW}{event.get('type')}{Style.RESET_ALL} {location}: "
+                                           f"{event.get('message')}", log_level=None)
+
+    def _print_ninja_analytics(self, report: dict[str, Any], jobs: int) -> None:
+        """
+        Prints the Ninja build analytics along with the trend against the previous build.
+        Args:
+            report: The analysis returned by 'NinjaLogAnalytics.analyze()'.
+            jobs: The jobs count Ninja ran with.
+        """
+
+        def _trend(_current: float, _previous: Optional[float]) -> str:
+            if not _previous:
+                return ""
+            _change = (_current - _previous) * 100 / _previous
+            _color = Fore.LIGHTRED_EX if _change > 5 else Fore.LIGHTGREEN_EX if _change < -5 else ""
+            return f" ({_color}{_change:+.1f}%{Style.RESET_ALL} vs. {_previous / 1000:.1f}s)"
+
+        previous = report.get("previous") or {}
+        utilization = f" ({report['utilization']:.0%} of -j{jobs})" if report.get("utilization") is not None else ""
+        self.print_message(message=f"Build analytics: {report['edges']} edges, "
+                                   f"wall time {report['wall_ms'] / 1000:.1f}s"
+                                   f"{_trend(report['wall_ms'], previous.get('wall_ms'))}, "
+                                   f"critical path {report['critical_path_ms'] / 1000:.1f}s"
+                                   f"{_trend(report['critical_path_ms'], previous.get('critical_path_ms'))}, "
+                                   f"average parallelism {report['average_parallelism']}{utilization}",
+                           log_level=logging.INFO)
+
+        # Parallelism over time as a bar per time slice, scaled to the jobs count
+        samples: list[float] = report.get("parallelism_over_time", [])
+        if samples:
+            bars = "▁▂▃▄▅▆▇█"
+            scale = max(jobs, *samples)
+            self.print_message(message="Parallelism over time: " + "".join(
+                bars[min(len(bars) - 1, int(sample * len(bars) / scale))] for sample in samples), log_level=None)
+
+        critical_path = sorted(report.get("critical_path", []), key=lambda _edge: _edge["ms"], reverse=True)
+        if critical_path:
+            self.print_message(message=f"Critical path ({len(critical_path)} edges), longest: " + ", ".join(
+                f"{os.path.basename(edge['output'])} {edge['ms'] / 1000:.1f}s" for edge in critical_path[:5]),
+                               log_level=None)
+
+        for unit in report.get("slowest_units", []):
+            self.print_message(message=f"  {unit['ms'] / 1000:7.1f}s{_trend(unit['ms'], unit.get('previous_ms'))}"
+                                       f"  {unit['output']}", log_level=None)
+
     def _set_state(self, build_state: _CMakeBuildStep,
                    extra_args: Optional[list[str]] = None,
                    config: Optional[dict[str, Any]] = None) -> int:
@@ -365,6 +656,8 @@ class CMakeBuilder(BuilderRunnerInterface):
         """
 
         build_start = 0
+        self._parallelism_summary = None
+        self._compiler_cache_summary = None
 
         def _normalize_message(_s: Optional[str]) -> Optional[str]:
             """ Make sure the error message is trimmed, capitalized and has dit at the end """
@@ -379,8 +672,15 @@ class CMakeBuilder(BuilderRunnerInterface):
             self.sdk.build_shell.add_settable_param(
                 name="ninja_verbose", default=False, doc="Enable verbose output when running Ninja builds")
             self.sdk.build_shell.add_settable_param(
-                name="ninja_max_cores", default=self.sdk.system_info.cpu_count,
-                doc="Maximum number of CPU cores Ninja is allowed to use")
+                name="ninja_max_cores", default=0,
+                doc="Maximum number of CPU cores Ninja is allowed to use, 0 to derive it from the available "
+                    "CPUs and memory")
+            self.sdk.build_shell.add_settable_param(
+                name="build_analytics_top", default=10,
+                doc="Number of slowest translation units listed by the build analytics, 0 to skip the analytics")
+            self.sdk.build_shell.add_settable_param(
+                name="build_max_errors", default=0,
+                doc="Stop the build once this many compiler errors were reported, 0 to never stop early")
 
             self._tool_box.set_cursor(visible=False)
             self._toolchain = BuilderToolChain(toolchain=build_profile.tool_chain_data, builder_instance=self)
@@ -412,4 +712,8 @@ class CMakeBuilder(BuilderRunnerInterface):
             if build_start > 0:
                 build_duration = time.perf_counter() - build_start
                 self.print_message(message=f"Build duration {build_duration:.2f} seconds")
+            if self._parallelism_summary:
+                self.print_message(message=f"Build parallelism {self._parallelism_summary}")
+            if self._compiler_cache_summary:
+                self.print_message(message=f"Compiler cache {self._compiler_cache_summary}")
             self._tool_box.set_cursor(visible=True)
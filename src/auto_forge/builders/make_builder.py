@@ -20,7 +20,8 @@ from typing import Optional
 from colorama import Fore, Style
 
 # AutoForge imports
-from auto_forge import (BuilderRunnerInterface, BuilderToolChain, BuildProfileType, CoreVariables, TerminalEchoType)
+from auto_forge import (BuilderRunnerInterface, BuilderToolChain, BuildJobServer, BuildProfileType, CoreVariables,
+                        TerminalEchoType)
 
 AUTO_FORGE_MODULE_NAME = "make"
 AUTO_FORGE_MODULE_DESCRIPTION = "make files builder"
@@ -44,6 +45,8 @@ class MakeBuilder(BuilderRunnerInterface):
                              Currently unused but accepted for interface compatibility.
         """
         self._toolchain: Optional[BuilderToolChain] = None
+        self._parallelism_summary: Optional[str] = None
+        self._compiler_cache_summary: Optional[str] = None
         self._variables: CoreVariables = CoreVariables.get_instance()
 
         super().__init__(build_system=AUTO_FORGE_MODULE_NAME)
@@ -120,12 +123,68 @@ class MakeBuilder(BuilderRunnerInterface):
         compiler_options = config["compiler_options"]
         artifacts = config["artifacts"]
 
+        # When running under a shared jobserver, a forced '-j' would make 'make' start its own private jobs pool.
+        # Otherwise, a parent multi-configuration build may hand over its share of the jobs budget.
+        jobs_allocation = os.environ.get(BuildJobServer.JOBS_ENV)
+        if BuildJobServer.is_client() or jobs_allocation:
+            filtered_options: list[str] = []
+            skip_jobs_count = False
+            for option in compiler_options:
+                if skip_jobs_count:
+                    skip_jobs_count = False
+                    if option.isdigit():
+                        continue
+                if option in ("-j", "--jobs"):
+                    skip_jobs_count = True  # The jobs count may follow as a separate argument
+                elif not option.startswith(("-j", "--jobs=")):
+                    filtered_options.append(option)
+            compiler_options = filtered_options
+            if not BuildJobServer.is_client():
+                compiler_options.append(f"-j{jobs_allocation}")
+                if os.environ.get(BuildJobServer.LOAD_ENV):
+                    compiler_options.append(f"-l{os.environ[BuildJobServer.LOAD_ENV]}")
+        elif not any(option.startswith(("-j", "--jobs")) for option in compiler_options):
+            # No explicit jobs count, derive it from the CPUs and memory we could use
+            parallelism = self._build_resources.get_parallelism(scope=build_profile.build_dot_notation)
+            compiler_options = [*compiler_options, f"-j{parallelism.jobs}", f"-l{parallelism.load}"]
+            self._parallelism_summary = f"-j{parallelism.jobs} -l{parallelism.load}: {', '.join(parallelism.reasons)}"
+
+        # Outputs are about to be rewritten, let the previous build background steps finish reading them
+        self.wait_post_build_steps(build_profile=build_profile)
+
+        # A build of the very same configuration, toolchain and sources is restored from the artifacts cache
+        artifacts_cache, artifacts_cache_key = self.get_artifacts_cache(build_profile=build_profile,
+                                                                        toolchain=self._toolchain,
+                                                                        build_path=build_path)
+        force_build = "--no-artifacts-cache" in (build_profile.extra_args or [])
+        if artifacts_cache is not None and not force_build and artifacts_cache.restore(key=artifacts_cache_key):
+            self.print_message(message=f"Artifacts of '{build_target_string}' restored from the artifacts cache",
+                               log_level=logging.INFO)
+            steps_data = config.get("post_build_steps", {})
+            if steps_data:
+                self._process_build_steps(steps=steps_data, is_pre=False)
+            self._variables.add(key="LAST_BUILD_CONFIGURATION", value=build_profile.config_name,
+                                update_if_exist=True)
+            self._variables.add(key="LAST_BUILD_PROJECT", value=build_profile.project_name, update_if_exist=True)
+            self._variables.add(key="LAST_BUILD_PATH", value=build_path, update_if_exist=True)
+            return 0
+
+        # Route compilations through the compiler launcher
+        compiler_cache = self.get_compiler_cache(build_profile=build_profile)
+        if compiler_cache is not None:
+            environment_data = {**(environment_data or {}), **compiler_cache.environment}
+            compiler_options, environment_data = self._apply_compiler_launcher(options=compiler_options,
+                                                                               environment=environment_data,
+                                                                               launcher=compiler_cache.launcher)
+            compiler_cache.begin()
+
         # Prepare the 'make' command line
         command_line = [build_command, *compiler_options]
 
         # Execute
         try:
             self.print_message(message=f"Executing build in '{execute_from}'")
+            self._build_resources.begin_measure()
             results = self.sdk.platform.execute_shell_command(command_and_args=command_line,
                                                               echo_type=TerminalEchoType.SINGLE_LINE,
                                                               cwd=str(execute_from),
@@ -136,6 +195,12 @@ class MakeBuilder(BuilderRunnerInterface):
         except Exception as execution_error:
             raise RuntimeError(f"build process failed to start: {execution_error}") from execution_error
 
+        finally:
+            # Learn the peak memory of a single job, which bounds the parallelism of the next build
+            job_rss = self._build_resources.end_measure(scope=build_profile.build_dot_notation)
+            if job_rss is not None and self._parallelism_summary:
+                self._parallelism_summary += f" (measured {job_rss / 2 ** 20:.0f} MiB per job)"
+
         # Validate expected return code
         if results.return_code != 0:
             self.print_message(message=f"Build failed with error: {results.return_code}", log_level=logging.ERROR)
@@ -144,6 +209,9 @@ class MakeBuilder(BuilderRunnerInterface):
 
             raise RuntimeError(f"build returned unexpected result code: {results.return_code}")
 
+        if compiler_cache is not None:
+            self._compiler_cache_summary = compiler_cache.end()
+
         # Process post build steps if specified
         steps_data: Optional[dict[str, str]] = config.get("post_build_steps", {})
         if steps_data:
@@ -164,6 +232,15 @@ class MakeBuilder(BuilderRunnerInterface):
         if missing_artifacts:
             raise ValueError("missing expected build artifacts:" + "\n".join(missing_artifacts))
 
+        # Keep the artifacts for identical builds, in the background
+        if artifacts_cache is not None:
+            resolved_artifacts = {"artifacts": [Path(artifact_path).expanduser().resolve()
+                                                for artifact_path in artifacts]}
+            self.submit_post_build_step(
+                build_profile=build_profile, name="artifacts cache",
+                function=lambda: "stored" if artifacts_cache.store(key=artifacts_cache_key,
+                                                                   artifacts=resolved_artifacts) else "not stored")
+
         # Update variables 'last build''
         self._variables.add(key="LAST_BUILD_CONFIGURATION", value=build_profile.config_name, update_if_exist=True)
         self._variables.add(key="LAST_BUILD_PROJECT", value=build_profile.project_name, update_if_exist=True)
@@ -172,6 +249,41 @@ class MakeBuilder(BuilderRunnerInterface):
         self.print_message(message=f"Building of '{build_target_string}' was successful", log_level=logging.INFO)
         return results.return_code
 
+    def _apply_compiler_launcher(self, options: list[str], environment: dict[str, str],
+                                 launcher: str) -> tuple[list[str], dict[str, str]]:
+        """
+        Prefixes the make 'CC' / 'CXX' variables with a compiler launcher. Variables set in the options are
+        prefixed in place. Otherwise, the launcher is passed through the 'CC' / 'CXX' environment variables, which
+        any assignment in the Makefile still overrides, rather than as command line variables that would override
+        the Makefile and propagate to recursive makes through 'MAKEFLAGS'.
+        Args:
+            options (list[str]): The make options.
+            environment (dict[str, str]): Environment variables of the build process.
+            launcher (str): Path to the compiler launcher.
+        Returns:
+            tuple[list[str], dict[str, str]]: The updated options and environment.
+        """
+
+        def _is_launched(_value: str) -> bool:
+            return os.path.basename(_value.split()[0] if _value.split() else "") == os.path.basename(launcher)
+
+        updated_options: list[str] = []
+        pending = {"CC": "gcc", "CXX": "g++"}
+        for option in options:
+            name, separator, value = option.partition("=")
+            if separator and name in pending:
+                pending.pop(name)
+                if not _is_launched(value):
+                    option = f"{name}={launcher} {value}"
+            updated_options.append(option)
+
+        updated_environment = dict(environment)
+        for name, tool_name in pending.items():
+            compiler = environment.get(name) or os.environ.get(name) or self._toolchain.get_tool(tool_name)
+            if compiler and not _is_launched(compiler):
+                updated_environment[name] = f"{launcher} {compiler}"
+        return updated_options, updated_environment
+
     def _process_build_steps(self, steps: dict[str, str], is_pre: bool = True) -> None:
         """
         Execute a dictionary of build steps where values prefixed with '!' are run as cmd2 shell commands.
@@ -206,6 +318,8 @@ class MakeBuilder(BuilderRunnerInterface):
         Returns:
             Optional[int]: The return code from the build process, or None if not applicable.
         """
+        self._parallelism_summary = None
+        self._compiler_cache_summary = None
         try:
 
             self._tool_box.set_cursor(visible=False)
@@ -222,4 +336,8 @@ class MakeBuilder(BuilderRunnerInterface):
             return 1
 
         finally:
+            if self._parallelism_summary:
+                self.print_message(message=f"Build parallelism {self._parallelism_summary}")
+            if self._compiler_cache_summary:
+                self.print_message(message=f"Compiler cache {self._compiler_cache_summary}")
             self._tool_box.set_cursor(visible=True)
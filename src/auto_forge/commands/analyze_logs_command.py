@@ -0,0 +1,102 @@
+"""
+Script:         analyze_logs_command.py
+Author:         AutoForge Team
+
+Description:
+    Batch analysis of archived build logs, typically collected by CI for many configurations.
+    Logs are parsed in parallel by the GCC log analyzer and merged into a single, de-duplicated
+    diagnostics report where each entry lists the configurations it occurred in.
+"""
+
+import argparse
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+# Third-party
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+# AutoForge imports
+from auto_forge import (CommandInterface, AutoForgCommandType, GCCLogAnalyzer)
+
+AUTO_FORGE_MODULE_NAME = "analyze_logs"
+AUTO_FORGE_MODULE_DESCRIPTION = "Batch build logs analyzer"
+AUTO_FORGE_MODULE_VERSION = "1.0"
+
+
+class AnalyzeLogsCommand(CommandInterface):
+    """
+    Analyzes a directory, glob pattern or list of build logs and produces a merged diagnostics report.
+    Example:
+        analyze_logs ci_logs/ -o nightly_report.json
+        analyze_logs "ci_logs/**/build_*.txt" --top 50
+    """
+
+    def __init__(self, **_kwargs: Any):
+        """
+        Initializes the AnalyzeLogsCommand class.
+        Args:
+            **_kwargs (Any): Optional keyword arguments.
+        """
+        self._console = Console(force_terminal=True)
+
+        # Base class initialization
+        super().__init__(command_name=AUTO_FORGE_MODULE_NAME, hidden=False, command_type=AutoForgCommandType.BUILD)
+
+    def _get_analyzer(self) -> GCCLogAnalyzer:
+        """ Reuse the analyzer instance owned by the builders when there is one, so its source cache is shared. """
+        analyzer: Optional[GCCLogAnalyzer] = self.sdk.registry.get_instance_by_class_name("GCCLogAnalyzer")
+        return analyzer if analyzer is not None else GCCLogAnalyzer()
+
+    def create_parser(self, parser: argparse.ArgumentParser) -> None:
+        """
+        Adds command-line arguments.
+        Args:
+            parser (argparse.ArgumentParser): The argument parser to extend.
+        """
+        parser.add_argument("sources", nargs="+", help="Log files, directories or glob patterns to analyze")
+        parser.add_argument("-p", "--pattern", type=str, default="*.log",
+                            help="Files pattern to use when a directory is given (default: *.log)")
+        parser.add_argument("-o", "--output", type=str, help="Path to store the merged JSON report")
+        parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                            help="Maximum number of worker processes (default: number of CPUs)")
+        parser.add_argument("--top", type=int, default=25, help="Number of diagnostics to display (default: 25)")
+
+    def run(self, args: argparse.Namespace) -> int:
+        """
+        Executes the 'analyze_logs' command based on parsed arguments.
+        Args:
+            args (argparse.Namespace): Parsed command-line arguments.
+        Returns:
+            int: 0 on success, non-zero on failure.
+        """
+        report_file: Optional[str] = self._tool_box.get_expanded_path(args.output) if args.output else None
+
+        try:
+            report = self._get_analyzer().analyze_batch(log_sources=args.sources, report_file_name=report_file,
+                                                        pattern=args.pattern, max_workers=args.jobs)
+        except Exception as analyze_error:
+            self._console.print(f"[red]Error:[/red] {analyze_error}")
+            return 1
+
+        if not report:
+            self._console.print("No diagnostics found.")
+            return 0
+
+        errors_count = sum(1 for entry in report if entry.get("type") in ("error", "fatal error"))
+        table = Table(title=f"{len(report)} unique diagnostics ({errors_count} errors)", box=box.ROUNDED)
+        table.add_column("Type", style="cyan", width=8)
+        table.add_column("Location", style="white", overflow="fold")
+        table.add_column("Message", style="bright_yellow", overflow="fold")
+        table.add_column("Configs", justify="right", style="magenta")
+
+        for entry in report[:args.top]:
+            location = f"{Path(entry.get('file', '')).name}:{entry.get('line')}"
+            table.add_row(entry.get("type"), location, entry.get("message") or "", str(len(entry["occurrences"])))
+
+        self._console.print('\n', table)
+        if report_file:
+            self._console.print(f"Report saved to '{report_file}'")
+        return 0
@@ -0,0 +1,276 @@
+"""
+Script:         artifacts_cache.py
+Author:         AutoForge Team
+
+Description:
+    Content addressed cache of whole build configurations outputs. An entry is keyed by the resolved build
+    configuration, the toolchain tools versions and the hash of the sources (a Git tree hash of the working copy,
+    or a manifest of the files content outside of Git, whose file digests are cached by their stat), and holds the
+    artifacts the configuration produced.
+    Paths under the workspace are stored relative to it, so an entry could be restored into other workspaces.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Optional
+
+AUTO_FORGE_MODULE_NAME = "ArtifactsCache"
+AUTO_FORGE_MODULE_DESCRIPTION = "Build artifacts cache"
+AUTO_FORGE_ARTIFACTS_MANIFEST = "manifest.json"
+AUTO_FORGE_ARTIFACTS_FILE_HASHES = "file_hashes.json"
+AUTO_FORGE_ARTIFACTS_CACHE_VERSION = 1
+
+_WORKSPACE_PLACEHOLDER = "$PROJ_WORKSPACE"
+
+
+class ArtifactsCache:
+    """
+    Directory of cached build outputs, one per cache key.
+    """
+
+    def __init__(self, cache_path: str, workspace_path: str, git_binary: str = "git"):
+        """
+        Args:
+            cache_path (str): Directory holding the cache entries, created on first use.
+            workspace_path (str): The workspace root, paths under it are stored relative to it.
+            git_binary (str): The git executable.
+        """
+        self._cache_path = os.path.abspath(os.path.expanduser(cache_path))
+        self._workspace_path = os.path.abspath(os.path.expanduser(workspace_path))
+        self._git_binary = git_binary
+        self._file_hashes: Optional[dict[str, list]] = None
+
+    def _to_portable(self, path: str) -> str:
+        """ Replaces the workspace root in a path with a placeholder. """
+        path = os.path.abspath(path)
+        if path == self._workspace_path or path.startswith(self._workspace_path + os.sep):
+            return _WORKSPACE_PLACEHOLDER + path[len(self._workspace_path):]
+        return path
+
+    def _from_portable(self, path: str) -> str:
+        """ Resolves a placeholder path against this workspace. """
+        if path.startswith(_WORKSPACE_PLACEHOLDER):
+            return self._workspace_path + path[len(_WORKSPACE_PLACEHOLDER):]
+        return path
+
+    def _run_git(self, arguments: list[str], cwd: str, env: Optional[dict[str, str]] = None) -> Optional[str]:
+        with suppress(OSError, subprocess.SubprocessError):
+            results = subprocess.run([self._git_binary, *arguments], cwd=cwd, capture_output=True, text=True,
+                                     env={**os.environ, **(env or {})}, timeout=300)
+            if results.returncode == 0:
+                return results.stdout.strip()
+        return None
+
+    def _get_git_tree_hash(self, source_path: str, exclude_paths: list[str]) -> Optional[str]:
+        """
+        Hashes a working copy directory, including uncommitted and untracked (not ignored) changes, by staging it
+        into a temporary copy of the index and writing the resulting tree. The repository index is never modified.
+        A tree only records the commit of a submodule, so the working copies of submodules are hashed recursively.
+        """
+        top_level = self._run_git(["rev-parse", "--show-toplevel"], cwd=source_path)
+        index_file = self._run_git(["rev-parse", "--path-format=absolute", "--git-path", "index"], cwd=source_path)
+        if not top_level or not index_file:
+            return None
+
+        top_level = os.path.realpath(top_level)
+        relative_path = os.path.relpath(os.path.realpath(source_path), top_level)
+        pathspec = [relative_path] + [f":(exclude){os.path.relpath(os.path.realpath(path), top_level)}"
+                                      for path in exclude_paths
+                                      if os.path.realpath(path).startswith(top_level + os.sep)]
+
+        with tempfile.TemporaryDirectory(prefix="af_artifacts_") as temp_path:
+            temp_index = os.path.join(temp_path, "index")
+            with suppress(OSError):
+                shutil.copy2(index_file, temp_index)  # Reuses the index stat information, so only changes are hashed
+            environment = {"GIT_INDEX_FILE": temp_index}
+            if self._run_git(["add", "--all", "--", *pathspec], cwd=top_level, env=environment) is None:
+                return None
+            tree = self._run_git(["write-tree"], cwd=top_level, env=environment)
+            entries = self._run_git(["ls-files", "--stage", "-z", "--", *pathspec], cwd=top_level, env=environment)
+        if not tree or entries is None:
+            return None
+        tree = tree if relative_path == "." else self._run_git(["rev-parse", f"{tree}:{relative_path}"],
+                                                               cwd=top_level)
+        if not tree:
+            return None
+
+        # Submodules (gitlink entries) which are checked out contribute their own working copy hash
+        submodule_hashes: list[str] = []
+        for entry in entries.split("\0"):
+            metadata, _, submodule_path = entry.partition("\t")
+            if not metadata.startswith("160000 ") or not submodule_path:
+                continue
+            submodule_path = os.path.join(top_level, submodule_path)
+            if not os.path.exists(os.path.join(submodule_path, ".git")):
+                continue  # Not initialized, the recorded commit is all there is
+            submodule_hash = self._get_git_tree_hash(submodule_path, exclude_paths)
+            if submodule_hash is None:
+                return None
+            submodule_hashes.append(f"{os.path.relpath(submodule_path, top_level)}:{submodule_hash}")
+
+        if not submodule_hashes:
+            return tree
+        return hashlib.sha256("\n".join([tree, *submodule_hashes]).encode("utf-8")).hexdigest()
+
+    def _hash_file(self, path: str) -> str:
+        """ sha256 of a file, reusing the cached digest when its size, modification time and inode did not change. """
+        if self._file_hashes is None:
+            self._file_hashes = {}
+            with suppress(OSError, ValueError):
+                with open(os.path.join(self._cache_path, AUTO_FORGE_ARTIFACTS_FILE_HASHES), encoding="utf-8") as cache:
+                    data = json.load(cache)
+                if isinstance(data, dict) and data.get("version") == AUTO_FORGE_ARTIFACTS_CACHE_VERSION:
+                    self._file_hashes = data.get("files", {})
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return ""
+        identity = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        cached = self._file_hashes.get(path)
+        if cached and cached[:3] == identity:
+            return cached[3]
+
+        digest = hashlib.sha256()
+        with suppress(OSError):
+            with open(path, "rb") as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        self._file_hashes[path] = [*identity, digest.hexdigest()]
+        return digest.hexdigest()
+
+    def _save_file_hashes(self) -> None:
+        """ Atomically writes the file digests cache, dropping the entries of files which no longer exist. """
+        if not self._file_hashes:
+            return
+        files = {path: entry for path, entry in self._file_hashes.items() if os.path.exists(path)}
+        cache_file = os.path.join(self._cache_path, AUTO_FORGE_ARTIFACTS_FILE_HASHES)
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self._cache_path, exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as cache:
+                json.dump({"version": AUTO_FORGE_ARTIFACTS_CACHE_VERSION, "files": files}, cache)
+            os.replace(temp_file, cache_file)
+        except OSError:
+            with suppress(OSError):
+                os.remove(temp_file)
+
+    def _get_manifest_hash(self, source_path: str, exclude_paths: list[str]) -> str:
+        """ Hashes the relative path and content of every file under a directory, skipping hidden directories. """
+        excluded = {os.path.realpath(path) for path in exclude_paths}
+        digest = hashlib.sha256()
+        for root, directories, files in os.walk(source_path):
+            directories[:] = sorted(name for name in directories if not name.startswith(".") and
+                                    os.path.realpath(os.path.join(root, name)) not in excluded)
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                digest.update(os.path.relpath(file_path, source_path).encode("utf-8") + b"\0")
+                digest.update(self._hash_file(os.path.abspath(file_path)).encode("utf-8") + b"\0")
+        return digest.hexdigest()
+
+    def get_source_hash(self, source_paths: list[str], exclude_paths: Optional[list[str]] = None) -> Optional[str]:
+        """
+        Hashes the sources of a build.
+        Args:
+            source_paths (list[str]): Source directories, Git working copies are hashed as Git trees.
+            exclude_paths (list[str], optional): Paths to leave out, e.g. a build directory inside the sources.
+        Returns:
+            Optional[str]: The sources hash, None if a source directory doesn't exist.
+        """
+        hashes: list[str] = []
+        for source_path in source_paths:
+            if not os.path.isdir(source_path):
+                return None
+            tree_hash = self._get_git_tree_hash(source_path, exclude_paths or [])
+            hashes.append(f"git:{tree_hash}" if tree_hash else
+                          f"files:{self._get_manifest_hash(source_path, exclude_paths or [])}")
+        self._save_file_hashes()
+        return hashlib.sha256("\n".join(hashes).encode("utf-8")).hexdigest()
+
+    def get_key(self, config: dict[str, Any], tools: dict[str, str], tool_versions: dict[str, Optional[str]],
+                source_hash: str) -> str:
+        """
+        Computes the cache key of a build.
+        Args:
+            config (dict[str, Any]): The resolved build configuration.
+            tools (dict[str, str]): The toolchain tools resolved paths.
+            tool_versions (dict[str, Optional[str]]): The toolchain tools probed versions.
+            source_hash (str): The sources hash, see 'get_source_hash()'.
+        Returns:
+            str: The cache key.
+        """
+        # Tools whose version was not probed are identified by their binary name and size
+        identities: dict[str, str] = {}
+        for name, path in sorted(tools.items()):
+            identities[name] = tool_versions.get(name) or os.path.basename(path)
+            if not tool_versions.get(name):
+                with suppress(OSError):
+                    identities[name] += f":{os.path.getsize(path)}"
+
+        # Workspace specific paths are made portable, so other workspaces compute the same key
+        config_text = json.dumps(config, sort_keys=True, default=str).replace(self._workspace_path,
+                                                                               _WORKSPACE_PLACEHOLDER)
+        payload = json.dumps({"version": AUTO_FORGE_ARTIFACTS_CACHE_VERSION, "config": config_text,
+                              "tools": identities, "sources": source_hash}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def has_entry(self, key: str) -> bool:
+        """ Checks if a complete entry exists for a key. """
+        return os.path.isfile(os.path.join(self._cache_path, key, AUTO_FORGE_ARTIFACTS_MANIFEST))
+
+    def store(self, key: str, artifacts: dict[str, list[Path]]) -> bool:
+        """
+        Stores the artifacts of a successful build, a concurrently stored entry wins.
+        Args:
+            key (str): The cache key.
+            artifacts (dict[str, list[Path]]): Artifact group name to files, as resolved by the artifacts validator.
+        Returns:
+            bool: True if an entry is available for the key.
+        """
+        entry_path = os.path.join(self._cache_path, key)
+        if self.has_entry(key):
+            return True
+        staging_path = f"{entry_path}.{os.getpid()}.tmp"
+        shutil.rmtree(staging_path, ignore_errors=True)
+        try:
+            os.makedirs(staging_path)
+            files: list[dict[str, str]] = []
+            for group_name, paths in artifacts.items():
+                for path in paths:
+                    stored_name = f"{len(files):05d}_{path.name}"
+                    shutil.copy2(path, os.path.join(staging_path, stored_name))
+                    files.append({"group": group_name, "stored": stored_name, "path": self._to_portable(str(path))})
+            with open(os.path.join(staging_path, AUTO_FORGE_ARTIFACTS_MANIFEST), "w", encoding="utf-8") as manifest:
+                json.dump({"version": AUTO_FORGE_ARTIFACTS_CACHE_VERSION, "files": files}, manifest, indent=2)
+            os.rename(staging_path, entry_path)
+        except OSError:
+            shutil.rmtree(staging_path, ignore_errors=True)
+        return self.has_entry(key)
+
+    def restore(self, key: str) -> Optional[int]:
+        """
+        Restores the artifacts of a cache entry to their locations in this workspace.
+        Args:
+            key (str): The cache key.
+        Returns:
+            Optional[int]: Number of restored files, None on a cache miss or a failed restore.
+        """
+        entry_path = os.path.join(self._cache_path, key)
+        try:
+            with open(os.path.join(entry_path, AUTO_FORGE_ARTIFACTS_MANIFEST), encoding="utf-8") as manifest:
+                files: list[dict[str, str]] = json.load(manifest).get("files", [])
+            for file in files:
+                destination = self._from_portable(file["path"])
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                shutil.copy2(os.path.join(entry_path, file["stored"]), destination)
+        except (OSError, ValueError, KeyError):
+            return None
+        with suppress(OSError):
+            os.utime(entry_path)  # Marks the entry as recently used
+        return len(files)
@@ -0,0 +1,192 @@
+"""
+Script:         artifacts_publisher.py
+Author:         AutoForge Team
+
+Description:
+    Publishes build artifacts to their destination directories. Files which didn't change since they were last
+    published (same size and modification time, and optionally the same content hash) are skipped, the rest are
+    cloned (reflink, 'FICLONE') or optionally hard-linked when the filesystem allows it, and otherwise copied in the
+    kernel ('copy_file_range' / 'sendfile'), concurrently. Every file is published atomically, through a temporary
+    file which is renamed over the destination. A manifest of what was published to every destination is kept
+    outside of it (typically under the build logs), so the destination only holds the published files.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Optional
+
+AUTO_FORGE_MODULE_NAME = "ArtifactsPublisher"
+AUTO_FORGE_MODULE_DESCRIPTION = "Build artifacts publisher"
+AUTO_FORGE_ARTIFACTS_PUBLISHED_VERSION = 2
+
+# Linux '_IOW(0x94, 9, int)', clones a whole file sharing its extents (Btrfs, XFS, bcachefs)
+_FICLONE = 0x40049409
+_COPY_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+class ArtifactsPublisher:
+    """
+    Incremental, concurrent copier of artifact files into a destination directory.
+    """
+
+    def __init__(self, destination: str, manifests_path: Optional[str] = None, hard_links: bool = False,
+                 verify_hash: bool = False, max_workers: Optional[int] = None):
+        """
+        Args:
+            destination (str): The destination directory, created if needed.
+            manifests_path (str, optional): Directory keeping the manifests of the published files, one per
+                destination. Without it no manifest is kept, and 'verify_hash' hashes the published files instead.
+            hard_links (bool): Hard-link files on the same filesystem. The published files then share their content
+                with the build outputs, so it only suits builds which replace (rather than rewrite) their outputs.
+            verify_hash (bool): Also compare the content hash of unchanged looking files before skipping them.
+            max_workers (int, optional): Maximum concurrent copies, defaults to the CPUs count (up to 8).
+        """
+        self._destination = Path(destination).expanduser().resolve()
+        self._hard_links = hard_links
+        self._verify_hash = verify_hash
+        self._max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self._manifest_file: Optional[Path] = None
+        if manifests_path:
+            destination_hash = hashlib.sha256(str(self._destination).encode("utf-8")).hexdigest()[:16]
+            self._manifest_file = \
+                Path(manifests_path).expanduser() / f"{self._destination.name}.{destination_hash}.json"
+
+    @staticmethod
+    def _get_hash(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load_manifest(self) -> dict[str, dict[str, Any]]:
+        if self._manifest_file is None:
+            return {}
+        with suppress(OSError, ValueError):
+            with open(self._manifest_file, encoding="utf-8") as manifest:
+                data = json.load(manifest)
+            if isinstance(data, dict) and data.get("version") == AUTO_FORGE_ARTIFACTS_PUBLISHED_VERSION and \
+                    data.get("destination") == str(self._destination):
+                return data.get("files", {})
+        return {}
+
+    @staticmethod
+    def _copy_content(source: Path, destination: Path) -> str:
+        """ Copies a file content, preferring a clone, then an in-kernel copy. Returns the method which was used. """
+        with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+            source_fd, destination_fd = source_file.fileno(), destination_file.fileno()
+            with suppress(OSError):
+                fcntl.ioctl(destination_fd, _FICLONE, source_fd)
+                return "reflink"
+
+            remaining = os.fstat(source_fd).st_size
+            method = "copy_file_range" if hasattr(os, "copy_file_range") else "sendfile"
+            while remaining > 0:
+                try:
+                    if method == "copy_file_range":
+                        copied = os.copy_file_range(source_fd, destination_fd, min(remaining, _COPY_CHUNK_SIZE))
+                    else:
+                        copied = os.sendfile(destination_fd, source_fd, None, min(remaining, _COPY_CHUNK_SIZE))
+                except OSError:
+                    if method == "copy_file_range":  # E.g. across filesystems on older kernels
+                        method = "sendfile"
+                        continue
+                    # Neither is supported here, fall back to a user space copy of whatever is left
+                    shutil.copyfileobj(source_file, destination_file, _COPY_CHUNK_SIZE)
+                    return "copy"
+                if copied == 0:
+                    break
+                remaining -= copied
+        return method
+
+    def _publish_file(self, source: Path, relative_name: str,
+                      previous: Optional[dict[str, Any]]) -> tuple[str, dict[str, Any]]:
+        """ Publishes a single file, returns the method used ('unchanged' when skipped) and its manifest entry. """
+        destination = self._destination / relative_name
+        source_stat = source.stat()
+        entry: dict[str, Any] = {"source": str(source), "size": source_stat.st_size,
+                                 "mtime_ns": source_stat.st_mtime_ns}
+        if self._verify_hash:
+            entry["sha256"] = self._get_hash(source)
+
+        # Unchanged files are left alone, copies keep the source modification time
+        with suppress(OSError):
+            destination_stat = destination.stat()
+            if (destination_stat.st_ino, destination_stat.st_dev) == (source_stat.st_ino, source_stat.st_dev) or (
+                    (destination_stat.st_size, destination_stat.st_mtime_ns) ==
+                    (source_stat.st_size, source_stat.st_mtime_ns) and
+                    (not self._verify_hash or
+                     ((previous or {}).get("sha256") or self._get_hash(destination)) == entry["sha256"])):
+                return "unchanged", {**entry, "method": (previous or {}).get("method", "unchanged")}
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+        with suppress(OSError):
+            temp_file.unlink()
+        try:
+            method = ""
+            if self._hard_links:
+                with suppress(OSError):
+                    os.link(source, temp_file)
+                    method = "hardlink"
+            if not method:
+                method = self._copy_content(source, temp_file)
+                shutil.copystat(source, temp_file)
+            os.replace(temp_file, destination)
+        except OSError:
+            with suppress(OSError):
+                temp_file.unlink()
+            raise
+        return method, {**entry, "method": method}
+
+    def publish(self, files: list[tuple[Path, str]], group_name: Optional[str] = None) -> dict[str, int]:
+        """
+        Publishes files into the destination directory and records them in its manifest, when one is kept.
+        Args:
+            files (list[tuple[Path, str]]): Source files along with their path relative to the destination.
+            group_name (str, optional): The artifact group the files belong to, recorded in the manifest.
+        Returns:
+            dict[str, int]: Number of files per publishing method ('unchanged', 'reflink', 'hardlink',
+                'copy_file_range', 'sendfile' or 'copy'), along with the 'bytes' which were copied.
+        """
+        self._destination.mkdir(parents=True, exist_ok=True)
+        manifest = self._load_manifest()
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self._max_workers, len(files))),
+                                thread_name_prefix="Publish") as executor:
+            results = list(executor.map(lambda _file: self._publish_file(_file[0], _file[1], manifest.get(_file[1])),
+                                        files))
+
+        summary: dict[str, int] = {"bytes": 0}
+        for (_source, relative_name), (method, entry) in zip(files, results):
+            summary[method] = summary.get(method, 0) + 1
+            published_time = int(time.time())
+            if method == "unchanged":
+                published_time = manifest.get(relative_name, {}).get("published", published_time)
+            elif method not in ("hardlink", "reflink"):
+                summary["bytes"] += entry["size"]  # Only actual copies move data
+            manifest[relative_name] = {**entry, "group": group_name, "published": published_time}
+
+        if self._manifest_file is None:
+            return summary
+
+        # Entries of files removed from the destination are dropped
+        manifest = {name: entry for name, entry in manifest.items() if (self._destination / name).exists()}
+        temp_file = f"{self._manifest_file}.{os.getpid()}.tmp"
+        try:
+            self._manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as manifest_file:
+                json.dump({"version": AUTO_FORGE_ARTIFACTS_PUBLISHED_VERSION, "destination": str(self._destination),
+                           "files": manifest}, manifest_file, indent=2)
+            os.replace(temp_file, self._manifest_file)
+        except OSError:
+            with suppress(OSError):
+                os.remove(temp_file)
+        return summary
@@ -0,0 +1,97 @@
+"""
+Script:         build_jobserver.py
+Author:         AutoForge Team
+
+Description:
+    GNU make compatible jobserver, used to share a single jobs budget between several concurrent builds.
+    Implements the named FIFO flavor ('--jobserver-auth=fifo:<path>', GNU make 4.4 and later, Ninja 1.13 and later)
+    which, unlike the file descriptors flavor, survives intermediate processes which don't inherit descriptors.
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from contextlib import suppress
+from typing import Any, Mapping, Optional
+
+AUTO_FORGE_MODULE_NAME = "BuildJobServer"
+AUTO_FORGE_MODULE_DESCRIPTION = "Build jobs token server"
+
+
+class BuildJobServer:
+    """
+    Owns the jobserver FIFO and its tokens for as long as it's open.
+    """
+
+    # Environment variables through which a parent process hands a jobs allocation to the builds it spawns
+    JOBS_ENV = "AF_BUILD_JOBS"
+    LOAD_ENV = "AF_BUILD_LOAD"
+
+    def __init__(self, jobs: int, clients: int = 1):
+        """
+        Creates the FIFO and loads it with tokens. Every client (top level make) implicitly owns a single job,
+        so only the remaining jobs are loaded as tokens.
+        Args:
+            jobs (int): The total jobs budget.
+            clients (int): Number of top level builds sharing the budget.
+        """
+        self._jobs = max(1, jobs)
+        self._temp_path = tempfile.mkdtemp(prefix="af_jobserver_")
+        self._fifo_path = os.path.join(self._temp_path, "fifo")
+        os.mkfifo(self._fifo_path, 0o600)
+
+        # Keep both ends open, so tokens are preserved even when no client holds the FIFO open
+        self._fd: Optional[int] = os.open(self._fifo_path, os.O_RDWR | os.O_NONBLOCK)
+        tokens = max(0, self._jobs - max(1, clients))
+        if tokens:
+            os.write(self._fd, b"+" * tokens)
+
+    @property
+    def jobs(self) -> int:
+        """ The total jobs budget. """
+        return self._jobs
+
+    @property
+    def environment(self) -> dict[str, str]:
+        """ Environment which makes child make (and Ninja) processes draw jobs from this server. """
+        return {"MAKEFLAGS": f" -j{self._jobs} --jobserver-auth=fifo:{self._fifo_path}"}
+
+    @staticmethod
+    def is_supported(make_binary: str = "make") -> bool:
+        """
+        Checks if the installed GNU make understands FIFO jobservers (4.4 and later), older versions abort when
+        pointed to one.
+        Args:
+            make_binary (str): The make executable.
+        """
+        with suppress(OSError, subprocess.SubprocessError):
+            output = subprocess.run([make_binary, "--version"], capture_output=True, text=True, timeout=10).stdout
+            match = re.search(r"GNU Make (\d+)\.(\d+)", output)
+            return bool(match) and (int(match.group(1)), int(match.group(2))) >= (4, 4)
+        return False
+
+    @staticmethod
+    def is_client(environment: Optional[Mapping[str, str]] = None) -> bool:
+        """
+        Checks if an environment points to a jobserver, in which case builds must not force their own '-j'.
+        Args:
+            environment (Mapping[str, str], optional): The environment to check, defaults to the process one.
+        """
+        environment = os.environ if environment is None else environment
+        return "--jobserver-auth=" in environment.get("MAKEFLAGS", "")
+
+    def close(self) -> None:
+        """ Releases the FIFO. """
+        if self._fd is not None:
+            with suppress(OSError):
+                os.close(self._fd)
+            self._fd = None
+        shutil.rmtree(self._temp_path, ignore_errors=True)
+
+    def __enter__(self) -> "BuildJobServer":
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        self.close()
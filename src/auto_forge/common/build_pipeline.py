@@ -0,0 +1,113 @@
+"""
+Script:         build_pipeline.py
+Author:         AutoForge Team
+
+Description:
+    Background pipeline for the post-build steps which are not needed to use the build outputs, such as libraries
+    exports analysis, reports and the artifacts cache. Steps run on a bounded worker pool so the prompt returns as
+    soon as a build is validated, their outcome is announced through a notification callback and kept in a short
+    history, which the 'build --status' command shows.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from typing import Any, Callable, Optional
+
+AUTO_FORGE_MODULE_NAME = "BuildPipeline"
+AUTO_FORGE_MODULE_DESCRIPTION = "Post-build background pipeline"
+
+
+class BuildPipeline:
+    """
+    Bounded worker pool running post-build steps, keyed by their build scope.
+    """
+
+    def __init__(self, max_workers: int = 2, history_size: int = 20,
+                 notify: Optional[Callable[[dict[str, Any]], None]] = None):
+        """
+        Args:
+            max_workers (int): Number of steps which may run concurrently.
+            history_size (int): Number of finished steps kept for status queries.
+            notify (Callable, optional): Called with the step record whenever a step finishes or fails.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="PostBuild")
+        self._notify = notify
+        self._lock = threading.Lock()
+        self._steps: deque[dict[str, Any]] = deque(maxlen=max(1, history_size))
+        self._pending: dict[int, tuple[dict[str, Any], Future]] = {}
+
+    def submit(self, scope: str, name: str, function: Callable[[], Optional[str]]) -> Future:
+        """
+        Queues a post-build step, a still queued step with the same scope and name is superseded by it.
+        Args:
+            scope (str): The build scope (e.g. 'project.configuration') the step belongs to.
+            name (str): Short step description, e.g. 'exports analysis'.
+            function (Callable[[], Optional[str]]): The step, returning an optional one line summary.
+        Returns:
+            Future: The step future.
+        """
+        step: dict[str, Any] = {"scope": scope, "name": name, "state": "queued", "submitted": time.time(),
+                                "started": None, "finished": None, "summary": None}
+
+        def _run() -> Optional[str]:
+            with self._lock:
+                step["state"], step["started"] = "running", time.time()
+            try:
+                summary = function()
+                state = "done"
+            except Exception as step_error:
+                summary, state = f"{type(step_error).__name__}: {step_error}", "failed"
+            with self._lock:
+                step["state"], step["finished"], step["summary"] = state, time.time(), summary
+                self._pending.pop(id(step), None)
+            if self._notify is not None:
+                with suppress(Exception):
+                    self._notify(dict(step))
+            return summary
+
+        with self._lock:
+            for step_id, (previous_step, previous_future) in list(self._pending.items()):
+                if (previous_step["scope"], previous_step["name"]) == (scope, name) and previous_future.cancel():
+                    previous_step["state"] = "superseded"
+                    del self._pending[step_id]
+            future = self._executor.submit(_run)
+            self._pending[id(step)] = (step, future)  # The step can't finish before the lock is released
+            self._steps.append(step)
+        return future
+
+    def wait(self, scope: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for the pending steps, e.g. before a build overwrites the outputs a step still reads.
+        Args:
+            scope (str, optional): Only wait for the steps of this build scope.
+            timeout (float, optional): Maximum seconds to wait.
+        Returns:
+            bool: True if no matching step is pending any longer.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._lock:
+            futures = [future for step, future in self._pending.values() if scope in (None, step["scope"])]
+        for future in futures:
+            remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            with suppress(Exception):
+                future.result(timeout=remaining)
+        return all(future.done() for future in futures)
+
+    def get_status(self, scope: Optional[str] = None) -> list[dict[str, Any]]:
+        """
+        Returns the recent steps, oldest first.
+        Args:
+            scope (str, optional): Only return the steps of this build scope.
+        Returns:
+            list[dict[str, Any]]: Step records with 'scope', 'name', 'state' ('queued', 'running', 'done', 'failed'
+                or 'superseded'), 'submitted', 'started' and 'finished' epoch times and the step 'summary'.
+        """
+        with self._lock:
+            return [dict(step) for step in self._steps if scope in (None, step["scope"])]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """ Stops accepting steps, by default after the pending ones finished. """
+        self._executor.shutdown(wait=wait)
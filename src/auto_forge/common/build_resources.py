@@ -0,0 +1,238 @@
+"""
+Script:         build_resources.py
+Author:         AutoForge Team
+
+Description:
+    Derives the default build parallelism from the resources actually available to this process: the cgroup v2
+    CPU quota, the CPU affinity mask and the available memory divided by the peak memory (RSS) of a single build
+    job. The per job RSS is learned from previous builds, by sampling the process tree of every build while it runs:
+    the build memory peak divided by the number of jobs (leaf processes) running at that moment.
+"""
+
+import json
+import math
+import os
+import threading
+from contextlib import suppress
+from typing import Optional
+
+from auto_forge import (BuildParallelismType)
+
+AUTO_FORGE_MODULE_NAME = "BuildResources"
+AUTO_FORGE_MODULE_DESCRIPTION = "Build parallelism resources"
+
+# Assumed peak memory of a single compile job until one was measured
+_DEFAULT_JOB_RSS_BYTES = 512 * 1024 * 1024
+_CGROUP_ROOT = "/sys/fs/cgroup"
+_SAMPLE_INTERVAL = 0.25
+
+
+class BuildResources:
+    """
+    Host resources probe along with the learned per job memory profile of every build scope.
+    """
+
+    def __init__(self, profile_file: Optional[str] = None):
+        """
+        Args:
+            profile_file (str, optional): JSON file keeping the learned peak RSS per build scope.
+        """
+        self._profile_file = profile_file
+        self._profiles: dict[str, dict] = {}
+        self._sampler: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
+        self._peak: tuple[int, int] = (0, 0)  # Build total RSS and running jobs, at the largest total seen
+
+        if self._profile_file:
+            with suppress(OSError, ValueError):
+                with open(self._profile_file, encoding="utf-8") as profile:
+                    data = json.load(profile)
+                if isinstance(data, dict):
+                    self._profiles = data
+
+    @staticmethod
+    def _get_cgroup_paths() -> list[str]:
+        """ Returns the cgroup v2 directories of this process, from its own group up to the root. """
+        cgroup_paths: list[str] = []
+        with suppress(OSError):
+            with open("/proc/self/cgroup", encoding="utf-8") as cgroup:
+                for line in cgroup:
+                    if line.startswith("0::"):
+                        relative_path = line[3:].strip().strip("/")
+                        while True:
+                            cgroup_path = os.path.join(_CGROUP_ROOT, relative_path) if relative_path else _CGROUP_ROOT
+                            if os.path.isdir(cgroup_path):
+                                cgroup_paths.append(cgroup_path)
+                            if not relative_path:
+                                break
+                            relative_path = os.path.dirname(relative_path)
+        return cgroup_paths or ([_CGROUP_ROOT] if os.path.isdir(_CGROUP_ROOT) else [])
+
+    @staticmethod
+    def _read_cgroup_value(cgroup_path: str, name: str) -> Optional[str]:
+        with suppress(OSError):
+            with open(os.path.join(cgroup_path, name), encoding="utf-8") as value:
+                return value.read().strip()
+        return None
+
+    @classmethod
+    def get_cpu_quota(cls) -> Optional[int]:
+        """
+        Returns the CPUs allowed by the tightest cgroup v2 'cpu.max' quota, None when unlimited.
+        """
+        quota_cpus: Optional[int] = None
+        for cgroup_path in cls._get_cgroup_paths():
+            cpu_max = cls._read_cgroup_value(cgroup_path, "cpu.max")
+            with suppress(ValueError, AttributeError):
+                quota, period = cpu_max.split()
+                if quota != "max" and int(period) > 0:
+                    cpus = max(1, math.ceil(int(quota) / int(period)))
+                    quota_cpus = cpus if quota_cpus is None else min(quota_cpus, cpus)
+        return quota_cpus
+
+    @staticmethod
+    def get_cpu_affinity() -> int:
+        """ Returns the number of CPUs this process may run on. """
+        if hasattr(os, "sched_getaffinity"):
+            return len(os.sched_getaffinity(0))
+        return os.cpu_count() or 1
+
+    @classmethod
+    def get_available_memory(cls) -> Optional[int]:
+        """
+        Returns the memory in bytes which could be used without swapping, the lower of the system 'MemAvailable'
+        and the headroom left by any cgroup 'memory.max' limit. None if it could not be determined.
+        """
+        available: Optional[int] = None
+        with suppress(OSError, ValueError):
+            with open("/proc/meminfo", encoding="utf-8") as meminfo:
+                for line in meminfo:
+                    if line.startswith("MemAvailable:"):
+                        available = int(line.split()[1]) * 1024
+                        break
+
+        for cgroup_path in cls._get_cgroup_paths():
+            memory_max = cls._read_cgroup_value(cgroup_path, "memory.max")
+            memory_current = cls._read_cgroup_value(cgroup_path, "memory.current")
+            with suppress(ValueError, TypeError):
+                if memory_max != "max":
+                    headroom = max(0, int(memory_max) - int(memory_current or 0))
+                    available = headroom if available is None else min(available, headroom)
+        return available
+
+    def get_job_rss(self, scope: Optional[str]) -> Optional[int]:
+        """ Returns the learned peak RSS in bytes of a single job of a build scope, None if never measured. """
+        profile = self._profiles.get(scope or "", {})
+        job_rss = profile.get("job_rss")
+        return job_rss if isinstance(job_rss, int) and job_rss > 0 else None
+
+    def get_parallelism(self, scope: Optional[str] = None) -> BuildParallelismType:
+        """
+        Computes the default parallelism of a build.
+        Args:
+            scope (str, optional): The build scope (e.g. 'project.configuration') whose learned job RSS to use.
+        Returns:
+            BuildParallelismType: Jobs count, load limit and the reasoning behind them.
+        """
+        reasons: list[str] = []
+        cpu_limit = self.get_cpu_affinity()
+        reasons.append(f"{cpu_limit} CPUs in affinity mask")
+
+        cpu_quota = self.get_cpu_quota()
+        if cpu_quota is not None:
+            reasons.append(f"cgroup CPU quota {cpu_quota}")
+            cpu_limit = min(cpu_limit, cpu_quota)
+
+        jobs = cpu_limit
+        available = self.get_available_memory()
+        if available is not None:
+            job_rss = self.get_job_rss(scope)
+            measured = job_rss is not None
+            job_rss = job_rss or _DEFAULT_JOB_RSS_BYTES
+            memory_jobs = max(1, available // job_rss)
+            reasons.append(f"{available / 2 ** 30:.1f} GiB available / {job_rss / 2 ** 20:.0f} MiB per job "
+                           f"({'learned' if measured else 'assumed'}) = {memory_jobs}")
+            jobs = min(jobs, memory_jobs)
+
+        return BuildParallelismType(jobs=max(1, jobs), load=max(1, cpu_limit), reasons=reasons)
+
+    @staticmethod
+    def _read_processes() -> dict[int, tuple[int, int]]:
+        """ Returns the parent pid and RSS in bytes of every process. """
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        processes: dict[int, tuple[int, int]] = {}
+        with suppress(OSError):
+            for entry in os.scandir("/proc"):
+                if not entry.name.isdigit():
+                    continue
+                with suppress(OSError, ValueError, IndexError):
+                    with open(f"/proc/{entry.name}/stat", "rb") as stat:
+                        # Fields after the command name, which may contain spaces: state, ppid, ..., rss (24th)
+                        fields = stat.read().rsplit(b")", 1)[1].split()
+                    processes[int(entry.name)] = (int(fields[1]), int(fields[21]) * page_size)
+        return processes
+
+    def _sample(self, excluded: set[int]) -> None:
+        """ Samples the process tree spawned by this process until stopped, keeping its memory peak. """
+        root_pid = os.getpid()
+        while not self._sampler_stop.wait(_SAMPLE_INTERVAL):
+            processes = self._read_processes()
+            children: dict[int, list[int]] = {}
+            for pid, (parent_pid, _rss) in processes.items():
+                children.setdefault(parent_pid, []).append(pid)
+
+            # Processes which were already running before the build started are not part of it
+            build_pids: list[int] = []
+            pending = [pid for pid in children.get(root_pid, []) if pid not in excluded]
+            while pending:
+                pid = pending.pop()
+                build_pids.append(pid)
+                pending.extend(children.get(pid, []))
+            if not build_pids:
+                continue
+
+            total_rss = sum(processes[pid][1] for pid in build_pids)
+            jobs = sum(1 for pid in build_pids if pid not in children)
+            if total_rss > self._peak[0]:
+                self._peak = (total_rss, max(1, jobs))
+
+    def begin_measure(self) -> None:
+        """ Marks the start of a build, whose processes are sampled until 'end_measure()'. """
+        self.end_measure(scope=None, learn=False)
+        excluded = {pid for pid, (parent_pid, _rss) in self._read_processes().items() if parent_pid == os.getpid()}
+        self._peak = (0, 0)
+        self._sampler_stop.clear()
+        self._sampler = threading.Thread(target=self._sample, args=(excluded,), name="BuildResources", daemon=True)
+        self._sampler.start()
+
+    def end_measure(self, scope: Optional[str], learn: bool = True) -> Optional[int]:
+        """
+        Learns the RSS of a single job of the build measured since 'begin_measure()' and persists it: the build
+        memory peak divided by the number of jobs which were running at that moment.
+        Args:
+            scope (str, optional): The build scope to record the measurement under.
+            learn (bool): Record the measurement, otherwise the sampling is only stopped.
+        Returns:
+            Optional[int]: The measured job RSS in bytes, None if the build was too short to be sampled.
+        """
+        if self._sampler is None:
+            return None
+        self._sampler_stop.set()
+        self._sampler.join()
+        self._sampler = None
+        total_rss, jobs = self._peak
+        if not learn or not total_rss:
+            return None
+
+        job_rss = total_rss // jobs
+        self._profiles[scope or ""] = {"job_rss": job_rss}
+        if self._profile_file:
+            temp_file = f"{self._profile_file}.{os.getpid()}.tmp"
+            try:
+                with open(temp_file, "w", encoding="utf-8") as profile:
+                    json.dump(self._profiles, profile, indent=2)
+                os.replace(temp_file, self._profile_file)
+            except OSError:
+                with suppress(OSError):
+                    os.remove(temp_file)
+        return job_rss
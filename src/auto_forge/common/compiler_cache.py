@@ -0,0 +1,179 @@
+"""
+Script:         compiler_cache.py
+Author:         AutoForge Team
+
+Description:
+    Compiler launcher (ccache / sccache) integration. Resolves the launcher, provides the environment which points it
+    to a dedicated cache directory with a size limit, and compares the launcher statistics taken before and after a
+    build to report its hit rate. The time saved is estimated from the CPU time a cache miss cost in earlier builds,
+    measured through the resource usage of waited child processes.
+"""
+
+import json
+import os
+import re
+import resource
+import shutil
+import subprocess
+from contextlib import suppress
+from typing import Optional
+
+AUTO_FORGE_MODULE_NAME = "CompilerCache"
+AUTO_FORGE_MODULE_DESCRIPTION = "Compiler launcher integration"
+AUTO_FORGE_COMPILER_CACHE_PROFILE = "autoforge_profile.json"
+
+# Launchers looked up on the PATH, in order of preference
+_KNOWN_LAUNCHERS = ("ccache", "sccache")
+
+
+class CompilerCache:
+    """
+    A compiler launcher bound to a cache directory.
+    """
+
+    def __init__(self, launcher: str, cache_path: str, max_size: Optional[str] = None):
+        """
+        Args:
+            launcher (str): Path to the launcher executable.
+            cache_path (str): The cache directory, created on first use.
+            max_size (str, optional): The cache size limit, e.g. '5G'.
+        """
+        self._launcher = launcher
+        self._cache_path = os.path.abspath(os.path.expanduser(cache_path))
+        self._max_size = max_size
+        self._is_sccache = "sccache" in os.path.basename(launcher)
+        self._baseline: Optional[tuple[int, int, float]] = None
+
+    @classmethod
+    def find(cls, cache_path: str, max_size: Optional[str] = None,
+             launcher: Optional[str] = "auto") -> Optional["CompilerCache"]:
+        """
+        Resolves a compiler launcher.
+        Args:
+            cache_path (str): The cache directory.
+            max_size (str, optional): The cache size limit, e.g. '5G'.
+            launcher (str, optional): 'auto' to use the first of ccache / sccache found on the PATH, a launcher
+                name or path, or None / 'none' to disable.
+        Returns:
+            Optional[CompilerCache]: The compiler cache, None when disabled or no launcher was found.
+        """
+        if not launcher or launcher == "none":
+            return None
+        candidates = _KNOWN_LAUNCHERS if launcher == "auto" else (launcher,)
+        for candidate in candidates:
+            launcher_path = shutil.which(os.path.expanduser(candidate))
+            if launcher_path:
+                return cls(launcher=launcher_path, cache_path=cache_path, max_size=max_size)
+        return None
+
+    @property
+    def name(self) -> str:
+        """ The launcher name. """
+        return "sccache" if self._is_sccache else os.path.basename(self._launcher)
+
+    @property
+    def launcher(self) -> str:
+        """ Path to the launcher executable. """
+        return self._launcher
+
+    @property
+    def environment(self) -> dict[str, str]:
+        """ Environment which directs the launcher to the cache directory and size limit. """
+        if self._is_sccache:
+            environment = {"SCCACHE_DIR": self._cache_path}
+            if self._max_size:
+                environment["SCCACHE_CACHE_SIZE"] = self._max_size
+        else:
+            environment = {"CCACHE_DIR": self._cache_path}
+            if self._max_size:
+                environment["CCACHE_MAXSIZE"] = self._max_size
+        return environment
+
+    def _run(self, *arguments: str) -> Optional[str]:
+        """ Runs the launcher against the cache directory, returns its output or None on failure. """
+        with suppress(OSError, subprocess.SubprocessError):
+            results = subprocess.run([self._launcher, *arguments], capture_output=True, text=True, timeout=30,
+                                     env={**os.environ, **self.environment})
+            if results.returncode == 0:
+                return results.stdout
+        return None
+
+    def get_stats(self) -> Optional[tuple[int, int]]:
+        """
+        Reads the launcher cumulative statistics.
+        Returns:
+            Optional[tuple[int, int]]: Cache hits and misses, None if they could not be read.
+        """
+        if self._is_sccache:
+            output = self._run("--show-stats", "--stats-format=json")
+            with suppress(ValueError, TypeError, AttributeError):
+                stats = json.loads(output).get("stats", {})
+                return (sum(stats.get("cache_hits", {}).get("counts", {}).values()),
+                        sum(stats.get("cache_misses", {}).get("counts", {}).values()))
+            return None
+
+        # ccache 3.7 and later print machine-readable counters, older versions only the human-readable summary
+        output = self._run("--print-stats")
+        if output is not None:
+            counters: dict[str, int] = {}
+            for line in output.splitlines():
+                name, _, value = line.partition("\t")
+                if value.strip().isdigit():
+                    counters[name.strip()] = int(value)
+            hits = sum(counters.get(name, 0) for name in ("direct_cache_hit", "preprocessed_cache_hit",
+                                                           "cache_hit_direct", "cache_hit_preprocessed"))
+            return hits, counters.get("cache_miss", 0)
+
+        output = self._run("--show-stats")
+        if output is None:
+            return None
+
+        def _counter(_pattern: str) -> int:
+            _match = re.search(_pattern + r"\s+(\d+)", output)
+            return int(_match.group(1)) if _match else 0
+
+        return _counter(r"cache hit \(direct\)") + _counter(r"cache hit \(preprocessed\)"), _counter(r"cache miss")
+
+    @staticmethod
+    def _get_children_cpu_time() -> float:
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        return usage.ru_utime + usage.ru_stime
+
+    def begin(self) -> None:
+        """ Takes the statistics and CPU time baseline of a build. """
+        os.makedirs(self._cache_path, exist_ok=True)
+        stats = self.get_stats()
+        self._baseline = (*stats, self._get_children_cpu_time()) if stats is not None else None
+
+    def end(self) -> Optional[str]:
+        """
+        Compares the statistics against the baseline taken by 'begin()'.
+        Returns:
+            Optional[str]: Hit rate and estimated time saved summary, None if the statistics could not be read.
+        """
+        stats = self.get_stats()
+        if self._baseline is None or stats is None:
+            return None
+        hits, misses = max(0, stats[0] - self._baseline[0]), max(0, stats[1] - self._baseline[1])
+        cpu_time = self._get_children_cpu_time() - self._baseline[2]
+        self._baseline = None
+        if not hits + misses:
+            return f"{self.name}: no cacheable compilations"
+
+        # The CPU time of a mostly cold build, divided by its misses, approximates the cost of a miss
+        profile_file = os.path.join(self._cache_path, AUTO_FORGE_COMPILER_CACHE_PROFILE)
+        profile: dict[str, float] = {}
+        with suppress(OSError, ValueError):
+            with open(profile_file, encoding="utf-8") as file:
+                profile = json.load(file)
+        if misses and misses >= hits:
+            profile["miss_cpu_seconds"] = cpu_time / misses
+            with suppress(OSError):
+                with open(profile_file, "w", encoding="utf-8") as file:
+                    json.dump(profile, file)
+
+        summary = f"{self.name}: {hits} hits, {misses} misses ({hits * 100 / (hits + misses):.0f}% hit rate)"
+        miss_cpu_seconds = profile.get("miss_cpu_seconds")
+        if hits and isinstance(miss_cpu_seconds, (int, float)):
+            summary += f", ~{hits * miss_cpu_seconds:.1f}s CPU time saved"
+        return summary
@@ -0,0 +1,295 @@
+"""
+Script:         download_engine.py
+Author:         AutoForge Team
+
+Description:
+    HTTP download engine used for fetching large resources such as toolchain archives.
+    - Downloads are split into parallel HTTP Range requests when the server supports it.
+    - Interrupted downloads are resumed from a '.part' file and its JSON state sidecar.
+    - An optional sha256 is verified before the file is published.
+    - Completed files are stored in a shared content addressed cache, keyed by their sha256 and by URL + ETag,
+      so the next workspace gets a hard link to the cached file instead of downloading it again.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import urllib.request
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import suppress
+from typing import Any, Callable, Optional
+
+# AutoForge imports
+from auto_forge import (CommandResultType)
+
+AUTO_FORGE_MODULE_NAME = "DownloadEngine"
+AUTO_FORGE_MODULE_DESCRIPTION = "Parallel, resumable and cached HTTP downloads"
+AUTO_FORGE_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+AUTO_FORGE_DOWNLOAD_MIN_SEGMENT_SIZE = 8 * 1024 * 1024
+
+
+class DownloadEngine:
+    """
+    Parallel, resumable HTTP downloader backed by a content addressed cache.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, max_connections: int = 4,
+                 min_segment_size: int = AUTO_FORGE_DOWNLOAD_MIN_SEGMENT_SIZE,
+                 open_url: Optional[Callable[[urllib.request.Request, Optional[float]], Any]] = None):
+        """
+        Args:
+            cache_path (str, optional): Root of the shared downloads cache, None disables caching.
+            max_connections (int): Maximum concurrent Range requests per download.
+            min_segment_size (int): Files smaller than twice this size are fetched over a single connection.
+            open_url (Callable, optional): Opens a request and returns an HTTP response, defaults to 'urlopen'.
+        """
+        self._cache_path = cache_path
+        self._max_connections = max(1, max_connections)
+        self._min_segment_size = max(AUTO_FORGE_DOWNLOAD_CHUNK_SIZE, min_segment_size)
+        self._open_url = open_url or (lambda _request, _timeout: urllib.request.urlopen(_request, timeout=_timeout))
+
+    # ---------------------------------------------------------------------
+    # Cache
+    # ---------------------------------------------------------------------
+
+    def _cache_file_by_hash(self, sha256: str) -> str:
+        return os.path.join(self._cache_path, "sha256", sha256[:2], sha256)
+
+    def _cache_url_record(self, url: str, etag: str) -> str:
+        key = hashlib.sha256(f"{url}\n{etag}".encode("utf-8")).hexdigest()
+        return os.path.join(self._cache_path, "urls", f"{key}.json")
+
+    def _cache_lookup(self, url: str, etag: Optional[str], sha256: Optional[str]) -> Optional[str]:
+        """ Returns the sha256 of a cached file matching the expected hash, or the URL and its ETag. """
+        if not self._cache_path:
+            return None
+        if sha256:
+            return sha256 if os.path.isfile(self._cache_file_by_hash(sha256)) else None
+        if not etag:
+            return None
+        with suppress(OSError, ValueError, KeyError):
+            with open(self._cache_url_record(url, etag), encoding="utf-8") as record_file:
+                cached_sha256 = json.load(record_file)["sha256"]
+            if os.path.isfile(self._cache_file_by_hash(cached_sha256)):
+                return cached_sha256
+        return None
+
+    @staticmethod
+    def _link_or_copy(source: str, destination: str) -> None:
+        """ Hard-links a file, falling back to a copy across file systems. Replaces the destination atomically. """
+        temp_file = f"{destination}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            try:
+                os.link(source, temp_file)
+            except OSError:
+                shutil.copy2(source, temp_file)
+            os.replace(temp_file, destination)
+        finally:
+            with suppress(OSError):
+                os.remove(temp_file)
+
+    def _cache_store(self, file_name: str, url: str, etag: Optional[str], sha256: str, size: int) -> None:
+        """ Adds a downloaded file to the cache, cache failures never fail the download. """
+        if not self._cache_path:
+            return
+        with suppress(OSError):
+            cache_file = self._cache_file_by_hash(sha256)
+            if not os.path.isfile(cache_file):
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                self._link_or_copy(file_name, cache_file)
+            if etag:
+                record_file = self._cache_url_record(url, etag)
+                os.makedirs(os.path.dirname(record_file), exist_ok=True)
+                temp_record = f"{record_file}.{os.getpid()}.tmp"
+                with open(temp_record, "w", encoding="utf-8") as record:
+                    json.dump({"url": url, "etag": etag, "sha256": sha256, "size": size, "stored": time.time()}, record)
+                os.replace(temp_record, record_file)
+
+    # ---------------------------------------------------------------------
+    # Transfer
+    # ---------------------------------------------------------------------
+
+    def _probe(self, url: str, headers: dict[str, str], timeout: Optional[float]) -> dict[str, Any]:
+        """ HEAD request retrieving the size, validators and ranges support, empty when unsupported. """
+        with suppress(Exception):
+            request = urllib.request.Request(url, headers=headers, method="HEAD")
+            with self._open_url(request, timeout) as response:
+                length = response.getheader("Content-Length")
+                return {"size": int(length) if length and length.strip().isdigit() else None,
+                        "etag": response.getheader("ETag"),
+                        "last_modified": response.getheader("Last-Modified"),
+                        "ranges": (response.getheader("Accept-Ranges") or "").strip().lower() == "bytes"}
+        return {}
+
+    def _fetch_segment(self, url: str, headers: dict[str, str], timeout: Optional[float], descriptor: int,
+                       segment: list[int], lock: threading.Lock, cancel: threading.Event,
+                       hasher: Optional[Any] = None) -> None:
+        """ Fetches the remaining part of a single [start, end, written] segment into the part file. """
+        start, end, written = segment  # An 'end' of -1 stands for 'until the end of the stream'
+        if 0 <= end < start + written:
+            return
+
+        request_headers = dict(headers)
+        if start + written > 0 or end >= 0:
+            request_headers["Range"] = f"bytes={start + written}-{end if end >= 0 else ''}"
+        request = urllib.request.Request(url, headers=request_headers)
+
+        with self._open_url(request, timeout) as response:
+            if "Range" in request_headers and response.status != 206:
+                raise ConnectionError(f"server ignored range request ({response.status})")
+            while not cancel.is_set():
+                chunk = response.read(AUTO_FORGE_DOWNLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                os.pwrite(descriptor, chunk, start + written)
+                if hasher is not None:
+                    hasher.update(chunk)
+                written += len(chunk)
+                with lock:
+                    segment[2] = written
+
+        if end >= 0 and start + written <= end and not cancel.is_set():
+            raise ConnectionError(f"connection closed after {written} of {end - start + 1} bytes")
+
+    @staticmethod
+    def _hash_file(file_name: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_name, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def download(self, url: str, destination_file: str, headers: Optional[dict[str, str]] = None,
+                 sha256: Optional[str] = None, timeout: Optional[float] = None, use_cache: bool = True,
+                 progress: Optional[Callable[[int, Optional[int]], None]] = None) -> CommandResultType:
+        """
+        Downloads a URL into a local file.
+        Args:
+            url (str): The file URL.
+            destination_file (str): Local file to create, its directory must exist.
+            headers (dict, optional): Extra request headers (authorization etc.).
+            sha256 (str, optional): Expected content hash, the download fails on mismatch.
+            timeout (float, optional): Per request timeout in seconds.
+            use_cache (bool): Lookup and populate the shared downloads cache.
+            progress (Callable, optional): Called from the calling thread with (downloaded, total) bytes.
+        Returns:
+            CommandResultType: 'response' is the destination file, 'extra_value' its size and 'extra_data'
+                a dictionary with the file 'sha256' and whether it was taken from the 'cached'.
+        """
+        headers = dict(headers or {})
+        sha256 = sha256.strip().lower() if sha256 else None
+        cache_enabled = use_cache and bool(self._cache_path)
+
+        # Known content, no need to even ask the server
+        cached_sha256 = self._cache_lookup(url, None, sha256) if cache_enabled else None
+        info: dict[str, Any] = {} if cached_sha256 else self._probe(url, headers, timeout)
+        if not cached_sha256 and cache_enabled:
+            cached_sha256 = self._cache_lookup(url, info.get("etag"), None)
+
+        if cached_sha256:
+            self._link_or_copy(self._cache_file_by_hash(cached_sha256), destination_file)
+            size = os.path.getsize(destination_file)
+            if progress is not None:
+                progress(size, size)
+            return CommandResultType(response=destination_file, return_code=0, extra_value=size,
+                                     extra_data={"sha256": cached_sha256, "cached": True})
+
+        size: Optional[int] = info.get("size")
+        validator = info.get("etag") or info.get("last_modified")
+        part_file = f"{destination_file}.part"
+        state_file = f"{part_file}.json"
+
+        # Resume a previous attempt only when the server content is provably the same
+        segments: Optional[list[list[int]]] = None
+        if info.get("ranges") and size and validator:
+            with suppress(OSError, ValueError, KeyError):
+                with open(state_file, encoding="utf-8") as state:
+                    saved_state = json.load(state)
+                if (saved_state["url"] == url and saved_state["size"] == size and
+                        saved_state["validator"] == validator and os.path.isfile(part_file)):
+                    segments = saved_state["segments"]
+
+        resumed = segments is not None
+        if segments is None:
+            if info.get("ranges") and size and size >= 2 * self._min_segment_size:
+                count = min(self._max_connections, size // self._min_segment_size)
+                segment_size = -(-size // count)
+                segments = [[offset, min(offset + segment_size, size) - 1, 0] for offset in range(0, size, segment_size)]
+            else:
+                segments = [[0, (size - 1) if (size and info.get("ranges")) else -1, 0]]
+
+        def _save_state() -> None:
+            if not (info.get("ranges") and size and validator):
+                return  # Can't be resumed anyway
+            with suppress(OSError):
+                with lock:
+                    data = json.dumps({"url": url, "size": size, "validator": validator, "segments": segments})
+                with open(state_file, "w", encoding="utf-8") as _state:
+                    _state.write(data)
+
+        # A single stream starting at offset 0 is hashed on the fly, otherwise hashing is a pass over the file
+        inline_hasher = hashlib.sha256() if len(segments) == 1 and not resumed else None
+        lock = threading.Lock()
+        cancel = threading.Event()
+        descriptor = os.open(part_file, os.O_RDWR | os.O_CREAT | (0 if resumed else os.O_TRUNC), 0o644)
+        try:
+            if size and not resumed:
+                os.ftruncate(descriptor, size)
+            _save_state()
+
+            with ThreadPoolExecutor(max_workers=len(segments), thread_name_prefix="Download") as executor:
+                futures = [executor.submit(self._fetch_segment, url, headers, timeout, descriptor, segment, lock,
+                                           cancel, inline_hasher) for segment in segments]
+                last_saved = time.monotonic()
+                pending = set(futures)
+                try:
+                    while pending:
+                        done, pending = wait(pending, timeout=0.25, return_when=FIRST_EXCEPTION)
+                        if any(future.exception() for future in done):
+                            break
+                        if progress is not None:
+                            with lock:
+                                progress(sum(segment[2] for segment in segments), size)
+                        if time.monotonic() - last_saved > 2.0:
+                            _save_state()
+                            last_saved = time.monotonic()
+                finally:
+                    if pending:
+                        cancel.set()
+                for future in futures:
+                    future.result()  # Raise the first error
+
+            received = sum(segment[2] for segment in segments)
+            if size is None:
+                size = received
+                os.ftruncate(descriptor, size)
+            elif received != size:
+                raise ConnectionError(f"received {received} of {size} bytes")
+
+        except BaseException:
+            _save_state()  # Keep what we have for the next attempt
+            raise
+        finally:
+            os.close(descriptor)
+
+        actual_sha256 = inline_hasher.hexdigest() if inline_hasher is not None else self._hash_file(part_file)
+        if sha256 and actual_sha256 != sha256:
+            with suppress(OSError):
+                os.remove(part_file)
+                os.remove(state_file)
+            raise ValueError(f"sha256 mismatch for '{url}': expected {sha256}, got {actual_sha256}")
+
+        os.replace(part_file, destination_file)
+        with suppress(OSError):
+            os.remove(state_file)
+
+        if cache_enabled:
+            self._cache_store(destination_file, url, info.get("etag"), actual_sha256, size)
+        if progress is not None:
+            progress(size, size)
+
+        return CommandResultType(response=destination_file, return_code=0, extra_value=size,
+                                 extra_data={"sha256": actual_sha256, "cached": False, "resumed": resumed})
@@ -0,0 +1,191 @@
+"""
+Script:         elf_symbols.py
+Author:         AutoForge Team
+
+Description:
+    In-process reader of the dynamic symbol table ('.dynsym' / '.dynstr') of ELF shared libraries, replacing one
+    'nm -D' process per library. Libraries are memory mapped and parsed with 'struct', concurrently, and the symbols
+    of every library are cached by its inode, modification time and size, so unchanged libraries are never read again.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from typing import Optional
+
+from auto_forge import (ElfSymbolsType)
+
+AUTO_FORGE_MODULE_NAME = "ElfSymbols"
+AUTO_FORGE_MODULE_DESCRIPTION = "ELF dynamic symbols reader"
+AUTO_FORGE_ELF_SYMBOLS_CACHE_VERSION = 1
+
+_ELF_MAGIC = b"\x7fELF"
+_SHT_DYNSYM = 11
+_SHN_UNDEF = 0
+_STB_GLOBAL, _STB_WEAK, _STB_GNU_UNIQUE = 1, 2, 10
+_STT_GNU_IFUNC = 10
+_SHF_EXECINSTR = 0x4
+
+# Section header and symbol layouts, by ELF class (32 / 64 bits)
+_SECTION_HEADER = {1: "IIIIIIIIII", 2: "IIQQQQIIQQ"}
+_SYMBOL = {1: "IIIBBH", 2: "IBBHQQ"}
+
+
+class ElfSymbols:
+    """
+    Dynamic symbols reader with a persistent per library cache.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        Args:
+            cache_file (str, optional): JSON file keeping the symbols of the libraries already read.
+        """
+        self._cache_file = cache_file
+        self._lock = threading.Lock()
+        self._cache: dict[str, dict] = self._load_cache()
+
+    def _load_cache(self) -> dict[str, dict]:
+        if self._cache_file:
+            with suppress(OSError, ValueError):
+                with open(self._cache_file, encoding="utf-8") as cache:
+                    data = json.load(cache)
+                if isinstance(data, dict) and data.get("version") == AUTO_FORGE_ELF_SYMBOLS_CACHE_VERSION:
+                    return data.get("files", {})
+        return {}
+
+    @staticmethod
+    def read(path: str) -> ElfSymbolsType:
+        """
+        Reads the dynamic symbols of an ELF file.
+        Args:
+            path (str): The ELF file, typically a shared library.
+        Returns:
+            ElfSymbolsType: The exported functions and the undefined symbols.
+        Raises:
+            ValueError: If the file is not an ELF file or has no readable dynamic symbol table.
+        """
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as image:
+            if image[:4] != _ELF_MAGIC or image[4] not in (1, 2) or image[5] not in (1, 2):
+                raise ValueError("not an ELF file")
+            elf_class, byte_order = image[4], "<" if image[5] == 1 else ">"
+
+            # Section headers location, from the ELF header
+            if elf_class == 1:
+                section_offset, = struct.unpack_from(byte_order + "I", image, 0x20)
+                section_size, section_count = struct.unpack_from(byte_order + "HH", image, 0x2E)
+            else:
+                section_offset, = struct.unpack_from(byte_order + "Q", image, 0x28)
+                section_size, section_count = struct.unpack_from(byte_order + "HH", image, 0x3A)
+            section_format = struct.Struct(byte_order + _SECTION_HEADER[elf_class])
+            if not section_offset or section_size < section_format.size:
+                raise ValueError("no section headers")
+            if section_count == 0:  # More sections than the header could hold, the count is in the first one
+                section_count = section_format.unpack_from(image, section_offset)[5]
+
+            sections = [section_format.unpack_from(image, section_offset + index * section_size)
+                        for index in range(section_count)]
+            dynsym = next((section for section in sections if section[1] == _SHT_DYNSYM), None)
+            if dynsym is None or dynsym[6] >= len(sections):
+                raise ValueError("no dynamic symbol table")
+
+            # Fields: name, type, flags, address, offset, size, link, info, alignment, entry size
+            symbols_offset, symbols_size = dynsym[4], dynsym[5]
+            strings_offset, strings_size = sections[dynsym[6]][4], sections[dynsym[6]][5]
+            if symbols_offset + symbols_size > len(image) or strings_offset + strings_size > len(image):
+                raise ValueError("truncated dynamic symbol table")
+            strings = image[strings_offset:strings_offset + strings_size]
+
+            def _name(_offset: int) -> str:
+                _end = strings.find(b"\0", _offset)
+                return strings[_offset:_end if _end >= 0 else None].decode("utf-8", "replace")
+
+            exported: list[str] = []
+            undefined: list[str] = []
+            symbol_format = struct.Struct(byte_order + _SYMBOL[elf_class])
+            table = image[symbols_offset:symbols_offset + symbols_size - symbols_size % symbol_format.size]
+            for fields in symbol_format.iter_unpack(table):
+                if elf_class == 1:
+                    name_offset, _value, _size, info, _other, section_index = fields
+                else:
+                    name_offset, info, _other, section_index, _value, _size = fields
+                if not name_offset or name_offset >= strings_size:
+                    continue
+                binding, symbol_type = info >> 4, info & 0xF
+                if section_index == _SHN_UNDEF:
+                    if binding in (_STB_GLOBAL, _STB_WEAK):
+                        undefined.append(_name(name_offset))
+                elif binding in (_STB_GLOBAL, _STB_GNU_UNIQUE) and (
+                        symbol_type == _STT_GNU_IFUNC or
+                        (section_index < len(sections) and sections[section_index][2] & _SHF_EXECINSTR)):
+                    exported.append(_name(name_offset))  # Code, as 'nm' types 'T' and 'i'
+
+        return ElfSymbolsType(exported=exported, undefined=undefined)
+
+    def scan(self, paths: list[str], max_workers: Optional[int] = None) -> dict[str, Optional[ElfSymbolsType]]:
+        """
+        Reads the dynamic symbols of several files concurrently, files unchanged since they were last read are
+        served from the cache.
+        Args:
+            paths (list[str]): The ELF files.
+            max_workers (int, optional): Maximum concurrent readers, defaults to the CPUs count.
+        Returns:
+            dict[str, Optional[ElfSymbolsType]]: The symbols of every file, None for files which could not be read.
+        """
+        results: dict[str, Optional[ElfSymbolsType]] = {}
+        pending: dict[str, list[int]] = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                results[path] = None
+                continue
+            identity = [stat.st_ino, stat.st_mtime_ns, stat.st_size]
+            with self._lock:
+                entry = self._cache.get(path)
+            if entry is not None and entry.get("identity") == identity:
+                results[path] = ElfSymbolsType(exported=entry["exported"], undefined=entry["undefined"])
+            else:
+                pending[path] = identity
+
+        def _read(_path: str) -> Optional[ElfSymbolsType]:
+            with suppress(OSError, ValueError, struct.error):
+                return self.read(_path)
+            return None
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers or os.cpu_count() or 1, len(pending))),
+                                    thread_name_prefix="ElfSymbols") as executor:
+                for path, symbols in zip(pending, executor.map(_read, pending)):
+                    results[path] = symbols
+
+            with self._lock:
+                for path, identity in pending.items():
+                    symbols = results[path]
+                    if symbols is not None:
+                        self._cache[path] = {"identity": identity, "exported": symbols.exported,
+                                             "undefined": symbols.undefined}
+                    else:
+                        self._cache.pop(path, None)
+                self._save()
+
+        return {path: results[path] for path in paths}
+
+    def _save(self) -> None:
+        """ Atomically writes the cache, dropping the entries of files which no longer exist. """
+        if not self._cache_file:
+            return
+        for path in [path for path in self._cache if not os.path.exists(path)]:
+            del self._cache[path]
+        temp_file = f"{self._cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as cache:
+                json.dump({"version": AUTO_FORGE_ELF_SYMBOLS_CACHE_VERSION, "files": self._cache}, cache)
+            os.replace(temp_file, self._cache_file)
+        except OSError:
+            with suppress(OSError):
+                os.remove(temp_file)
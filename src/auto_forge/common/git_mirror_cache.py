@@ -0,0 +1,111 @@
+"""
+Script:         git_mirror_cache.py
+Author:         AutoForge Team
+
+Description:
+    Local cache of bare Git mirrors shared between workspaces. A mirror is created once with 'git clone --mirror'
+    and later refreshed with 'git fetch', so workspace clones could borrow its objects (using '--reference-if-able'
+    or a local '--shared' clone) and only transfer what changed since the mirror was last updated.
+"""
+
+import fcntl
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+from contextlib import contextmanager, suppress
+from typing import Iterator, Optional
+
+AUTO_FORGE_MODULE_NAME = "GitMirrorCache"
+AUTO_FORGE_MODULE_DESCRIPTION = "Git bare mirrors cache"
+
+
+class GitMirrorCache:
+    """
+    Directory of bare mirrors, one per repository URL. Mirror updates are serialized with a file lock so
+    concurrent workspaces (or sequence steps) never fetch into the same mirror at once.
+    """
+
+    def __init__(self, cache_path: str, git_binary: str = "git"):
+        """
+        Args:
+            cache_path (str): Directory holding the bare mirrors, created on first use.
+            git_binary (str): The git executable.
+        """
+        self._cache_path = os.path.abspath(os.path.expanduser(cache_path))
+        self._git_binary = git_binary
+
+    @staticmethod
+    def _normalize_url(repo_url: str) -> str:
+        """ Drops trailing slashes, a '.git' suffix and credentials, so equivalent URLs share a mirror. """
+        url = re.sub(r"//[^/@]+@", "//", repo_url.strip())
+        url = url.rstrip("/")
+        return url[:-4] if url.endswith(".git") else url
+
+    def get_mirror_path(self, repo_url: str) -> str:
+        """
+        Returns the mirror location of a repository, which may not exist yet.
+        Args:
+            repo_url (str): The repository URL.
+        Returns:
+            str: Path to the bare mirror directory.
+        """
+        normalized_url = self._normalize_url(repo_url)
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", normalized_url.rsplit("/", 1)[-1]) or "repo"
+        digest = hashlib.sha256(normalized_url.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self._cache_path, f"{name}-{digest}.git")
+
+    def has_mirror(self, repo_url: str) -> bool:
+        """ Checks if a (complete) mirror of the repository exists. """
+        mirror_path = self.get_mirror_path(repo_url)
+        return os.path.isfile(os.path.join(mirror_path, "HEAD")) and not os.path.exists(f"{mirror_path}.partial")
+
+    @contextmanager
+    def _locked(self, mirror_path: str) -> Iterator[None]:
+        """ Exclusive inter-process lock of a single mirror. """
+        os.makedirs(self._cache_path, exist_ok=True)
+        with open(f"{mirror_path}.lock", "w") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _run_git(self, arguments: list[str], timeout: Optional[float]) -> None:
+        """ Runs git without a terminal prompt, raising on failure. """
+        environment = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+        results = subprocess.run([self._git_binary, *arguments], capture_output=True, text=True, env=environment,
+                                 timeout=timeout or None)
+        if results.returncode != 0:
+            error_text = (results.stderr or results.stdout or "").strip().splitlines()
+            raise RuntimeError(f"'git {arguments[0]}' failed with exit code {results.returncode}"
+                               f"{': ' + error_text[-1] if error_text else ''}")
+
+    def update(self, repo_url: str, timeout: Optional[float] = None) -> str:
+        """
+        Creates the mirror of a repository or fetches the latest changes into an existing one.
+        Args:
+            repo_url (str): The repository URL.
+            timeout (float, optional): Maximum time in seconds for the git operation.
+        Returns:
+            str: Path to the updated bare mirror.
+        """
+        mirror_path = self.get_mirror_path(repo_url)
+        partial_marker = f"{mirror_path}.partial"
+
+        with self._locked(mirror_path):
+            if os.path.isfile(os.path.join(mirror_path, "HEAD")) and not os.path.exists(partial_marker):
+                self._run_git(["--git-dir", mirror_path, "fetch", "--prune", "origin"],
+                              timeout=timeout)
+                return mirror_path
+
+            # Fresh mirror, the marker flags a mirror whose clone was interrupted
+            with open(partial_marker, "w"):
+                pass
+            if os.path.exists(mirror_path):
+                shutil.rmtree(mirror_path, ignore_errors=True)
+            self._run_git(["clone", "--mirror", "--quiet", repo_url, mirror_path], timeout=timeout)
+            with suppress(OSError):
+                os.remove(partial_marker)
+            return mirror_path
@@ -0,0 +1,221 @@
+"""
+Script:         http_session.py
+Author:         AutoForge Team
+
+Description:
+    Minimal keep-alive HTTP(S) session built on 'http.client'. Connections are pooled per host and reused across
+    requests and threads, so consecutive downloads from the same server pay the TCP / TLS handshake only once.
+    Proxy (including its credentials and the 'no_proxy' exclusions) and default headers (e.g. authorization) are
+    configured once per session, without touching the process wide 'urllib' opener.
+"""
+
+import base64
+import http.client
+import ssl
+import threading
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from contextlib import suppress
+from typing import Any, Optional
+from urllib.parse import unquote, urljoin, urlsplit
+
+AUTO_FORGE_MODULE_NAME = "HTTPSession"
+AUTO_FORGE_MODULE_DESCRIPTION = "Pooled keep-alive HTTP session"
+AUTO_FORGE_HTTP_MAX_REDIRECTS = 5
+
+
+class _PooledResponse:
+    """
+    Wraps an 'http.client' response, handing its connection back to the pool once the body was fully consumed.
+    Exposes the subset of the 'urllib' response interface used by AutoForge.
+    """
+
+    def __init__(self, session: "HTTPSession", pool_key: tuple, connection: http.client.HTTPConnection,
+                 response: http.client.HTTPResponse, url: str):
+        self._session = session
+        self._pool_key = pool_key
+        self._connection: Optional[http.client.HTTPConnection] = connection
+        self._response = response
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self._response.getheader(name, default)
+
+    def read(self, amount: Optional[int] = None) -> bytes:
+        return self._response.read(amount) if amount is not None else self._response.read()
+
+    def close(self) -> None:
+        if self._connection is None:
+            return
+        reusable = self._response.isclosed() and not self._response.will_close
+        if not reusable:
+            self._response.close()
+        self._session._release(self._pool_key, self._connection, reusable=reusable)
+        self._connection = None
+
+    def __enter__(self) -> "_PooledResponse":
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        self.close()
+
+
+class HTTPSession:
+    """
+    Thread safe pool of keep-alive connections, keyed by scheme, host and port.
+    """
+
+    def __init__(self, proxy_server: Optional[str] = None, headers: Optional[dict[str, str]] = None,
+                 max_idle_per_host: int = 8, timeout: Optional[float] = 60.0):
+        """
+        Args:
+            proxy_server (str, optional): Proxy URL ('http://[<user>:<password>@]<host>:<port>') or '<host>:<port>'
+                used for the session requests, except for hosts excluded by 'no_proxy'.
+            headers (dict, optional): Headers added to every request, e.g. 'Authorization'.
+            max_idle_per_host (int): Maximum idle connections kept open per host.
+            timeout (float, optional): Default socket timeout.
+        """
+        self._proxy: Optional[tuple[str, int]] = None
+        self._proxy_headers: dict[str, str] = {}
+        if proxy_server:
+            parsed_proxy = urlsplit(proxy_server if "://" in proxy_server else f"http://{proxy_server}")
+            self._proxy = (parsed_proxy.hostname, parsed_proxy.port or 8080)
+            if parsed_proxy.username is not None:
+                credentials = f"{unquote(parsed_proxy.username)}:{unquote(parsed_proxy.password or '')}"
+                self._proxy_headers["Proxy-Authorization"] = \
+                    f"Basic {base64.b64encode(credentials.encode('utf-8')).decode('ascii')}"
+
+        self._headers = dict(headers or {})
+        self._max_idle_per_host = max(1, max_idle_per_host)
+        self._timeout = timeout
+        self._ssl_context = ssl.create_default_context()
+        self._lock = threading.Lock()
+        self._idle: dict[tuple, list[http.client.HTTPConnection]] = defaultdict(list)
+        self._closed = False
+
+    def _is_proxied(self, host: str) -> bool:
+        """ Checks if requests to a host go through the proxy, hosts listed in 'no_proxy' are reached directly. """
+        return self._proxy is not None and not urllib.request.proxy_bypass(host)
+
+    def _new_connection(self, scheme: str, host: str, port: int,
+                        timeout: Optional[float]) -> http.client.HTTPConnection:
+        if not self._is_proxied(host):
+            if scheme == "https":
+                return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context)
+            return http.client.HTTPConnection(host, port, timeout=timeout)
+
+        proxy_host, proxy_port = self._proxy
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=timeout,
+                                                     context=self._ssl_context)
+            connection.set_tunnel(host, port, headers=self._proxy_headers or None)
+            return connection
+        return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout)
+
+    def _acquire(self, pool_key: tuple, timeout: Optional[float]) -> tuple[http.client.HTTPConnection, bool]:
+        """ Returns an idle connection (reused=True) or a new one. """
+        with self._lock:
+            idle = self._idle.get(pool_key)
+            if idle:
+                connection = idle.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+        scheme, host, port = pool_key
+        return self._new_connection(scheme, host, port, timeout), False
+
+    def _release(self, pool_key: tuple, connection: http.client.HTTPConnection, reusable: bool) -> None:
+        with self._lock:
+            if reusable and not self._closed and len(self._idle[pool_key]) < self._max_idle_per_host:
+                self._idle[pool_key].append(connection)
+                return
+        connection.close()
+
+    def _send(self, method: str, url: str, headers: dict[str, str], body: Optional[bytes],
+              timeout: Optional[float]) -> _PooledResponse:
+        """ Sends a single request, retrying once on a fresh connection if a reused one went stale. """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(f"unsupported URL scheme '{parts.scheme}'")
+        pool_key = (scheme, parts.hostname, parts.port or (443 if scheme == "https" else 80))
+
+        if scheme == "http" and self._is_proxied(parts.hostname):
+            target = url  # Plain HTTP proxies expect the absolute URL, and the credentials on every request
+            headers = {**headers, **self._proxy_headers}
+        else:
+            target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        for attempt in range(2):
+            connection, reused = self._acquire(pool_key, timeout)
+            try:
+                connection.request(method, target, body=body, headers=headers)
+                response = connection.getresponse()
+                return _PooledResponse(self, pool_key, connection, response, url)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError,
+                    http.client.BadStatusLine):
+                connection.close()
+                if not reused or attempt:
+                    raise
+            except BaseException:
+                connection.close()
+                raise
+        raise ConnectionError(f"failed to send request to '{url}'")
+
+    def open(self, request: urllib.request.Request, timeout: Optional[float] = None) -> _PooledResponse:
+        """
+        Performs a request, following redirects. Compatible with 'urllib.request.urlopen()' usage:
+        the returned response is a context manager exposing 'status', 'getheader()' and 'read()'.
+        Args:
+            request (urllib.request.Request): The request to perform.
+            timeout (float, optional): Socket timeout, defaults to the session timeout.
+        Returns:
+            The HTTP response, raises 'urllib.error.HTTPError' on HTTP errors.
+        """
+        if self._closed:
+            raise RuntimeError("HTTP session is closed")
+
+        timeout = timeout if timeout is not None else self._timeout
+        method = request.get_method()
+        url = request.full_url
+        headers = {**self._headers, **dict(request.header_items())}
+        headers.setdefault("Connection", "keep-alive")
+        headers.setdefault("User-Agent", "AutoForge")
+        body = request.data if isinstance(request.data, bytes) else None
+
+        for _ in range(AUTO_FORGE_HTTP_MAX_REDIRECTS + 1):
+            response = self._send(method, url, headers, body, timeout)
+            if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+                location = urljoin(url, response.getheader("Location"))
+                with suppress(Exception):
+                    response.read()  # Drain, so the connection could be reused
+                response.close()
+                if response.status == 303:
+                    method, body = ("HEAD" if method == "HEAD" else "GET"), None
+                url = location
+                continue
+
+            if response.status >= 400:
+                message = response.reason
+                with suppress(Exception):
+                    response.read()
+                response.close()
+                raise urllib.error.HTTPError(url, response.status, message, response.headers, None)
+            return response
+
+        raise urllib.error.HTTPError(url, 310, "too many redirects", None, None)
+
+    def close(self) -> None:
+        """ Closes all the idle connections, connections in use are closed once released. """
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, defaultdict(list)
+        for connections in idle.values():
+            for connection in connections:
+                with suppress(Exception):
+                    connection.close()
@@ -864,6 +864,19 @@ class BuildProfileType:
     tool_chain_data: Optional[dict[str, Any]] = None
 
 
+class BuildParallelismType(NamedTuple):
+    """ Default build parallelism derived from the host resources """
+    jobs: int  # Concurrent jobs ('-j')
+    load: int  # Load average limit ('-l')
+    reasons: list[str]  # Human-readable account of the limits which were considered
+
+
+class ElfSymbolsType(NamedTuple):
+    """ Dynamic symbols of an ELF shared library """
+    exported: list[str]  # Functions defined and exported by the library
+    undefined: list[str]  # Symbols the library expects other libraries to provide
+
+
 @dataclass
 class BuildAnalyzedEventType:
     """
@@ -0,0 +1,295 @@
+"""
+Script:         ninja_log_analytics.py
+Author:         AutoForge Team
+
+Description:
+    Post-build analytics of Ninja '.ninja_log' files. Each Ninja run appends one line per finished output, carrying
+    its start and end times (in milliseconds since the run started), so the entries appended since the previous
+    analysis describe the last build. They are grouped into edges, from which the critical path, the parallelism
+    over time and the slowest translation units are derived. Every analysis is appended to a persistent history,
+    so builds could be compared against the previous ones. The same durations weight the progress and ETA
+    reported while a build runs.
+"""
+
+import bisect
+import json
+import os
+import re
+import time
+from contextlib import suppress
+from typing import Any, Optional
+
+AUTO_FORGE_MODULE_NAME = "NinjaLogAnalytics"
+AUTO_FORGE_MODULE_DESCRIPTION = "Ninja build log analytics"
+AUTO_FORGE_NINJA_HISTORY_VERSION = 1
+
+# Outputs which are compiled translation units
+_OBJECT_SUFFIXES = (".o", ".obj")
+
+
+def _read_ninja_log(log_file: str, position: Optional[dict[str, int]]) -> tuple[list[tuple[int, int, str, str]],
+                                                                              dict[str, int]]:
+    """
+    Reads the log entries appended after a previous read position. The whole log is read when the position
+    doesn't apply any longer, e.g. when Ninja recompacted (rewrote) the log.
+    Returns:
+        The (start, end, output, command hash) entries and the new read position.
+    """
+    stat = os.stat(log_file)
+    offset = 0
+    if position and position.get("inode") == stat.st_ino and position.get("offset", 0) <= stat.st_size:
+        offset = position.get("offset", 0)
+
+    entries: list[tuple[int, int, str, str]] = []
+    with open(log_file, "rb") as log:
+        log.seek(offset)
+        data = log.read()
+
+    # Only consume complete lines, Ninja may still be appending
+    complete = data.rfind(b"\n") + 1
+    for line in data[:complete].decode("utf-8", errors="replace").splitlines():
+        if line.startswith("#"):
+            continue
+        fields = line.split("\t")
+        if len(fields) != 5:
+            continue
+        with suppress(ValueError):
+            entries.append((int(fields[0]), int(fields[1]), fields[3], fields[4]))
+
+    return entries, {"inode": stat.st_ino, "offset": offset + complete}
+
+
+class NinjaLogAnalytics:
+    """
+    Incremental '.ninja_log' reader and build history keeper.
+    """
+
+    def __init__(self, history_file: str, max_records: int = 50):
+        """
+        Args:
+            history_file (str): JSON file keeping the analyses history and the log read positions.
+            max_records (int): Number of analyses kept per build scope.
+        """
+        self._history_file = history_file
+        self._max_records = max_records
+        self._history: dict[str, Any] = {"version": AUTO_FORGE_NINJA_HISTORY_VERSION, "scopes": {}}
+
+        with suppress(OSError, ValueError):
+            with open(self._history_file, encoding="utf-8") as history:
+                data = json.load(history)
+            if isinstance(data, dict) and data.get("version") == AUTO_FORGE_NINJA_HISTORY_VERSION:
+                self._history = data
+
+    @staticmethod
+    def _last_run(entries: list[tuple[int, int, str, str]]) -> list[tuple[int, int, str, str]]:
+        """ Entries are appended as edges finish, so a drop in end time marks the start of a later Ninja run. """
+        first = 0
+        for index in range(1, len(entries)):
+            if entries[index][1] < entries[index - 1][1]:
+                first = index
+        return entries[first:]
+
+    @staticmethod
+    def _get_edges(entries: list[tuple[int, int, str, str]]) -> list[dict[str, Any]]:
+        """ Groups the outputs produced by the same command invocation into edges. """
+        edges: dict[tuple[int, int, str], dict[str, Any]] = {}
+        for start, end, output, command_hash in entries:
+            edge = edges.setdefault((start, end, command_hash), {"start": start, "end": end, "outputs": []})
+            edge["outputs"].append(output)
+        return sorted(edges.values(), key=lambda _edge: (_edge["end"], _edge["start"]))
+
+    @staticmethod
+    def _get_critical_path(edges: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Approximates the critical path from timing alone, since the log holds no dependencies: starting with the
+        last edge to finish, repeatedly step to the edge which finished last before the current one started.
+        """
+        if not edges:
+            return []
+        ends = [edge["end"] for edge in edges]  # Edges are sorted by their end time
+        index = len(edges) - 1
+        path = [edges[index]]
+        while True:
+            # Stepping only to earlier edges guarantees the walk ends, even with zero duration edges
+            index = min(bisect.bisect_right(ends, edges[index]["start"]), index) - 1
+            if index < 0:
+                break
+            path.append(edges[index])
+        return list(reversed(path))
+
+    @staticmethod
+    def _get_utilization(edges: list[dict[str, Any]], first_start: int, wall_time: int,
+                         buckets: int) -> list[float]:
+        """ Average number of concurrently running edges in equal slices of the build wall time. """
+        if wall_time <= 0:
+            return []
+        slice_time = wall_time / buckets
+        busy = [0.0] * buckets
+        for edge in edges:
+            start, end = edge["start"] - first_start, edge["end"] - first_start
+            for index in range(min(buckets - 1, int(start // slice_time)), min(buckets, int(end // slice_time) + 1)):
+                slice_start = index * slice_time
+                overlap = min(end, slice_start + slice_time) - max(start, slice_start)
+                if overlap > 0:
+                    busy[index] += overlap
+        return [round(value / slice_time, 2) for value in busy]
+
+    def analyze(self, build_path: str, scope: str, jobs: Optional[int] = None, top_count: int = 10,
+                buckets: int = 20) -> Optional[dict[str, Any]]:
+        """
+        Analyzes the Ninja edges which ran since the previous analysis of a build scope and records the result.
+        Args:
+            build_path (str): The Ninja build directory, holding '.ninja_log'.
+            scope (str): The build scope (e.g. 'project.configuration') the history is kept for.
+            jobs (int, optional): The jobs count the build ran with, used to compute the utilization.
+            top_count (int): Number of slowest translation units to report.
+            buckets (int): Number of time slices for the parallelism over time.
+        Returns:
+            Optional[dict[str, Any]]: The analysis, along with the previous one as 'previous', or None when no
+                edge ran.
+        """
+        log_file = os.path.join(build_path, ".ninja_log")
+        scope_history = self._history["scopes"].setdefault(scope, {"records": [], "units": {}})
+        try:
+            entries, scope_history["position"] = _read_ninja_log(log_file, scope_history.get("position"))
+        except OSError:
+            return None
+
+        edges = self._get_edges(self._last_run(entries))
+        if not edges:
+            self._save()
+            return None
+
+        first_start = min(edge["start"] for edge in edges)
+        wall_time = max(edge["end"] for edge in edges) - first_start
+        total_time = sum(edge["end"] - edge["start"] for edge in edges)
+        critical_path = self._get_critical_path(edges)
+
+        units = [edge for edge in edges if any(output.endswith(_OBJECT_SUFFIXES) for output in edge["outputs"])]
+        slowest = sorted(units or edges, key=lambda _edge: _edge["end"] - _edge["start"], reverse=True)[:top_count]
+        previous_units: dict[str, int] = scope_history["units"]
+
+        average_parallelism = total_time / wall_time if wall_time > 0 else float(len(edges))
+        record: dict[str, Any] = {
+            "timestamp": int(time.time()),
+            "edges": len(edges),
+            "wall_ms": wall_time,
+            "cpu_ms": total_time,
+            "critical_path_ms": sum(edge["end"] - edge["start"] for edge in critical_path),
+            "critical_path": [{"output": edge["outputs"][0], "ms": edge["end"] - edge["start"]}
+                              for edge in critical_path],
+            "average_parallelism": round(average_parallelism, 2),
+            "utilization": round(average_parallelism / jobs, 2) if jobs else None,
+            "parallelism_over_time": self._get_utilization(edges, first_start, wall_time, buckets),
+            "slowest_units": [{"output": edge["outputs"][0], "ms": edge["end"] - edge["start"],
+                               "previous_ms": previous_units.get(edge["outputs"][0])} for edge in slowest],
+        }
+
+        for edge in units:
+            previous_units[edge["outputs"][0]] = edge["end"] - edge["start"]
+        records: list[dict[str, Any]] = scope_history["records"]
+        previous_record = records[-1] if records else None
+        records.append(record)
+        del records[:-self._max_records]
+        self._save()
+
+        return {**record, "previous": previous_record}
+
+    def get_records(self, scope: str) -> list[dict[str, Any]]:
+        """ Returns the recorded analyses of a build scope, oldest first. """
+        return list(self._history["scopes"].get(scope, {}).get("records", []))
+
+    def _save(self) -> None:
+        """ Atomically writes the history. """
+        temp_file = f"{self._history_file}.{os.getpid()}.tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as history:
+                json.dump(self._history, history)
+            os.replace(temp_file, self._history_file)
+        except OSError:
+            with suppress(OSError):
+                os.remove(temp_file)
+
+
+class NinjaProgressEstimator:
+    """
+    Turns the Ninja '[finished/total]' status lines of a running build into a time weighted progress and ETA,
+    using the durations the same outputs took in previous builds (as recorded in '.ninja_log').
+    """
+
+    _STATUS_PATTERN = re.compile(r"^\[\s*(\d+)\s*/\s*(\d+)\s*]\s*(.*)$")
+
+    def __init__(self, build_path: str):
+        """
+        Loads the latest known duration of every output, a missing log simply falls back to edges count.
+        Args:
+            build_path (str): The Ninja build directory, holding '.ninja_log'.
+        """
+        self._durations: dict[str, int] = {}
+        with suppress(OSError):
+            entries, _position = _read_ninja_log(os.path.join(build_path, ".ninja_log"), None)
+            for start, end, output, _command_hash in entries:
+                self._durations[output] = end - start  # Later runs override earlier ones
+
+        self._known_work = sum(self._durations.values())
+        self._mean_duration = self._known_work / len(self._durations) if self._durations else None
+        self._start_time = time.monotonic()
+        self._seen: set[str] = set()
+        self._done_work = 0.0
+        self._done_known_work = 0
+        self._finished = 0
+        self._total = 0
+        self._fraction = 0.0
+
+    def _get_duration(self, description: str) -> tuple[Optional[str], Optional[int]]:
+        """ Finds the output an edge description refers to, e.g. 'Building C object <output>' or a '-o <output>'. """
+        for token in reversed(description.split()):
+            if token in self._durations:
+                return token, self._durations[token]
+        return None, None
+
+    def feed(self, line: str) -> Optional[str]:
+        """
+        Consumes an output line.
+        Args:
+            line (str): ANSI-stripped output line.
+        Returns:
+            Optional[str]: Progress text such as '37% ETA 1m05s', None if the line is not a Ninja status line.
+        """
+        match = self._STATUS_PATTERN.match(line)
+        if not match:
+            return None
+
+        self._finished, self._total = int(match.group(1)), max(1, int(match.group(2)))
+        output, duration = self._get_duration(match.group(3))
+        if output is not None and output not in self._seen:
+            self._seen.add(output)
+            self._done_work += duration
+            self._done_known_work += duration
+        elif output is None and self._mean_duration is not None:
+            self._done_work += self._mean_duration
+
+        remaining_edges = max(0, self._total - self._finished)
+        if self._mean_duration is None or not self._done_work:
+            # No history, progress by edges count
+            fraction = self._finished / self._total
+            remaining_work, done_work = float(remaining_edges), float(self._finished)
+        else:
+            # A rebuild of (nearly) everything is expected to take what the outputs not built yet took last time
+            mean_remaining = self._mean_duration
+            if self._total >= 0.9 * len(self._durations) and len(self._durations) > len(self._seen):
+                mean_remaining = max(0.0, (self._known_work - self._done_known_work) /
+                                     (len(self._durations) - len(self._seen)))
+            remaining_work = remaining_edges * mean_remaining
+            done_work = self._done_work
+            fraction = done_work / (done_work + remaining_work) if done_work + remaining_work > 0 else 1.0
+
+        # Estimates are refined as the build goes, but the shown progress never moves backwards
+        self._fraction = max(self._fraction, min(1.0, fraction))
+        progress = f"{self._fraction:4.0%}"
+        elapsed = time.monotonic() - self._start_time
+        if self._finished and done_work > 0 and elapsed >= 1.0:
+            # Work is drained at the rate observed so far, which already accounts for the parallelism
+            eta = int(remaining_work * elapsed / done_work)
+            progress += f" ETA {eta // 60}m{eta % 60:02d}s" if eta >= 60 else f" ETA {eta}s"
+        return progress
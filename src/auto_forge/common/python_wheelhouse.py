@@ -0,0 +1,182 @@
+"""
+Script:         python_wheelhouse.py
+Author:         AutoForge Team
+
+Description:
+    Local cache of pre-built Python wheels, shared between workspaces. Each wheelhouse holds all the wheels needed
+    to satisfy one normalized requirements set on a given interpreter, so later installs of the same set could run
+    offline using 'pip install --no-index --find-links <wheelhouse>'.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shlex
+import shutil
+import subprocess
+from contextlib import suppress
+from typing import Optional
+
+AUTO_FORGE_MODULE_NAME = "PythonWheelhouse"
+AUTO_FORGE_MODULE_DESCRIPTION = "Python wheels cache"
+AUTO_FORGE_WHEELHOUSE_MARKER = ".complete"
+
+# '<name>[extras]==<version>', optionally followed by environment markers
+_EXACT_PIN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*(\[[^\]]*\])?\s*===?\s*[^\s,;*]+\s*(;.*)?$")
+
+
+class PythonWheelhouse:
+    """
+    Wheelhouses directory, keyed by the interpreter tag and the hash of the normalized requirements.
+    """
+
+    def __init__(self, cache_path: str):
+        """
+        Args:
+            cache_path (str): Directory holding the wheelhouses, created on first use.
+        """
+        self._cache_path = os.path.abspath(os.path.expanduser(cache_path))
+        self._interpreter_tags: dict[str, str] = {}
+
+    @staticmethod
+    def _is_pinnable(requirement: str) -> bool:
+        """
+        Checks if a requirement resolves to the same content every time: an exact version pin ('==' without
+        wildcards) or a hash checked one. Ranges, bare names, VCS URLs and local paths may resolve differently later.
+        """
+        if requirement.startswith("-") or "://" in requirement or requirement.startswith(("git+", "hg+", "svn+")):
+            return False
+        if os.sep in requirement or requirement.startswith("."):
+            return False
+        if "--hash=" in requirement:
+            return True
+        return _EXACT_PIN.match(requirement) is not None
+
+    @classmethod
+    def _read_requirements_file(cls, requirements_file: str, visited: set[str]) -> Optional[list[str]]:
+        """ Reads a requirements file (following '-r' includes), None if it holds anything which can't be cached. """
+        requirements_file = os.path.abspath(requirements_file)
+        if requirements_file in visited:
+            return []
+        visited.add(requirements_file)
+
+        try:
+            with open(requirements_file, encoding="utf-8") as file:
+                lines = file.read().splitlines()
+        except OSError:
+            return None
+
+        requirements: list[str] = []
+        for line in lines:
+            line = re.sub(r"(^|\s)#.*$", "", line).strip()
+            if not line:
+                continue
+            include = re.match(r"^(-r|--requirement)\s*(\S+)$", line)
+            if include:
+                included = cls._read_requirements_file(
+                    os.path.join(os.path.dirname(requirements_file), include.group(2)), visited)
+                if included is None:
+                    return None
+                requirements.extend(included)
+            elif cls._is_pinnable(line):
+                requirements.append(line)
+            else:
+                return None
+        return requirements
+
+    @classmethod
+    def get_requirements(cls, packages_or_requirements: list[str]) -> Optional[list[str]]:
+        """
+        Normalizes the requirements set of an install.
+        Args:
+            packages_or_requirements (list[str]): Package specifications and requirements ('.txt') files.
+        Returns:
+            Optional[list[str]]: Sorted, de-duplicated requirement lines, None when the set can't be cached.
+        """
+        requirements: list[str] = []
+        for item in packages_or_requirements:
+            if item.endswith(".txt"):
+                file_requirements = cls._read_requirements_file(item, visited=set())
+                if file_requirements is None:
+                    return None
+                requirements.extend(file_requirements)
+                continue
+            for package in shlex.split(item):
+                if not cls._is_pinnable(package):
+                    return None
+                requirements.append(package)
+
+        normalized = {re.sub(r"\s+", "", requirement).lower() for requirement in requirements}
+        return sorted(normalized) if normalized else None
+
+    def get_interpreter_tag(self, python_binary: str) -> str:
+        """
+        Identifies the ABI and platform of an interpreter, wheels built for one tag are not reused by another.
+        Args:
+            python_binary (str): Path to the Python interpreter.
+        Returns:
+            str: The interpreter tag, e.g. 'cpython-312-linux-x86_64'.
+        """
+        if python_binary not in self._interpreter_tags:
+            results = subprocess.run(
+                [python_binary, "-c", "import sys, sysconfig; print(sys.implementation.cache_tag, "
+                                      "sysconfig.get_platform())"], capture_output=True, text=True, check=True)
+            self._interpreter_tags[python_binary] = "-".join(results.stdout.split())
+        return self._interpreter_tags[python_binary]
+
+    def get_path(self, python_binary: str, requirements: list[str]) -> str:
+        """
+        Returns the wheelhouse location of a requirements set, which may not exist yet.
+        Args:
+            python_binary (str): Path to the Python interpreter the wheels are installed into.
+            requirements (list[str]): Normalized requirements, as returned by 'get_requirements()'.
+        Returns:
+            str: Path to the wheelhouse directory.
+        """
+        payload = json.dumps({"interpreter": self.get_interpreter_tag(python_binary), "requirements": requirements})
+        return os.path.join(self._cache_path, hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24])
+
+    @staticmethod
+    def is_complete(wheelhouse_path: str) -> bool:
+        """ Checks if a wheelhouse was completely populated. """
+        return os.path.isfile(os.path.join(wheelhouse_path, AUTO_FORGE_WHEELHOUSE_MARKER))
+
+    @staticmethod
+    def prepare(wheelhouse_path: str) -> str:
+        """
+        Creates an empty staging directory to build a wheelhouse into.
+        Args:
+            wheelhouse_path (str): The final wheelhouse location.
+        Returns:
+            str: The staging directory.
+        """
+        staging_path = f"{wheelhouse_path}.{os.getpid()}.tmp"
+        shutil.rmtree(staging_path, ignore_errors=True)
+        os.makedirs(staging_path)
+        return staging_path
+
+    @staticmethod
+    def commit(wheelhouse_path: str, staging_path: str, requirements: list[str]) -> bool:
+        """
+        Publishes a populated staging directory as the wheelhouse, a concurrently published one wins.
+        Args:
+            wheelhouse_path (str): The final wheelhouse location.
+            staging_path (str): The populated staging directory.
+            requirements (list[str]): The requirements the wheelhouse satisfies, recorded for reference.
+        Returns:
+            bool: True if the wheelhouse is available.
+        """
+        with open(os.path.join(staging_path, AUTO_FORGE_WHEELHOUSE_MARKER), "w", encoding="utf-8") as marker:
+            marker.write("\n".join(requirements) + "\n")
+        try:
+            os.rename(staging_path, wheelhouse_path)
+        except OSError:
+            shutil.rmtree(staging_path, ignore_errors=True)
+        return PythonWheelhouse.is_complete(wheelhouse_path)
+
+    @staticmethod
+    def discard(staging_path: str) -> None:
+        """ Removes a staging directory left by a failed build. """
+        with suppress(OSError):
+            shutil.rmtree(staging_path)
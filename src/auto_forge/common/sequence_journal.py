@@ -0,0 +1,311 @@
+"""
+Script:         sequence_journal.py
+Author:         AutoForge Team
+
+Description:
+    Persistent journal of executed sequence steps. Each completed step is recorded with a fingerprint of its
+    method, expanded arguments, input files and tool versions, along with the paths it produced, so that an
+    unchanged step could be safely skipped the next time the same sequence runs.
+    A complementary append-only checkpoint log tracks the progress of the current run, allowing an interrupted
+    or failed sequence to be resumed from the first incomplete step.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from contextlib import suppress
+from typing import Any, Optional
+
+AUTO_FORGE_MODULE_NAME = "SequenceJournal"
+AUTO_FORGE_MODULE_DESCRIPTION = "Sequence steps journal"
+AUTO_FORGE_JOURNAL_VERSION = 1
+
+
+class SequenceJournal:
+    """
+    Fingerprints based steps cache, stored as a single JSON file.
+    Input files hashes are cached by (size, mtime) so large archives are only hashed once.
+    """
+
+    def __init__(self, journal_file: str, salt: Optional[str] = None):
+        """
+        Loads the journal, a missing or unreadable journal simply starts empty.
+        Args:
+            journal_file (str): Path to the journal JSON file.
+            salt (str, optional): Mixed into every fingerprint, typically the package version.
+        """
+        self._journal_file = journal_file
+        self._salt = salt or ""
+        self._lock = threading.Lock()
+        self._steps: dict[str, dict[str, Any]] = {}
+        self._file_hashes: dict[str, list] = {}
+        self._pending_inputs: dict[str, set[str]] = {}
+
+        with suppress(OSError, ValueError):
+            with open(self._journal_file, encoding="utf-8") as journal:
+                data = json.load(journal)
+            if isinstance(data, dict) and data.get("version") == AUTO_FORGE_JOURNAL_VERSION:
+                self._steps = data.get("steps", {})
+                self._file_hashes = data.get("file_hashes", {})
+
+    @staticmethod
+    def _iter_strings(data: Any):
+        """ Yields all the string values of a nested arguments structure. """
+        if isinstance(data, str):
+            yield data
+        elif isinstance(data, dict):
+            for value in data.values():
+                yield from SequenceJournal._iter_strings(value)
+        elif isinstance(data, (list, tuple)):
+            for value in data:
+                yield from SequenceJournal._iter_strings(value)
+
+    @staticmethod
+    def _to_path(value: str) -> Optional[str]:
+        """ Returns the absolute path for argument values which look like paths, None otherwise. """
+        if not value or "\n" in value or len(value) > 4096:
+            return None
+        if not (os.sep in value or value.startswith(".")):
+            return None
+        return os.path.abspath(value)
+
+    def _hash_file(self, path: str) -> Optional[str]:
+        """ sha256 of a file, reusing the cached digest when the file did not change. """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._file_hashes.get(path)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+
+        digest = hashlib.sha256()
+        try:
+            with open(path, "rb") as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        except OSError:
+            return None
+
+        with self._lock:
+            self._file_hashes[path] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+        return digest.hexdigest()
+
+    @staticmethod
+    def _tool_stamp(value: str) -> Optional[str]:
+        """ Identifies the version of an executable named by an argument, using its resolved binary stat. """
+        if not value or any(char.isspace() for char in value) or os.sep in value:
+            return None
+        binary = shutil.which(value)
+        if not binary:
+            return None
+        with suppress(OSError):
+            real_path = os.path.realpath(binary)
+            stat = os.stat(real_path)
+            return f"{real_path}:{stat.st_size}:{stat.st_mtime_ns}"
+        return None
+
+    def fingerprint(self, step_id: str, method_name: str, arguments: Any) -> str:
+        """
+        Computes the fingerprint of a step about to be executed.
+        Paths recorded as this step outputs are excluded from the inputs so that a step which produced a
+        file (e.g. a download) does not invalidate itself.
+        Args:
+            step_id (str): The step unique identifier.
+            method_name (str): The method invoked by the step.
+            arguments (Any): The step arguments, already expanded.
+        Returns:
+            str: Hex digest of the step inputs.
+        """
+        with self._lock:
+            known_outputs = set(self._steps.get(step_id, {}).get("outputs", {}))
+
+        inputs: dict[str, Optional[str]] = {}
+        tools: dict[str, str] = {}
+        for value in self._iter_strings(arguments):
+            path = self._to_path(value)
+            if path is not None:
+                if path not in known_outputs and os.path.isfile(path):
+                    inputs[path] = self._hash_file(path)
+                continue
+            stamp = self._tool_stamp(value)
+            if stamp is not None:
+                tools[value] = stamp
+
+        with self._lock:
+            self._pending_inputs[step_id] = set(inputs)
+
+        payload = json.dumps({"salt": self._salt, "method": method_name, "arguments": arguments,
+                              "inputs": inputs, "tools": tools}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def is_cached(self, step_id: str, fingerprint: str) -> bool:
+        """
+        Checks if a step previously completed with the same fingerprint and all its outputs are still intact.
+        Args:
+            step_id (str): The step unique identifier.
+            fingerprint (str): The fingerprint computed for the pending execution.
+        Returns:
+            bool: True if the step could be skipped.
+        """
+        with self._lock:
+            entry = self._steps.get(step_id)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return False
+
+        for path, (is_dir, size, mtime_ns) in entry.get("outputs", {}).items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return False
+            if is_dir:
+                if not os.path.isdir(path):
+                    return False
+            elif stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                return False
+        return True
+
+    def record(self, step_id: str, fingerprint: str, arguments: Any) -> None:
+        """
+        Records a successfully completed step along with the paths it left behind, files which were hashed
+        as inputs are not considered outputs.
+        Args:
+            step_id (str): The step unique identifier.
+            fingerprint (str): The fingerprint computed before the step was executed.
+            arguments (Any): The step arguments, already expanded.
+        """
+        with self._lock:
+            inputs = self._pending_inputs.pop(step_id, set())
+
+        outputs: dict[str, list] = {}
+        for value in self._iter_strings(arguments):
+            path = self._to_path(value)
+            if path is None or path in inputs:
+                continue
+            with suppress(OSError):
+                stat = os.stat(path)
+                is_dir = os.path.isdir(path)
+                outputs[path] = [is_dir, 0 if is_dir else stat.st_size, 0 if is_dir else stat.st_mtime_ns]
+
+        with self._lock:
+            self._steps[step_id] = {"fingerprint": fingerprint, "outputs": outputs, "completed": time.time()}
+
+    def invalidate(self, step_id: str) -> None:
+        """ Drops a step record, used when a step failed. """
+        with self._lock:
+            self._steps.pop(step_id, None)
+            self._pending_inputs.pop(step_id, None)
+
+    def save(self) -> bool:
+        """
+        Atomically writes the journal. Nothing is written as long as the journal directory does not exist,
+        so the journal never creates (or populates) a workspace that some step expects to be empty.
+        Returns:
+            bool: True if the journal was written.
+        """
+        journal_path = os.path.dirname(os.path.abspath(self._journal_file))
+        if not os.path.isdir(journal_path):
+            return False
+
+        with self._lock:
+            data = json.dumps({"version": AUTO_FORGE_JOURNAL_VERSION, "steps": self._steps,
+                               "file_hashes": self._file_hashes}, indent=2)
+        temp_file = f"{self._journal_file}.tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as journal:
+                journal.write(data)
+            os.replace(temp_file, self._journal_file)
+            return True
+        except OSError:
+            with suppress(OSError):
+                os.remove(temp_file)
+            return False
+
+
+class SequenceCheckpoint:
+    """
+    Append-only (JSON lines) log of the steps completed by the current sequence run, along with the values they
+    stored. The log is bound to the exact sequence definition, and removed once the sequence completes.
+    """
+
+    def __init__(self, checkpoint_file: str, sequence_key: str):
+        """
+        Args:
+            checkpoint_file (str): Path to the checkpoint log file.
+            sequence_key (str): Identifies the sequence definition, a log written for another definition is ignored.
+        """
+        self._checkpoint_file = checkpoint_file
+        self._sequence_key = sequence_key
+        self._lock = threading.Lock()
+        self._pending_lines: list[str] = []
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """ Reads the completed steps, tolerating a truncated last line. """
+        completed: dict[str, dict[str, Any]] = {}
+        try:
+            with open(self._checkpoint_file, encoding="utf-8") as checkpoint:
+                lines = checkpoint.read().splitlines()
+        except OSError:
+            return completed
+
+        for index, line in enumerate(lines):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break  # Interrupted while writing
+            if index == 0:
+                if record.get("sequence") != self._sequence_key:
+                    return {}  # Different sequence definition
+                continue
+            if isinstance(record, dict) and isinstance(record.get("step"), str):
+                completed[record["step"]] = record.get("values") or {}
+        return completed
+
+    def start(self, resume: bool) -> dict[str, dict[str, Any]]:
+        """
+        Starts tracking a run.
+        Args:
+            resume (bool): Continue the previously logged run rather than starting a new log.
+        Returns:
+            dict: Steps already completed by the resumed run, mapped to the values they stored.
+        """
+        completed = self._load() if resume else {}
+        with self._lock:
+            self._pending_lines = []
+            if not completed:
+                with suppress(OSError):
+                    os.remove(self._checkpoint_file)
+                self._pending_lines.append(json.dumps({"sequence": self._sequence_key, "started": time.time()}))
+        return completed
+
+    def append(self, step_id: str, values: Optional[dict[str, Any]] = None) -> None:
+        """
+        Logs a completed step. Lines are kept in memory until the log directory exists.
+        Args:
+            step_id (str): The step unique identifier.
+            values (dict, optional): Values stored by the step, restored on resume.
+        """
+        with self._lock:
+            self._pending_lines.append(json.dumps({"step": step_id, "values": values or {}}, default=str))
+            if not os.path.isdir(os.path.dirname(os.path.abspath(self._checkpoint_file))):
+                return
+            with suppress(OSError):
+                # Stored values may be secrets, keep the log private
+                descriptor = os.open(self._checkpoint_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+                with os.fdopen(descriptor, "a", encoding="utf-8") as checkpoint:
+                    checkpoint.write("\n".join(self._pending_lines) + "\n")
+                    checkpoint.flush()
+                    os.fsync(checkpoint.fileno())
+                self._pending_lines = []
+
+    def clear(self) -> None:
+        """ Removes the log, called once the sequence completed. """
+        with self._lock:
+            self._pending_lines = []
+            with suppress(OSError):
+                os.remove(self._checkpoint_file)
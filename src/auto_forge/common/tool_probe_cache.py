@@ -0,0 +1,134 @@
+"""
+Script:         tool_probe_cache.py
+Author:         AutoForge Team
+
+Description:
+    Persistent cache of tools '--version' probes. Each entry is keyed by the path the tool is invoked through along
+    with its resolved path, and identified by the binary size, modification time and inode, so a cached version is
+    reused until the binary is replaced or updated. Tools are probed through the invoked path, since multi-call
+    binaries (e.g. ccache masquerade links) behave according to the name they were run as.
+    Tools missing from the cache are probed concurrently.
+"""
+
+import json
+import os
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from typing import Optional
+
+from auto_forge import (VersionCompare)
+
+AUTO_FORGE_MODULE_NAME = "ToolProbeCache"
+AUTO_FORGE_MODULE_DESCRIPTION = "Tools version probes cache"
+AUTO_FORGE_PROBE_CACHE_VERSION = 2
+
+
+class ToolProbeCache:
+    """
+    JSON file backed tools version cache.
+    """
+
+    def __init__(self, cache_file: str, timeout: float = 30.0):
+        """
+        Loads the cache, a missing or unreadable cache simply starts empty.
+        Args:
+            cache_file (str): Path to the cache JSON file.
+            timeout (float): Maximum time in seconds for a single probe.
+        """
+        self._cache_file = cache_file
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        self._modified = False
+
+        with suppress(OSError, ValueError):
+            with open(self._cache_file, encoding="utf-8") as cache:
+                data = json.load(cache)
+            if isinstance(data, dict) and data.get("version") == AUTO_FORGE_PROBE_CACHE_VERSION:
+                self._entries = data.get("tools", {})
+
+    @staticmethod
+    def _stamp(real_path: str) -> Optional[list[int]]:
+        """ Identifies a binary by its size, modification time and inode. """
+        try:
+            stat = os.stat(real_path)
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+    def _probe(self, binary_path: str) -> Optional[str]:
+        """ Runs '<tool> --version', returns the parsed version, or the raw output when no version was found. """
+        try:
+            output = subprocess.run([binary_path, "--version"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                    text=True, timeout=self._timeout, check=True).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return VersionCompare.extract_version(output) or output.strip()[:1024]
+
+    def get_versions(self, binary_paths: list[str], max_workers: int = 8) -> dict[str, Optional[str]]:
+        """
+        Returns the versions of several tools, probing only the tools which are not cached (or changed).
+        Args:
+            binary_paths (list[str]): Tools absolute paths.
+            max_workers (int): Maximum concurrent probes.
+        Returns:
+            dict[str, Optional[str]]: Tool path to detected version, None if the tool could not be probed.
+        """
+        versions: dict[str, Optional[str]] = {}
+        pending: dict[str, tuple[str, list[int]]] = {}
+
+        for binary_path in dict.fromkeys(binary_paths):
+            # The resolved binary identifies the tool version, the invoked path may select the tool it acts as
+            real_path = os.path.realpath(binary_path)
+            stamp = self._stamp(real_path)
+            if stamp is None:
+                versions[binary_path] = None
+                continue
+            key = f"{binary_path} -> {real_path}"
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry and entry.get("stamp") == stamp:
+                versions[binary_path] = entry.get("detected")
+            else:
+                pending[binary_path] = (key, stamp)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+                probes = dict(zip(pending, executor.map(self._probe, pending)))
+
+            with self._lock:
+                for binary_path, detected in probes.items():
+                    versions[binary_path] = detected
+                    if detected is not None:
+                        key, stamp = pending[binary_path]
+                        self._entries[key] = {"stamp": stamp, "detected": detected}
+                        self._modified = True
+
+        return versions
+
+    def save(self) -> bool:
+        """
+        Atomically writes the cache when it was modified.
+        Returns:
+            bool: True if the cache is up-to-date on disk.
+        """
+        with self._lock:
+            if not self._modified:
+                return True
+            data = json.dumps({"version": AUTO_FORGE_PROBE_CACHE_VERSION, "tools": self._entries}, indent=2)
+
+        temp_file = f"{self._cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self._cache_file)), exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as cache:
+                cache.write(data)
+            os.replace(temp_file, self._cache_file)
+            with self._lock:
+                self._modified = False
+            return True
+        except OSError:
+            with suppress(OSError):
+                os.remove(temp_file)
+            return False
@@ -0,0 +1,195 @@
+"""
+Script:         venv_snapshot.py
+Author:         AutoForge Team
+
+Description:
+    Cache of ready to use Python virtual environments, keyed by the base interpreter and the normalized requirements
+    set. A freshly built environment is copied into the cache once, and restored into other workspaces by hard
+    linking its files, while the few files which embed the environment location (scripts shebangs, activation
+    scripts, 'pyvenv.cfg' and '.pth' files) are copied and rewritten for the new location.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+from contextlib import suppress
+from typing import Optional
+
+AUTO_FORGE_MODULE_NAME = "VenvSnapshots"
+AUTO_FORGE_MODULE_DESCRIPTION = "Python virtual environments cache"
+AUTO_FORGE_SNAPSHOT_MANIFEST = "snapshot.json"
+
+# Imports every top level module of the listed distributions, exits with an error on the first failure
+_VALIDATION_SCRIPT = """
+import importlib, importlib.metadata, sys
+for name in sys.argv[1:]:
+    try:
+        distribution = importlib.metadata.distribution(name)
+    except importlib.metadata.PackageNotFoundError:
+        sys.exit(f"distribution '{name}' is not installed")
+    for module in (distribution.read_text("top_level.txt") or "").split():
+        if module.isidentifier() and not module.startswith("_"):
+            try:
+                importlib.import_module(module)
+            except Exception as import_error:
+                sys.exit(f"could not import '{module}' of '{name}': {import_error}")
+"""
+
+
+class VenvSnapshots:
+    """
+    Directory of virtual environment snapshots.
+    """
+
+    def __init__(self, cache_path: str):
+        """
+        Args:
+            cache_path (str): Directory holding the snapshots, created on first use.
+        """
+        self._cache_path = os.path.abspath(os.path.expanduser(cache_path))
+
+    @staticmethod
+    def _needs_fixup(relative_path: str) -> bool:
+        """ Files which may embed the absolute location of the environment. """
+        parts = relative_path.split(os.sep)
+        return (parts[0] == "bin" or relative_path == "pyvenv.cfg" or
+                relative_path.endswith((".pth", ".egg-link")))
+
+    @staticmethod
+    def _copy_rewritten(source: str, destination: str, old_prefix: bytes, new_prefix: bytes) -> None:
+        """ Copies a file, replacing the old environment location with the new one. """
+        with open(source, "rb") as file:
+            content = file.read()
+        with open(destination, "wb") as file:
+            file.write(content.replace(old_prefix, new_prefix))
+        shutil.copymode(source, destination)
+
+    @classmethod
+    def _clone_tree(cls, source_path: str, destination_path: str, link: bool,
+                    final_path: Optional[str] = None) -> None:
+        """
+        Replicates an environment tree under another location.
+        Args:
+            source_path (str): The environment to replicate.
+            destination_path (str): Its new location, must not exist.
+            link (bool): Hard link the files which don't need to be rewritten, falls back to copying across devices.
+            final_path (str, optional): The location the replica is eventually moved to, defaults to its destination.
+        """
+        old_prefix = os.path.abspath(source_path).encode()
+        new_prefix = os.path.abspath(final_path or destination_path).encode()
+
+        for root, directories, files in os.walk(source_path):
+            relative_root = os.path.relpath(root, source_path)
+            target_root = os.path.normpath(os.path.join(destination_path, relative_root))
+            os.makedirs(target_root, exist_ok=True)
+
+            for name in directories + files:
+                source = os.path.join(root, name)
+                target = os.path.join(target_root, name)
+                relative_path = os.path.normpath(os.path.join(relative_root, name))
+
+                if os.path.islink(source):
+                    link_target = os.readlink(source)
+                    if link_target.startswith(old_prefix.decode()):
+                        link_target = new_prefix.decode() + link_target[len(old_prefix):]
+                    os.symlink(link_target, target)
+                    if name in directories:
+                        directories.remove(name)  # Don't descend into linked directories
+                elif name in files:
+                    if cls._needs_fixup(relative_path):
+                        cls._copy_rewritten(source, target, old_prefix, new_prefix)
+                    elif link:
+                        try:
+                            os.link(source, target)
+                        except OSError:
+                            shutil.copy2(source, target)
+                    else:
+                        shutil.copy2(source, target)
+
+    @staticmethod
+    def get_key(python_binary: str, requirements: list[str]) -> str:
+        """
+        Computes the snapshot key of an environment.
+        Args:
+            python_binary (str): The base interpreter the environment is created with.
+            requirements (list[str]): The normalized requirements set installed into the environment.
+        Returns:
+            str: The snapshot key.
+        """
+        results = subprocess.run([python_binary, "-c", "import sys, sysconfig; print(sys.version, "
+                                                       "sysconfig.get_platform())"],
+                                 capture_output=True, text=True, check=True)
+        payload = json.dumps({"python": os.path.realpath(python_binary), "version": results.stdout.strip(),
+                              "requirements": requirements})
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+
+    def has_snapshot(self, key: str) -> bool:
+        """ Checks if a complete snapshot exists for a key. """
+        return os.path.isfile(os.path.join(self._cache_path, key, AUTO_FORGE_SNAPSHOT_MANIFEST))
+
+    def snapshot(self, venv_path: str, key: str, requirements: list[str]) -> bool:
+        """
+        Stores a copy of an environment, a concurrently stored snapshot wins.
+        Args:
+            venv_path (str): The environment to snapshot.
+            key (str): The snapshot key.
+            requirements (list[str]): The requirements installed into the environment, recorded for reference.
+        Returns:
+            bool: True if a snapshot is available for the key.
+        """
+        snapshot_path = os.path.join(self._cache_path, key)
+        staging_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        shutil.rmtree(staging_path, ignore_errors=True)
+        try:
+            os.makedirs(staging_path)
+            # Copied rather than linked, so changes to the workspace environment never leak into the cache
+            self._clone_tree(venv_path, os.path.join(staging_path, "venv"), link=False,
+                             final_path=os.path.join(snapshot_path, "venv"))
+            with open(os.path.join(staging_path, AUTO_FORGE_SNAPSHOT_MANIFEST), "w", encoding="utf-8") as manifest:
+                json.dump({"source": os.path.abspath(venv_path), "requirements": requirements}, manifest, indent=2)
+            os.rename(staging_path, snapshot_path)
+        except OSError:
+            shutil.rmtree(staging_path, ignore_errors=True)
+        return self.has_snapshot(key)
+
+    def restore(self, key: str, venv_path: str) -> bool:
+        """
+        Restores a snapshot into an empty (or missing) environment path.
+        Args:
+            key (str): The snapshot key.
+            venv_path (str): Where to restore the environment.
+        Returns:
+            bool: True if the environment was restored.
+        """
+        if not self.has_snapshot(key):
+            return False
+        with suppress(OSError):
+            os.rmdir(venv_path)  # The caller may have created it empty
+        try:
+            self._clone_tree(os.path.join(self._cache_path, key, "venv"), venv_path, link=True)
+            return True
+        except OSError:
+            shutil.rmtree(venv_path, ignore_errors=True)
+            return False
+
+    @staticmethod
+    def validate(venv_path: str, requirements: list[str]) -> bool:
+        """
+        Confirms a restored environment interpreter runs and imports the packages of its requirements.
+        Args:
+            venv_path (str): The environment path.
+            requirements (list[str]): The normalized requirements set.
+        Returns:
+            bool: True if the environment is usable.
+        """
+        names = [match.group(0) for match in (re.match(r"[A-Za-z0-9][A-Za-z0-9._-]*", requirement)
+                                              for requirement in requirements) if match]
+        try:
+            results = subprocess.run([os.path.join(venv_path, "bin", "python"), "-c", _VALIDATION_SCRIPT, *names],
+                                     capture_output=True, text=True, timeout=120)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return results.returncode == 0
@@ -21,7 +21,9 @@ import subprocess
 import sys
 import termios
 import textwrap
+import time
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import suppress, contextmanager, nullcontext
 from datetime import datetime
 from itertools import islice
@@ -51,10 +53,10 @@ from rich.console import Console
 
 # AutoForge imports
 from auto_forge import (
-    AutoForgCommandType, AutoForgeModuleType, AutoForgeWorkModeType, BuildProfileType,
-    CommandFailedException, CommandResultType, CoreDynamicLoader, CoreLogger, CoreModuleInterface,
-    CorePlatform, CoreRegistry, CoreSolution, CoreSystemInfo, CoreTelemetry, CoreToolBox,
-    CoreVariables, ModuleInfoType, PackageGlobals, TelemetryTrackedCounter, TerminalEchoType,
+    AutoForgCommandType, AutoForgeModuleType, AutoForgeWorkModeType, BuildJobServer, BuildPipeline, BuildProfileType,
+    BuildResources, BuilderRunnerInterface, CommandFailedException, CommandResultType, CoreDynamicLoader, CoreLogger,
+    CoreModuleInterface, CorePlatform, CoreRegistry, CoreSolution, CoreSystemInfo, CoreTelemetry, CoreToolBox,
+    CoreVariables, ModuleInfoType, PackageGlobals, PromptStatusType, TelemetryTrackedCounter, TerminalEchoType,
     VariableFieldType,
 )
 
@@ -416,6 +418,11 @@ class CoreBuildShell(CoreModuleInterface, cmd2.Cmd):
         self._commands_json_data: Optional[
             str] = None  # Command + help in JSON structure stored as string usable by MCP
 
+        # Post-build steps (exports analysis, reports, artifacts cache) run in the background of the prompt
+        self._post_build_pipeline = BuildPipeline(
+            max_workers=int(self._configuration.get('build_post_pipeline_workers', 2)),
+            notify=self._notify_post_build_step)
+
         # Disable user input until the prompt is active
         self._tool_box.set_terminal_input()
 
@@ -1676,11 +1683,240 @@ class CoreBuildShell(CoreModuleInterface, cmd2.Cmd):
         print()
         return None
 
+    def _expand_build_targets(self, patterns: list[str]) -> list[str]:
+        """
+        Expands build targets patterns ('*', '<project>.*' and so on) into '<project>.<configuration>' targets.
+        Args:
+            patterns (list[str]): Targets, possibly with shell style wildcards.
+        Returns:
+            list[str]: Unique targets, in the order they were matched.
+        """
+        known_targets = [f"{project}.{configuration}" for project in self._solution.get_projects_names() or []
+                         for configuration in self._solution.get_configurations_names(project_name=project) or []]
+        targets: list[str] = []
+        for pattern in patterns:
+            if pattern == "*":
+                pattern = "*.*"
+            if any(char in pattern for char in "*?["):
+                matched = [target for target in known_targets if fnmatch.fnmatchcase(target, pattern)]
+                if not matched:
+                    raise ValueError(f"no configuration matches '{pattern}'")
+                targets.extend(matched)
+            else:
+                targets.append(pattern)
+        return list(dict.fromkeys(targets))
+
+    def _get_child_command_line(self, command: str) -> list[str]:
+        """
+        Constructs the command line of a child AutoForge process which runs a single command in this workspace,
+        reusing the arguments this process was started with.
+        Args:
+            command (str): The command to run, e.g. 'build <project>.<configuration>'.
+        Returns:
+            list[str]: The command line.
+        """
+        arguments: list[str] = []
+        skip_value = False
+        for argument in sys.argv[1:]:
+            if skip_value:
+                skip_value = False
+                continue
+            if argument in ("-r", "--run-command") or argument.startswith("--run-command="):
+                break  # The remaining arguments are the command this process was asked to run
+            if argument in ("-s", "--run-sequence", "-d", "--remote-debugging"):
+                skip_value = True
+                continue
+            if argument in ("-m", "--mcp-service") or argument.startswith(("--run-sequence=", "--remote-debugging=")):
+                continue
+            arguments.append(argument)
+        return [sys.executable, "-m", "auto_forge", *arguments, "--run-command", command]
+
+    def _get_build_system(self, target: str) -> Optional[str]:
+        """ Returns the build system of a '<project>.<configuration>' target, as set by its project toolchain. """
+        project_data = self._solution.query_projects(project_name=target.split(".")[0])
+        if not isinstance(project_data, dict):
+            return None
+        return (project_data.get("tool_chain") or {}).get("build_system")
+
+    def _build_many(self, targets: list[str], extra_args: list[str]) -> int:
+        """
+        Builds several configurations concurrently, each in a child AutoForge process, under a single jobs budget.
+        Ninja based builds get an equal share of the budget ('-j') along with a machine wide load limit ('-l'),
+        and make based builds draw the rest of the budget from a shared jobserver (GNU make 4.4 and later).
+        Every child writes its build reports (error context, AI response, ...) to its own '$BUILD_LOGS/<target>'.
+        Args:
+            targets (list[str]): The '<project>.<configuration>' targets to build.
+            extra_args (list[str]): Extra build arguments, '--jobs=<n>' overrides the jobs budget.
+        Returns:
+            int: 0 if all the configurations were built successfully.
+        """
+        logs_path = Path(self._variables.expand(key="$BUILD_LOGS"))
+        logs_path.mkdir(parents=True, exist_ok=True)
+
+        # The default budget is bound by the CPUs we could use and by the memory hungriest configuration
+        build_resources = BuildResources(
+            profile_file=str(logs_path / self._configuration.get("build_resources_file", "build_resources.json")))
+        parallelism = min((build_resources.get_parallelism(scope=target) for target in targets),
+                          key=lambda _parallelism: _parallelism.jobs)
+        jobs_budget, load_limit = parallelism.jobs, parallelism.load
+
+        forwarded_args: list[str] = []
+        for extra_arg in extra_args:
+            if extra_arg.startswith("--jobs="):
+                jobs_budget = max(1, int(extra_arg.split("=", 1)[1]))
+                load_limit = max(load_limit, jobs_budget)
+            else:
+                forwarded_args.append(extra_arg)
+
+        concurrency = max(1, min(len(targets), jobs_budget))
+        jobs_per_build = max(1, jobs_budget // concurrency)
+
+        # The jobserver only serves make builds, the shares of the Ninja builds which may run at once are set aside
+        make_targets = {target for target in targets if self._get_build_system(target) == "make"}
+        make_clients = min(len(make_targets), concurrency)
+        ninja_reserved = min(len(targets) - len(make_targets), concurrency) * jobs_per_build
+        make_jobs = max(make_clients, jobs_budget - ninja_reserved)
+
+        self.poutput(f"Building {len(targets)} configurations, {concurrency} at a time, "
+                     f"jobs budget {jobs_budget} ({jobs_per_build} per Ninja build, load limit {load_limit})")
+        self.poutput(f"Resources: {', '.join(parallelism.reasons)}")
+
+        results: dict[str, tuple[int, float, Path]] = {}
+
+        # Older make versions can't join a FIFO jobserver, and get the same budget share as Ninja
+        job_server = BuildJobServer(jobs=make_jobs, clients=make_clients) \
+            if make_targets and BuildJobServer.is_supported() else None
+        with job_server or nullcontext():
+            environment = {key: value for key, value in os.environ.items() if key != "MAKEFLAGS"}
+            environment.update({BuildJobServer.JOBS_ENV: str(jobs_per_build),
+                                BuildJobServer.LOAD_ENV: str(load_limit)})
+
+            def _build_target(_target: str) -> tuple[int, float, Path]:
+                _log_file = logs_path / f"{_target}.build.log"
+                _command = shlex.join(["build", _target, *forwarded_args])
+                _environment = {**environment, BuilderRunnerInterface.REPORTS_SCOPE_ENV: _target}
+                if job_server is not None and _target in make_targets:
+                    _environment.update(job_server.environment)
+                _start_time = time.monotonic()
+                with open(_log_file, "w", encoding="utf-8") as _log:
+                    _process = subprocess.run(self._get_child_command_line(_command), stdin=subprocess.DEVNULL,
+                                              stdout=_log, stderr=subprocess.STDOUT, env=_environment,
+                                              cwd=os.getcwd())
+                return _process.returncode, time.monotonic() - _start_time, _log_file
+
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="Build") as executor:
+                futures = {executor.submit(_build_target, target): target for target in targets}
+                for future in as_completed(futures):
+                    target = futures[future]
+                    try:
+                        results[target] = future.result()
+                    except Exception as build_error:
+                        self._logger.exception(build_error)
+                        results[target] = (1, 0.0, logs_path / f"{target}.build.log")
+                    return_code, duration, log_file = results[target]
+                    status = "✔" if return_code == 0 else \
+                        f"✘ (exit code {return_code}, see '{log_file}' and the reports in '{logs_path / target}')"
+                    self.poutput(f"  {target:<40} {duration:7.1f}s  {status}  [{len(results)}/{len(targets)}]")
+
+        failed = [target for target in targets if results[target][0] != 0]
+        self.poutput(f"Built {len(targets) - len(failed)}/{len(targets)} configurations"
+                     f"{', failed: ' + ', '.join(failed) if failed else ''}")
+        return 1 if failed else 0
+
+    def _build_single(self, target: str, extra_args: list[str]) -> int:
+        """
+        Builds a single '<project>.<configuration>' target in this process.
+        Args:
+            target (str): The target to build.
+            extra_args (list[str]): Extra arguments passed to the builder.
+        Returns:
+            int: The builder exit code.
+        """
+        parts = target.split(".")
+        if len(parts) != 2:
+            self.perror("Expected exactly 2 parts: <project>.<configuration>")
+            return 1
+
+        self._tool_box.show_status(message="🔧 Building project...")
+
+        # Construct 'build profile' object
+        build_profile = BuildProfileType()
+        build_profile.solution_name = self._loaded_solution_name
+        build_profile.project_name, build_profile.config_name = parts
+        build_profile.build_dot_notation = f"{build_profile.solution_name}.{target}"
+        build_profile.extra_args = extra_args  # optionally use this in the builder
+
+        # Fetch build configuration
+        build_profile.config_data = self._solution.query_configurations(
+            project_name=build_profile.project_name,
+            configuration_name=build_profile.config_name
+        )
+
+        if build_profile.config_data:
+            project_data: Optional[dict[str, Any]] = (
+                self._solution.query_projects(project_name=build_profile.project_name))
+            if project_data:
+                build_profile.tool_chain_data = project_data.get("tool_chain")
+                build_profile.build_system = (build_profile.tool_chain_data.get("build_system")
+                                              if build_profile.tool_chain_data else None)
+
+        if build_profile.build_system:
+            self._logger.debug(
+                f"Building {build_profile.build_dot_notation}, "
+                f"using '{build_profile.build_system}' "
+                f"with extra args: {extra_args}"
+            )
+
+            return self._loader.execute_build(build_profile=build_profile)
+
+        self.perror(f"Solution configuration not found for '{build_profile.build_dot_notation}'")
+        return 1
+
+    def _notify_post_build_step(self, step: dict[str, Any]) -> None:
+        """
+        Announces a finished background post-build step.
+        Args:
+            step (dict[str, Any]): The step record, see 'BuildPipeline.get_status()'.
+        """
+        message = f"Post-build {step['name']} of '{step['scope']}' {step['state']}"
+        if step.get("summary"):
+            message += f": {step['summary']}"
+        if step["state"] == "failed":
+            self._logger.error(message)
+            self._tool_box.show_status(message=f"🔧 {message}", expire_after=3, status_type=PromptStatusType.ERROR,
+                                       erase_after=True)
+        else:
+            self._logger.info(message)
+            self._tool_box.show_status(message=f"🔧 {message}, see 'build --status'", expire_after=3,
+                                       erase_after=True)
+
+    def _print_post_build_status(self) -> None:
+        """ Prints the recent background post-build steps. """
+        steps = self._post_build_pipeline.get_status()
+        if not steps:
+            self.poutput("No post-build steps were run in this session")
+            return
+
+        for step in steps:
+            if step["finished"] is not None and step["started"] is not None:
+                timing = f"{step['finished'] - step['started']:6.1f}s"
+            elif step["started"] is not None:
+                timing = f"{time.time() - step['started']:5.1f}s…"
+            else:
+                timing = " " * 7
+            finished_at = datetime.fromtimestamp(step["finished"] or step["submitted"]).strftime("%H:%M:%S")
+            self.poutput(f"  {finished_at}  {step['scope']:<40} {step['name']:<20} {step['state']:<10} {timing}"
+                         f"{'  ' + step['summary'] if step.get('summary') else ''}")
+
     def do_build(self, arg: str):
         """
         Executes a build based on the dot-separated target notation.
         This command extracts essential build information by querying the solution structure
         and execute the build using its specific toolchain handler.
+        Several targets, or wildcards such as '*' or '<project>.*', build the matching configurations
+        concurrently under a shared jobs budget ('--jobs=<n>', defaults to what the available CPUs and memory allow).
+        Post-build steps such as the libraries exports analysis complete in the background, 'build --status'
+        shows their progress and results.
         """
 
         self.last_result = 1
@@ -1689,60 +1925,30 @@ class CoreBuildShell(CoreModuleInterface, cmd2.Cmd):
             self.perror("Build is disabled when running bare solution mode")
             return
 
+        if arg.strip() == "--status":
+            self._print_post_build_status()
+            self.last_result = 0
+            return
+
         try:
             args = shlex.split(arg)
             if not args:
                 self.perror("Expected: <project>.<configuration> [--flags]")
                 return
 
-            target = args[0]
-            extra_args = args[1:]
+            # Targets come first, followed by the extra flags
+            targets_count = next((index for index, value in enumerate(args) if value.startswith("-")), len(args))
+            patterns, extra_args = args[:targets_count], args[targets_count:]
 
-            if "." not in target:
+            if not patterns or any("." not in pattern and pattern != "*" for pattern in patterns):
                 self.perror("Expected: <project>.<configuration>")
                 return
 
-            parts = target.split(".")
-            if len(parts) != 2:
-                self.perror("Expected exactly 2 parts: <project>.<configuration>")
-                return
-
-            self._tool_box.show_status(message="🔧 Building project...")
-            # self._tool_box.print()
-
-            # Construct 'build profile' object
-            build_profile = BuildProfileType()
-            build_profile.solution_name = self._loaded_solution_name
-            build_profile.project_name, build_profile.config_name = parts
-            build_profile.build_dot_notation = f"{build_profile.solution_name}.{target}"
-            build_profile.extra_args = extra_args  # optionally use this in the builder
-
-            # Fetch build configuration
-            build_profile.config_data = self._solution.query_configurations(
-                project_name=build_profile.project_name,
-                configuration_name=build_profile.config_name
-            )
-
-            if build_profile.config_data:
-                project_data: Optional[dict[str, Any]] = (
-                    self._solution.query_projects(project_name=build_profile.project_name))
-                if project_data:
-                    build_profile.tool_chain_data = project_data.get("tool_chain")
-                    build_profile.build_system = (build_profile.tool_chain_data.get("build_system")
-                                                  if build_profile.tool_chain_data else None)
-
-            if build_profile.build_system:
-                self._logger.debug(
-                    f"Building {build_profile.build_dot_notation}, "
-                    f"using '{build_profile.build_system}' "
-                    f"with extra args: {extra_args}"
-                )
-
-                exit_code = self._loader.execute_build(build_profile=build_profile)
-                self.last_result = exit_code
+            targets = self._expand_build_targets(patterns=patterns)
+            if len(targets) == 1 and targets == patterns:
+                self.last_result = self._build_single(target=targets[0], extra_args=extra_args)
             else:
-                self.perror(f"Solution configuration not found for '{build_profile.build_dot_notation}'")
-                self.last_result = 1
+                self.last_result = self._build_many(targets=targets, extra_args=extra_args)
 
         except Exception as build_error:
             self.perror(f"Build Exception: {build_error}")
@@ -1766,8 +1972,9 @@ class CoreBuildShell(CoreModuleInterface, cmd2.Cmd):
         """
         try:
 
+            # Output is only echoed to the user, allow the platform to take the inherited TTY fast path
             results = self._platform.execute_shell_command(
-                command_and_args=statement.command_and_args, echo_type=TerminalEchoType.LINE)
+                command_and_args=statement.command_and_args, echo_type=TerminalEchoType.LINE, capture_output=False)
 
             self.last_result = results.return_code if results else 0
             return None
@@ -1847,6 +2054,11 @@ class CoreBuildShell(CoreModuleInterface, cmd2.Cmd):
         """Return centralized help data as a JSON string, or None if not yet built."""
         return self._commands_json_data
 
+    @property
+    def post_build_pipeline(self) -> BuildPipeline:
+        """ Get the background post-build steps pipeline """
+        return self._post_build_pipeline
+
     @property
     def max_completion_results(self) -> int:
         """ Get max allowed completion results """
@@ -18,15 +18,16 @@ import sys
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from pathlib import Path
-from typing import Optional, Tuple, Union, Any, TYPE_CHECKING
+from typing import Optional, Tuple, Union, Any, Callable, TYPE_CHECKING
 
 # Third-party
 from colorama import Fore, Style
 
 # AutoForge imports
 from auto_forge import (
-    BuildProfileType, CommandResultType, CoreContext, ModuleInfoType, SDKType,
-    AutoForgeModuleType, AutoForgeWorkModeType, VersionCompare,
+    ArtifactsCache, ArtifactsPublisher, BuildProfileType, BuildResources, CommandResultType, CompilerCache,
+    CoreContext, ElfSymbols, ModuleInfoType, SDKType, AutoForgeModuleType, AutoForgeWorkModeType, ToolProbeCache,
+    VersionCompare,
 )
 
 # Lazy import SDK class instance
@@ -46,14 +47,19 @@ class BuilderArtifactsValidator:
         - 'name': Arbitrary identifier for the artifact group.
         - 'path': Absolute or relative path (can include wildcards).
         - Optional 'recursive': bool (default True for wildcards) — controls glob recursion.
+        - Optional 'copy_to': Destination directory the files are published to, along with 'hard_links' and
+          'verify_hash' (both default False), see ArtifactsPublisher. The manifests of the published files are kept
+          in 'manifests_path' rather than in the destinations.
 
     After validation, exposes a mapping of 'name' to a list of resolved file paths.
     """
 
-    def __init__(self, artifact_list: list[dict]):
+    def __init__(self, artifact_list: list[dict], manifests_path: Optional[Path] = None):
         """ Initializes the BuilderArtifactsValidator class """
         self._artifact_list: Optional[list] = artifact_list
+        self._manifests_path: Optional[Path] = manifests_path
         self._resolved: dict[str, list[Path]] = {}
+        self._published: dict[str, dict[str, int]] = {}
         self._validate_and_resolve()
 
     def _validate_and_resolve(self):
@@ -86,16 +92,22 @@ class BuilderArtifactsValidator:
 
             # If copy_to is specified, perform immediate copy
             if copy_to_path:
-                self._copy_to(group_name=name, destination=copy_to_path, preserve_structure=False)
+                self._copy_to(group_name=name, destination=copy_to_path, preserve_structure=False,
+                              hard_links=bool(artifact.get("hard_links", False)),
+                              verify_hash=bool(artifact.get("verify_hash", False)))
 
-    def _copy_to(self, group_name: str, destination: str, preserve_structure: bool = True):
+    def _copy_to(self, group_name: str, destination: str, preserve_structure: bool = True, hard_links: bool = False,
+                 verify_hash: bool = False):
         """
         Copy all files from the specified group to the destination directory.
+        Files unchanged since the previous copy are skipped, and the rest are cloned, linked or copied concurrently.
         Args:
             group_name (str): The artifact group name.
             destination (str): Destination directory path.
             preserve_structure (bool): If True, recreate folder structure from the
                                        common root down. If False, flatten all files.
+            hard_links (bool): Hard-link the files when on the same filesystem.
+            verify_hash (bool): Compare the files content hash before skipping unchanged looking files.
         """
         if group_name not in self._resolved:
             raise KeyError(f"Group '{group_name}' not found in resolved artifacts.")
@@ -105,9 +117,8 @@ class BuilderArtifactsValidator:
             raise ValueError(f"No files found in group '{group_name}'.")
 
         destination_path = Path(destination).resolve()
-        destination_path.mkdir(parents=True, exist_ok=True)
         common_base_path: Optional[Path] = None
-        files_copied: int = 0
+        publish_files: dict[str, Path] = {}
 
         if preserve_structure:
             try:
@@ -122,13 +133,17 @@ class BuilderArtifactsValidator:
                     relative_subpath = src.parent.relative_to(common_base_path)
                 except ValueError:
                     raise ValueError(f"File {src} is not under common base path {common_base_path}")
-                dest_dir = destination_path / relative_subpath
+                relative_name = str(relative_subpath / src.name)
             else:
-                dest_dir = destination_path
+                relative_name = src.name
 
-            dest_dir.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dest_dir / src.name)
-            files_copied += 1
+            publish_files[relative_name] = src  # When flattened, the last file of a given name wins
+
+        publisher = ArtifactsPublisher(destination=str(destination_path),
+                                       manifests_path=str(self._manifests_path) if self._manifests_path else None,
+                                       hard_links=hard_links, verify_hash=verify_hash)
+        self._published[group_name] = publisher.publish(
+            files=[(src, relative_name) for relative_name, src in publish_files.items()], group_name=group_name)
 
     def get_resolved_artifacts(self) -> dict[str, list[Path]]:
         """
@@ -137,6 +152,14 @@ class BuilderArtifactsValidator:
         """
         return self._resolved
 
+    def get_published_artifacts(self) -> dict[str, dict[str, int]]:
+        """
+        Returns:
+            dict[str, dict[str, int]]: Mapping of artifact name to the publishing summary of its 'copy_to' files,
+                see 'ArtifactsPublisher.publish()'.
+        """
+        return self._published
+
 
 class BuilderToolChain:
     """
@@ -153,6 +176,7 @@ class BuilderToolChain:
         """
         self._toolchain = toolchain
         self._resolved_tools: dict[str, str] = {}
+        self._detected_versions: dict[str, Optional[str]] = {}
         self._builder_instance = builder_instance
         self._registry = self._builder_instance.sdk.registry
         self._tool_box = self._builder_instance.sdk.tool_box
@@ -160,6 +184,13 @@ class BuilderToolChain:
         if self._tool_box is None:
             raise RuntimeError("unable to instantiate dependent core module")
 
+        # Tools versions are probed once and cached until the binaries change
+        configuration = CoreContext.get_config_provider().configuration
+        probes_file: Optional[str] = configuration.get("build_toolchain_probes_file")
+        self._probe_cache: Optional[ToolProbeCache] = (
+            ToolProbeCache(cache_file=self._builder_instance.sdk.variables.expand(key=probes_file))
+            if probes_file else None)
+
     def validate(self, show_help_on_error: bool = False) -> Optional[bool]:
         """
         Validates the toolchain structure and required tools specified by the solution.
@@ -184,14 +215,22 @@ class BuilderToolChain:
         for name, definition in tools.items():
             if not isinstance(definition, dict):
                 raise ValueError(f"Tool '{name}' definition must be a dictionary")
+            tool_path = definition.get("path")
+            if not tool_path or not definition.get("version"):
+                raise ValueError(f"toolchain element '{tool_path}' must define 'path' and 'version' fields")
 
+        # Probe all the tools versions upfront, cached versions are reused and the rest are probed concurrently
+        if self._probe_cache is not None:
+            tool_paths = [definition["path"] if os.path.isabs(definition["path"]) else shutil.which(definition["path"])
+                          for definition in tools.values()]
+            self._detected_versions = self._probe_cache.get_versions([path for path in tool_paths if path])
+            self._probe_cache.save()
+
+        for name, definition in tools.items():
             tool_path = definition.get("path")
             version_expr = definition.get("version")
             help_path = definition.get("help")
 
-            if not tool_path or not version_expr:
-                raise ValueError(f"toolchain element '{tool_path}' must define 'path' and 'version' fields")
-
             resolved_t_tool_path = self._resolve_tool([tool_path], version_expr)
             if not resolved_t_tool_path:
                 # If we have to auto show help
@@ -240,7 +279,11 @@ class BuilderToolChain:
                                                      log_level=logging.ERROR)
                 continue
 
-            version_ok, detected_version = self._version_ok(path, version_expr)
+            if self._detected_versions.get(path) is not None:
+                version_ok, detected_version = VersionCompare().compare(detected=self._detected_versions[path],
+                                                                        expected=version_expr)
+            else:
+                version_ok, detected_version = self._version_ok(path, version_expr)
             if not version_ok:
                 base_name = os.path.basename(path)
                 if detected_version:
@@ -279,6 +322,11 @@ class BuilderToolChain:
         """ Gets the resolved tools dictionary """
         return self._resolved_tools
 
+    @property
+    def versions(self) -> dict[str, Optional[str]]:
+        """ Gets the probed version of every resolved tool, None when it was not probed """
+        return {name: self._detected_versions.get(path) for name, path in self._resolved_tools.items()}
+
 
 class BuildLogAnalyzerInterface(ABC):
     """
@@ -293,6 +341,10 @@ class BuildLogAnalyzerInterface(ABC):
         self._core_logger = self.sdk.logger
         self._logger = self.sdk.logger.get_logger(name="GCCAnalyzer")
 
+        # Streaming state used by the default 'start_stream' / 'feed' / 'end_stream' implementation
+        self._stream_lines: Optional[list[str]] = None
+        self._stream_kwargs: dict[str, Any] = {}
+
     @abstractmethod
     def analyze(self, log_source: Union[Path, str],
                 context_file_name: Optional[str] = None,
@@ -319,6 +371,61 @@ class BuildLogAnalyzerInterface(ABC):
         """
         raise NotImplementedError("Subclasses must implement the 'analyze' method.")
 
+    def start_stream(self, context_file_name: Optional[str] = None,
+                     ai_response_file_name: Optional[str] = None,
+                     ai_auto_advise: Optional[bool] = False,
+                     toolchain: Optional[dict[str, Any]] = None,
+                     max_errors: int = 0,
+                     baseline_file_name: Optional[str] = None,
+                     baseline_scope: Optional[str] = None) -> None:
+        """
+        Prepares the analyzer to receive build output line by line while the build is running.
+        The default implementation only buffers the lines and runs 'analyze' once the stream ends,
+        analyzers that can parse incrementally should override 'start_stream', 'feed' and 'end_stream'.
+        Args:
+            context_file_name: Path to store structured diagnostics (JSON).
+            ai_response_file_name: Path for AI response Markdown (optional).
+            ai_auto_advise: Auto forward the error context to an AI
+            toolchain: The tool-chain dictionary used to during this build.
+            max_errors: Request the build to stop after this many errors, 0 to never stop.
+            baseline_file_name: Optional diagnostics baseline database, ignored by the default implementation.
+            baseline_scope: Baseline scope, typically the build dot notation.
+        """
+        self._stream_lines = []
+        self._stream_kwargs = dict(context_file_name=context_file_name, ai_response_file_name=ai_response_file_name,
+                                   ai_auto_advise=ai_auto_advise, toolchain=toolchain)
+
+    def feed(self, line: str) -> bool:
+        """
+        Feeds a single line of build output to the analyzer.
+        Designed to be used as the 'line_sink' of 'CorePlatform.execute_shell_command()'.
+        Args:
+            line: A single line of build output, stripped of ANSI sequences.
+        Returns:
+            bool: False to request the build to stop early, True otherwise.
+        """
+        if self._stream_lines is not None:
+            self._stream_lines.append(line)
+        return True
+
+    def end_stream(self, ai_auto_advise: Optional[bool] = None) -> Optional[list[dict]]:
+        """
+        Finalizes a streamed analysis, exports the diagnostics and optionally triggers the AI request.
+        Args:
+            ai_auto_advise: Optionally override the value given to 'start_stream'.
+        Returns:
+            List of structured diagnostic dictionaries, or None if no diagnostics found.
+        """
+        if self._stream_lines is None:
+            return None
+
+        log_source = "\n".join(self._stream_lines)
+        kwargs = dict(self._stream_kwargs)
+        if ai_auto_advise is not None:
+            kwargs["ai_auto_advise"] = ai_auto_advise
+        self._stream_lines = None
+        return self.analyze(log_source=log_source, **kwargs)
+
     @property
     def sdk(self) -> SDKType:
         """
@@ -336,6 +443,10 @@ class BuilderRunnerInterface(ABC):
     Abstract base class for builder instances that can be dynamically registered and executed by AutoForge.
     """
 
+    # Set by a parent process running several builds concurrently, so each build writes its reports to
+    # '$BUILD_LOGS/<scope>' rather than overwriting the reports of its siblings
+    REPORTS_SCOPE_ENV = "AF_BUILD_REPORTS_SCOPE"
+
     def __init__(self, build_system: Optional[str] = None, build_label: Optional[str] = None):
         """
         Initializes the builder and registers it with the AutoForge registry.
@@ -349,6 +460,10 @@ class BuilderRunnerInterface(ABC):
 
         self._registry = self.sdk.registry
         self._build_context_file: Optional[Path] = None
+        self._artifacts_manifests_path: Optional[Path] = None
+        self._build_diagnostics_db_file: Optional[Path] = None
+        self._build_resources: Optional[BuildResources] = None
+        self._elf_symbols: Optional[ElfSymbols] = None
         self.build_logs_path: Optional[Path] = None
 
         # Probe caller globals for command description and name
@@ -389,10 +504,23 @@ class BuilderRunnerInterface(ABC):
             duplicate_symbols_file: str = self._configuration.get("build_duplicate_symbols_file",
                                                                   "build_duplicate_symbols.json")
             ai_response_file: str = self._configuration.get("build_ai_response_file", "build_ai_response.md")
-
-            self._build_context_file = self.build_logs_path / context_file
-            self._build_duplicate_symbols_file = self.build_logs_path / duplicate_symbols_file
-            self._build_ai_response_file = self.build_logs_path / ai_response_file
+            diagnostics_db_file: str = self._configuration.get("build_diagnostics_db_file", "build_diagnostics.db")
+            resources_file: str = self._configuration.get("build_resources_file", "build_resources.json")
+            elf_symbols_file: str = self._configuration.get("build_elf_symbols_file", "build_elf_symbols.json")
+            manifests_path: str = self._configuration.get("build_artifacts_manifests_path", "artifacts_manifests")
+
+            reports_path = self.build_logs_path
+            if os.environ.get(self.REPORTS_SCOPE_ENV):
+                reports_path = self.build_logs_path / os.environ[self.REPORTS_SCOPE_ENV]
+                reports_path.mkdir(parents=True, exist_ok=True)
+
+            self._build_context_file = reports_path / context_file
+            self._build_duplicate_symbols_file = reports_path / duplicate_symbols_file
+            self._build_ai_response_file = reports_path / ai_response_file
+            self._build_diagnostics_db_file = self.build_logs_path / diagnostics_db_file  # Persistent, never erased
+            self._build_resources = BuildResources(profile_file=str(self.build_logs_path / resources_file))
+            self._elf_symbols = ElfSymbols(cache_file=str(self.build_logs_path / elf_symbols_file))  # Persistent
+            self._artifacts_manifests_path = self.build_logs_path / manifests_path  # Persistent
 
             # Erase them
             self._build_context_file.unlink(missing_ok=True)
@@ -426,6 +554,96 @@ class BuilderRunnerInterface(ABC):
 
         return self._module_info
 
+    def get_compiler_cache(self, build_profile: BuildProfileType) -> Optional[CompilerCache]:
+        """
+        Resolves the compiler launcher (ccache / sccache) of a build. The launcher is taken from the build
+        configuration 'compiler_launcher' property, or from the package configuration, and uses a cache
+        directory dedicated to the solution.
+        Args:
+            build_profile (BuildProfileType): The build profile.
+        Returns:
+            Optional[CompilerCache]: The compiler cache, None when disabled or no launcher was found.
+        """
+        config = build_profile.config_data or {}
+        launcher = config.get("compiler_launcher", self._configuration.get("compiler_launcher", "auto"))
+        cache_path: Optional[str] = self._configuration.get("compiler_cache_path")
+        if not launcher or not cache_path:
+            return None
+
+        cache_path = os.path.join(self.sdk.variables.expand(key=cache_path), build_profile.solution_name or "default")
+        return CompilerCache.find(cache_path=cache_path, max_size=self._configuration.get("compiler_cache_size"),
+                                  launcher=launcher)
+
+    def get_artifacts_cache(self, build_profile: BuildProfileType, toolchain: BuilderToolChain,
+                            build_path: Path) -> tuple[Optional[ArtifactsCache], Optional[str]]:
+        """
+        Resolves the artifacts cache of a build and its cache key. Caching is opt-in: a build configuration must list
+        every directory its build reads in 'cache_source_paths', and is skipped when disabled in the package
+        configuration or with a build configuration 'artifacts_cache' property set to false.
+        Args:
+            build_profile (BuildProfileType): The build profile.
+            toolchain (BuilderToolChain): The validated toolchain of the build.
+            build_path (Path): The build directory, left out of the sources hash.
+        Returns:
+            tuple[Optional[ArtifactsCache], Optional[str]]: The cache and the key, None when caching is skipped.
+        """
+        config = build_profile.config_data or {}
+        cache_path: Optional[str] = self._configuration.get("artifacts_cache_path")
+        workspace_path: Optional[str] = self.sdk.variables.get("PROJ_WORKSPACE", quiet=True)
+        if not cache_path or not workspace_path or config.get("artifacts_cache") is False:
+            return None, None
+
+        # Only the configuration knows everything its build reads (shared sources, generated or ignored headers, ...),
+        # without that list a cached build could never be told apart from a stale one
+        source_paths = [str(path) for path in (config.get("cache_source_paths") or []) if path]
+        if not source_paths or not config.get("artifacts"):
+            return None, None
+
+        artifacts_cache = ArtifactsCache(cache_path=self.sdk.variables.expand(key=cache_path),
+                                         workspace_path=workspace_path)
+        source_hash = artifacts_cache.get_source_hash(
+            source_paths=[self._tool_box.get_expanded_path(path) for path in source_paths],
+            exclude_paths=[str(build_path)])
+        if source_hash is None:
+            return None, None
+        return artifacts_cache, artifacts_cache.get_key(config=config, tools=toolchain.tools,
+                                                        tool_versions=toolchain.versions, source_hash=source_hash)
+
+    def submit_post_build_step(self, build_profile: BuildProfileType, name: str,
+                               function: Callable[[], Optional[str]]) -> None:
+        """
+        Runs a post-build step which isn't needed to use the build outputs, such as an analysis or a report,
+        in the background of the prompt. Automated sessions, which may exit as soon as the build returns,
+        run it in place.
+        Args:
+            build_profile (BuildProfileType): The build profile the step belongs to.
+            name (str): Short step description, e.g. 'exports analysis'.
+            function (Callable[[], Optional[str]]): The step, returning an optional one line summary.
+        """
+        if self.sdk.auto_forge.work_mode != AutoForgeWorkModeType.NON_INTERACTIVE_AUTOMATION:
+            self.sdk.build_shell.post_build_pipeline.submit(scope=build_profile.build_dot_notation, name=name,
+                                                            function=function)
+            return
+
+        try:
+            summary = function()
+            if summary:
+                self.print_message(message=f"Post-build {name}: {summary}", log_level=logging.INFO)
+        except Exception as step_error:
+            self.print_message(message=f"Post-build {name} failed: {step_error}", log_level=logging.WARNING)
+
+    def wait_post_build_steps(self, build_profile: BuildProfileType) -> None:
+        """
+        Waits for the background post-build steps of a previous build of the same scope, which may still be
+        reading the outputs the build is about to overwrite.
+        Args:
+            build_profile (BuildProfileType): The build profile about to be built.
+        """
+        pipeline = self.sdk.build_shell.post_build_pipeline
+        if not pipeline.wait(scope=build_profile.build_dot_notation, timeout=0):
+            self.print_message(message="Waiting for the post-build steps of the previous build..")
+            pipeline.wait(scope=build_profile.build_dot_notation)
+
     def print_build_results(self, results: Optional[CommandResultType], raise_exception: bool = True) -> Optional[int]:
         """
         Handle and report the result of a build command.
@@ -450,124 +668,104 @@ class BuilderRunnerInterface(ABC):
 
     def analyze_library_exports(self,
                                 path: str,
-                                nm_tool_name: str = "nm",
-                                max_libs: int = 50,
-                                json_report_path: Optional[str] = None) -> dict[str, list[str]]:
+                                nm_tool_name: Optional[str] = None,
+                                max_libs: Optional[int] = None,
+                                json_report_path: Optional[str] = None,
+                                quiet: bool = False) -> dict[str, list[str]]:
         """
         Analyzes exported symbols from .so files in the given directory and optionally
         exports a JSON report of the analysis.
+        The dynamic symbol tables are read in-process and concurrently, libraries which didn't change since
+        a previous analysis are served from the ELF symbols cache.
 
         Args:
             path (str): The root path to search for .so files.
-            nm_tool_name (str): The tool to use for extracting symbols (e.g., 'nm', 'readelf').
-                                Defaults to 'nm'.
-            max_libs (int): The maximum number of .so files to process. Defaults to 50.
+            nm_tool_name (Optional[str]): Deprecated and ignored, the symbols are no longer extracted by an
+                                          external tool. Kept for compatibility with existing callers.
+            max_libs (Optional[int]): The maximum number of .so files to process. Defaults to None (all).
             json_report_path (Optional[str]): If provided, the path where the JSON report
                                              of the analysis results will be saved.
                                              Defaults to None (no JSON report).
+            quiet (bool): Only log the analysis messages, used when the analysis runs in the background.
 
         Returns:
             dict[str, list[str]]: A dictionary mapping .so file paths to a list of their exported
                                  function names.
         """
         if not os.path.isdir(path):
-            self.print_message(message=f"Error: Provided path '{path}' is not a valid directory.",
-                               log_level=logging.ERROR)
+            self._print_analysis_message(message=f"Error: Provided path '{path}' is not a valid directory.",
+                                         log_level=logging.ERROR, quiet=quiet)
             return {}
 
-        try:
-            subprocess.run([nm_tool_name, '--version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            self.print_message(
-                message=f"Error: The tool '{nm_tool_name}' was not found or is not executable. "
-                        "Please ensure it's installed and in your system's PATH.",
-                log_level=logging.ERROR
+        library_files: list[str] = []
+        for root, _, files in os.walk(path):
+            library_files.extend(os.path.join(root, file_name) for file_name in sorted(files)
+                                 if file_name.endswith(".so"))
+        if max_libs is not None and len(library_files) > max_libs:
+            self._print_analysis_message(
+                message=f"Reached maximum limit of {max_libs} libraries, {len(library_files) - max_libs} skipped.",
+                log_level=logging.INFO,
+                quiet=quiet
             )
-            return {}
+            library_files = library_files[:max_libs]
 
         so_exports: dict[str, list[str]] = {}
+        so_undefined: dict[str, list[str]] = {}
         seen_symbols: dict[str, list[str]] = defaultdict(list)
-        processed_libs = 0
+        elf_symbols = self._elf_symbols if self._elf_symbols is not None else ElfSymbols()
+
+        for full_path, symbols in elf_symbols.scan(paths=library_files).items():
+            if symbols is None:
+                self._print_analysis_message(
+                    message=f"Warning: Failed to analyze '{full_path}', not a readable ELF shared library.",
+                    log_level=logging.WARNING,
+                    quiet=quiet
+                )
+                continue
 
-        for root, _, files in os.walk(path):
-            for file_name in files:
-                if file_name.endswith(".so"):
-                    full_path = os.path.join(root, file_name)
-                    if processed_libs >= max_libs:
-                        self.print_message(
-                            message=f"Reached maximum limit of {max_libs} libraries. Stopping scan.",
-                            log_level=logging.INFO
-                        )
-                        break
-
-                    try:
-                        result = subprocess.run(
-                            [nm_tool_name, '-D', '-g', '--defined-only', full_path],
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.DEVNULL,
-                            text=True,
-                            check=True,
-                            timeout=30
-                        )
-                        symbols: list[str] = []
-                        for line in result.stdout.splitlines():
-                            parts = line.strip().split()
-                            if len(parts) >= 3 and parts[-2] in ('T', 't'):
-                                symbol_name = parts[-1]
-                                symbols.append(symbol_name)
-                                seen_symbols[symbol_name].append(full_path)
-
-                        so_exports[full_path] = symbols
-                        processed_libs += 1
-
-                    except subprocess.CalledProcessError as e:
-                        self.print_message(
-                            message=f"Warning: Failed to analyze '{full_path}'. Error: {e}",
-                            log_level=logging.WARNING
-                        )
-                    except subprocess.TimeoutExpired:
-                        self.print_message(
-                            message=f"Warning: Analysis of '{full_path}' timed out.",
-                            log_level=logging.WARNING
-                        )
-                    except Exception as e:
-                        self.print_message(
-                            message=f"An unexpected error occurred while processing '{full_path}': {e}",
-                            log_level=logging.ERROR
-                        )
-            if processed_libs >= max_libs:
-                break
+            so_exports[full_path] = symbols.exported
+            so_undefined[full_path] = symbols.undefined
+            for symbol_name in dict.fromkeys(symbols.exported):  # Versioned symbols may repeat a name
+                seen_symbols[symbol_name].append(full_path)
+
+        processed_libs = len(so_exports)
 
         # Generate and save JSON report if json_report_path is provided
         if json_report_path:
-            self._export_symbol_conflicts_report(so_exports, seen_symbols, processed_libs, json_report_path)
+            self._export_symbol_conflicts_report(so_exports, seen_symbols, processed_libs, json_report_path, quiet,
+                                                 so_undefined)
 
-        self._report_symbol_conflicts(seen_symbols, processed_libs)
+        self._report_symbol_conflicts(seen_symbols, processed_libs, quiet)
         return so_exports
 
-    def _report_symbol_conflicts(self, seen_symbols: dict[str, list[str]], processed_libs: int):
+    def _report_symbol_conflicts(self, seen_symbols: dict[str, list[str]], processed_libs: int, quiet: bool = False):
         """
         Reports any duplicate symbols found across libraries.
         """
         conflicts = {sym: paths for sym, paths in seen_symbols.items() if len(paths) > 1}
 
         if conflicts:
-            self.print_message(message="Duplicate Symbols Detected", log_level=logging.WARNING)
+            self._print_analysis_message(message="Duplicate Symbols Detected", log_level=logging.WARNING, quiet=quiet)
             for sym, libs in conflicts.items():
-                self.print_message(message=f"Symbol '{sym}' found in multiple libraries", log_level=logging.WARNING)
+                self._print_analysis_message(message=f"Symbol '{sym}' found in multiple libraries",
+                                             log_level=logging.WARNING, quiet=quiet)
                 for lib_full_path in libs:
-                    self.print_message(message=f"> {os.path.basename(lib_full_path)}", log_level=logging.WARNING)
+                    self._print_analysis_message(message=f"> {os.path.basename(lib_full_path)}",
+                                                 log_level=logging.WARNING, quiet=quiet)
         else:
-            self.print_message(
+            self._print_analysis_message(
                 message=f"✅ No duplicate symbols found across {processed_libs} libraries.",
-                log_level=logging.INFO
+                log_level=logging.INFO,
+                quiet=quiet
             )
 
     def _export_symbol_conflicts_report(self,
                                         so_exports: dict[str, list[str]],
                                         seen_symbols: dict[str, list[str]],
                                         processed_libs: int,
-                                        report_path: str):
+                                        report_path: str,
+                                        quiet: bool = False,
+                                        so_undefined: Optional[dict[str, list[str]]] = None):
         """
         Generates and saves a JSON report of the library analysis.
         """
@@ -579,20 +777,28 @@ class BuilderRunnerInterface(ABC):
                 "duplicate_symbols_found": bool(conflicts)
             },
             "exported_symbols_by_library": so_exports,
+            "undefined_symbols_by_library": so_undefined or {},
             "symbol_conflicts": conflicts
         }
 
         try:
             with open(report_path, 'w', encoding='utf-8') as f:
                 json.dump(report_data, f, indent=4, ensure_ascii=False)
-            self.print_message(message=f"JSON report successfully exported to: {report_path}",
-                               log_level=logging.INFO)
+            self._print_analysis_message(message=f"JSON report successfully exported to: {report_path}",
+                                         log_level=logging.INFO, quiet=quiet)
         except IOError as e:
-            self.print_message(message=f"Error: Could not write JSON report to '{report_path}'. Error: {e}",
-                               log_level=logging.ERROR)
+            self._print_analysis_message(message=f"Error: Could not write JSON report to '{report_path}'. Error: {e}",
+                                         log_level=logging.ERROR, quiet=quiet)
         except Exception as e:
-            self.print_message(message=f"An unexpected error occurred while generating JSON report: {e}",
-                               log_level=logging.ERROR)
+            self._print_analysis_message(message=f"An unexpected error occurred while generating JSON report: {e}",
+                                         log_level=logging.ERROR, quiet=quiet)
+
+    def _print_analysis_message(self, message: str, log_level: int, quiet: bool = False) -> None:
+        """ Prints a libraries analysis message, or only logs it when the analysis runs in the background. """
+        if quiet:
+            self._logger.log(log_level, self._tool_box.strip_ansi(text=message, bare_text=True))
+        else:
+            self.print_message(message=message, log_level=log_level)
 
     def print_message(self, message: str, log_level: Optional[int] = logging.DEBUG) -> None:
         """
@@ -14,9 +14,12 @@ Description:
 """
 
 import codecs
+import copy
 import difflib
 import fcntl
 import fnmatch
+import hashlib
+import heapq
 import inspect
 import json
 import os
@@ -27,15 +30,19 @@ import shlex
 import shutil
 import subprocess
 import sys
+import threading
 import time
 import urllib.request
 import zipfile
 from collections import deque
 from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from contextlib import suppress
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional, Union, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Optional, Union, Tuple
 
 # Third-party
 from colorama import Fore, Style
@@ -45,13 +52,53 @@ from auto_forge import (
     AddressInfoType, AutoForgeModuleType, AutoForgeWorkModeType, CommandFailedException,
     CommandResultType, CoreDynamicLoader, CoreJSONCProcessor, CoreLinuxAliases, CoreLogger,
     CoreModuleInterface, CoreRegistry, CoreSystemInfo, CoreTelemetry, CoreToolBox,
-    CoreVariables, CoreWatchdog, PackageGlobals, ProgressTracker, SequenceErrorActionType,
-    TerminalEchoType, VersionCompare,
+    CoreVariables, CoreWatchdog, DownloadEngine, GitMirrorCache, HTTPSession, PackageGlobals, ProgressTracker,
+    PythonWheelhouse, SequenceCheckpoint, SequenceErrorActionType, SequenceJournal, TerminalEchoType, VenvSnapshots,
+    VersionCompare,
 )
 
 AUTO_FORGE_MODULE_NAME = "Platform"
 AUTO_FORGE_MODULE_DESCRIPTION = "Platform Services"
 
+# Sequence methods whose effect persists in the workspace, so an unchanged step could be skipped. In-process steps
+# (e.g. 'environment_variable_set') and conditional steps, whose outcome depends on live state, must always run.
+_SEQUENCE_CACHEABLE_METHODS = frozenset({
+    "decompress", "git_checkout_revision", "git_clone_repo", "git_get_path_from_url", "path_create",
+    "python_package_add", "python_update_pip", "python_virtualenv_create", "url_get", "url_get_many",
+})
+# Methods with arbitrary effects, only skipped when their step explicitly sets '"cache": true'
+_SEQUENCE_OPT_IN_CACHEABLE_METHODS = frozenset({"execute_cli_command", "execute_shell_command"})
+# Methods whose effect only lives in this process, which a resumed run must execute again
+_SEQUENCE_IN_PROCESS_METHODS = frozenset({"conditional", "environment_append_to_path", "environment_variable_set"})
+
+
+@dataclass(frozen=True)
+class _MethodCall:
+    """ A method resolved by its name, along with its bound keyword arguments. """
+    method_name: str
+    method: Callable
+    kwargs: Mapping[str, Any]
+
+
+@dataclass
+class _SequenceStep:
+    """ A single sequence step, as a node in the execution graph. """
+    step_id: str
+    number: int  # 1-based position among the enabled steps
+    data: dict[str, Any]
+    depends_on: list[str] = field(default_factory=list)
+    start_time: float = 0.0
+    end_time: float = 0.0
+    fingerprint: Optional[str] = None
+    expanded_arguments: Any = None
+    cached: bool = False
+    method_name: Optional[str] = None
+    call: Optional[_MethodCall] = None  # None for dynamically executed (conditional) steps
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, self.end_time - self.start_time)
+
 
 class CorePlatform(CoreModuleInterface):
     """
@@ -69,11 +116,31 @@ class CorePlatform(CoreModuleInterface):
         self._status_add_time_prefix: bool = True
         self._status_new_line: bool = False
         self._running_sequence: bool = False
-        self._tracker: Optional[ProgressTracker] = None
+        self._tracker_instance: Optional[ProgressTracker] = None
+        self._tracker_thread_id: Optional[int] = None
+        self._sequence_has_dependencies: bool = False
+        self._sequence_journal: Optional[SequenceJournal] = None
+        self._sequence_force: bool = False
+        self._method_signatures: dict[str, inspect.Signature] = {}
         self._variables: Optional[CoreVariables] = None
 
         super().__init__(*args, **kwargs)
 
+    @property
+    def _tracker(self) -> Optional[ProgressTracker]:
+        """
+        The sequence progress tracker, visible only to the thread that owns it. Steps running concurrently
+        in the sequence worker pool run silently so they can't garble the status lines.
+        """
+        if self._tracker_thread_id is not None and self._tracker_thread_id != threading.get_ident():
+            return None
+        return self._tracker_instance
+
+    @_tracker.setter
+    def _tracker(self, tracker: Optional[ProgressTracker]) -> None:
+        self._tracker_instance = tracker
+        self._tracker_thread_id = threading.get_ident() if tracker is not None else None
+
     def _initialize(self, workspace_path: str) -> None:
         """
         Initialize the 'Platform' class.
@@ -123,6 +190,22 @@ class CorePlatform(CoreModuleInterface):
         self._subprocess_execution_timeout = self._configuration.get("subprocess_execution_timeout",
                                                                      self._subprocess_execution_timeout)
 
+        # Downloads engine settings, the cache is shared between workspaces
+        self._download_cache_path: Optional[str] = self._configuration.get("download_cache_path")
+        self._download_max_connections: int = self._configuration.get("download_max_connections", 4)
+        self._http_sessions: dict[tuple[Optional[str], Optional[str]], HTTPSession] = {}
+        self._http_sessions_lock = threading.Lock()
+
+        # Local bare mirrors of cloned repositories, shared between workspaces
+        self._git_mirrors_path: Optional[str] = self._configuration.get("git_mirrors_path")
+
+        # Pre-built wheels, allowing offline installs of previously installed requirement sets
+        self._python_wheelhouse_path: Optional[str] = self._configuration.get("python_wheelhouse_path")
+
+        # Ready to use virtual environments, restored instead of being recreated for every workspace
+        self._venv_snapshots_path: Optional[str] = self._configuration.get("venv_snapshots_path")
+        self._venv_snapshot_plans: dict[str, dict[str, Any]] = {}  # Environments whose packages later steps install
+
         # Register this module with the package registry
         self._registry.register_module(name=AUTO_FORGE_MODULE_NAME, description=AUTO_FORGE_MODULE_DESCRIPTION,
                                        auto_forge_module_type=AutoForgeModuleType.CORE)
@@ -308,16 +391,19 @@ class CorePlatform(CoreModuleInterface):
             _result: Optional[CommandResultType] = None
             for i, sub_step in enumerate(steps):
                 try:
-                    self._tracker.set_pre(text=sub_step.get("description"), new_line=True)
+                    if self._tracker is not None:
+                        self._tracker.set_pre(text=sub_step.get("description"), new_line=True)
                     _result = self.execute_python_method(
                         method_name=sub_step.get("method"),
                         arguments=sub_step.get("arguments")
                     )
                     if _result.return_code != 0:
                         raise RuntimeError(f"Inline step failed: {sub_step.get('description')}")
-                    self._tracker.set_result(text="OK", status_code=0)
+                    if self._tracker is not None:
+                        self._tracker.set_result(text="OK", status_code=0)
                 except Exception as err:
-                    self._tracker.set_result(text="FAILED", status_code=1)
+                    if self._tracker is not None:
+                        self._tracker.set_result(text="FAILED", status_code=1)
                     raise RuntimeError(
                         f"Failed inline step {i + 1} inside conditional block at step {parent_step_number + 1}: {err}"
                     ) from err
@@ -344,7 +430,8 @@ class CorePlatform(CoreModuleInterface):
                 raise RuntimeError(
                     f"Condition failed in step {step_number + 1}, but no 'if_false' steps were defined."
                 )
-            self._tracker.set_result(text="NO", status_code=1)
+            if self._tracker is not None:
+                self._tracker.set_result(text="NO", status_code=1)
             return _run_inline_steps(if_false_steps, step_number)
 
     def initialize_workspace(self, delete_existing: bool = False, must_be_empty: bool = False,
@@ -597,21 +684,25 @@ class CorePlatform(CoreModuleInterface):
         if searched_token not in env_value:
             raise ValueError(f"token '{searched_token}' not found in environment variable '{name}'.")
 
-    def execute_python_method(self, method_name: str,
-                              arguments: Optional[Union[str, dict]] = None,
-                              quiet: bool = False) -> Optional[CommandResultType]:
+    def _get_method_signature(self, method_name: str, method: Callable) -> inspect.Signature:
+        """ Returns the signature of one of this class methods, introspected once and cached. """
+        signature = self._method_signatures.get(method_name)
+        if signature is None:
+            signature = inspect.signature(method)
+            self._method_signatures[method_name] = signature
+        return signature
+
+    def _bind_python_method(self, method_name: str, arguments: Optional[Union[str, dict]] = None,
+                            strict: bool = False) -> _MethodCall:
         """
-        Dynamically execute an arbitrary method using its name and arguments read from JSON step.
+        Resolves a method by its name and binds the arguments read from a JSON step to its signature.
         Args:
             method_name (str): The name of the python method from this class to be invoked.
             arguments (str or dict, optional): JSON string or dictionary with arguments for the method call.
-            quiet (bool): If False, raise an exception on unresolved variables; otherwise, log and continue.
+            strict (bool): Reject unknown arguments and validate that all the required ones are provided.
         Returns:
-            Optional[CommandResultType]: A result object containing the command output and return code,
-            or None if an exception was raised.
+            _MethodCall: The bound call, ready to be invoked.
         """
-        results: Any = None
-
         # Decode arguments if passed as a JSON string
         if isinstance(arguments, str):
             try:
@@ -624,12 +715,12 @@ class CorePlatform(CoreModuleInterface):
             arguments = {}
 
         # Retrieve the method
-        method = getattr(self, method_name, None)
+        method = getattr(self, method_name, None) if isinstance(method_name, str) else None
         if not callable(method):
             raise ValueError(f"Method '{method_name}' not found in '{self.__class__.__name__}'")
 
         # Analyze method signature
-        method_signature = inspect.signature(method)
+        method_signature = self._get_method_signature(method_name, method)
         params = list(method_signature.parameters.values())
 
         # Wrap if method expects single 'arguments' param
@@ -646,11 +737,31 @@ class CorePlatform(CoreModuleInterface):
             kwargs=arguments, sig=method_signature
         )
 
-        self._logger.debug(f"Executing Python method: '{method.__name__}'")
+        if strict:
+            if extra_kwargs:
+                raise TypeError(f"unexpected argument(s) for '{method_name}': {', '.join(extra_kwargs)}")
+            try:
+                method_signature.bind(**method_kwargs)
+            except TypeError as bind_error:
+                raise TypeError(f"invalid arguments for '{method_name}': {bind_error}") from bind_error
+
+        return _MethodCall(method_name=method_name, method=method, kwargs=MappingProxyType(method_kwargs))
+
+    def _invoke_python_method(self, call: _MethodCall, quiet: bool = False) -> Optional[CommandResultType]:
+        """
+        Invokes a bound method call and normalizes its results.
+        Args:
+            call (_MethodCall): The bound call.
+            quiet (bool): If False, raise an exception on errors; otherwise, log and continue.
+        Returns:
+            Optional[CommandResultType]: A result object containing the command output and return code.
+        """
+        results: Any = None
+        self._logger.debug(f"Executing Python method: '{call.method.__name__}'")
 
         # Call the method and handle return types
         try:
-            results = method(**method_kwargs)
+            results = call.method(**call.kwargs)
             if isinstance(results, CommandResultType):
                 return results
             elif isinstance(results, str):
@@ -663,7 +774,7 @@ class CorePlatform(CoreModuleInterface):
             results = execution_error.results
 
             if isinstance(results, CommandResultType):
-                command_prefix = f"command '{results.command}'" if results.command else f"method '{method_name}()'"
+                command_prefix = f"command '{results.command}'" if results.command else f"method '{call.method_name}()'"
                 exception_message = f"{command_prefix} returned {results.return_code}, message: {results.message}"
             else:
                 exception_message = f"caught execution exception with no data"
@@ -683,6 +794,22 @@ class CorePlatform(CoreModuleInterface):
                     results = CommandResultType().return_code = 1
                 return results
 
+    def execute_python_method(self, method_name: str,
+                              arguments: Optional[Union[str, dict]] = None,
+                              quiet: bool = False) -> Optional[CommandResultType]:
+        """
+        Dynamically execute an arbitrary method using its name and arguments read from JSON step.
+        Args:
+            method_name (str): The name of the python method from this class to be invoked.
+            arguments (str or dict, optional): JSON string or dictionary with arguments for the method call.
+            quiet (bool): If False, raise an exception on unresolved variables; otherwise, log and continue.
+        Returns:
+            Optional[CommandResultType]: A result object containing the command output and return code,
+            or None if an exception was raised.
+        """
+        call = self._bind_python_method(method_name=method_name, arguments=arguments)
+        return self._invoke_python_method(call=call, quiet=quiet)
+
     def execute_cli_command(self, command: str, arguments: str, expected_return_code: int = 0,
                             suppress_output: bool = False) -> Optional[CommandResultType]:
         """
@@ -715,7 +842,10 @@ class CorePlatform(CoreModuleInterface):
             shell: bool = True, cwd: Optional[str] = None, env: Optional[Mapping[str, str]] = None,
             max_read_chunk: Optional[int] = 1024, apply_colorization: Optional[bool] = False,
             expand_command: Optional[bool] = False,
-            override_interactive: Optional[bool] = None) -> Optional[CommandResultType]:
+            override_interactive: Optional[bool] = None,
+            capture_output: Optional[bool] = True,
+            line_sink: Optional[Callable[[str], Optional[bool]]] = None,
+            progress_parser: Optional[Callable[[str], Optional[str]]] = None) -> Optional[CommandResultType]:
         """
         Executes a shell command with specified arguments and configuration settings.
         Args:
@@ -737,6 +867,15 @@ class CorePlatform(CoreModuleInterface):
             override_interactive (Optional[bool]):  
                 If specified, this value explicitly determines whether the command is treated as interactive or non-interactive,  
                 overriding the default behavior based on the `_interactive_commands` pattern list from the configuration.
+            capture_output (Optional[bool]): When False, the caller does not need the command output. If in addition
+                no colorization, token search or progress tracking is needed, the command is spawned directly on the
+                inherited TTY without any per-line processing and only the exit code and wall time are recorded.
+            line_sink (Optional[Callable[[str], Optional[bool]]]): Optional consumer which receives every complete,
+                ANSI-stripped output line as soon as it is read, for example a build log analyzer. When the sink
+                returns False the command is terminated early.
+            progress_parser (Optional[Callable[[str], Optional[str]]]): Optional callable which maps ANSI-stripped
+                output lines to a progress text (e.g. '37% ETA 1m05s' for Ninja status lines), or None for other
+                lines. The progress prefixes the echoed line and is shown in the tracker and the terminal title.
 
         Returns:
             Optional[CommandResultType]: A result object containing the command output and return code,
@@ -757,6 +896,9 @@ class CorePlatform(CoreModuleInterface):
         prev_queued_message: Optional[str] = None
         process: Optional[subprocess.Popen] = None
         command: Optional[str] = None
+        sink_stop_requested: bool = False
+        line_progress: Optional[str] = None  # Progress text of the last decoded line
+        shown_progress: Optional[str] = None  # Progress text last shown in the terminal title
 
         # Force no echo when automating a command, in which case it's output will be captured and logged
         if self.auto_forge.work_mode == AutoForgeWorkModeType.NON_INTERACTIVE_AUTOMATION:
@@ -869,13 +1011,14 @@ class CorePlatform(CoreModuleInterface):
             Returns:
                 str: The cleaned string (or empty string if nothing was added).
             """
-            nonlocal prev_queued_message
+            nonlocal prev_queued_message, line_sink, sink_stop_requested, line_progress, progress_parser
 
             try:
                 text = input_buffer.decode('utf-8', errors='replace')
             except Exception as decode_error:
                 raise RuntimeError(f"Decode error: {decode_error}") from decode_error
             clear_text = self._tool_box.strip_ansi(text=text, bare_text=True).strip()
+            line_progress = None
 
             # Log and queue only lines that do not end with \r.
             if len(clear_text):
@@ -891,6 +1034,22 @@ class CorePlatform(CoreModuleInterface):
                     self._logger.debug(f"{'' if PackageGlobals.SPAWNED else '> '}{clear_text}")
                     prev_queued_message = clear_text
 
+                # Stream the line to the external consumer, a faulty sink must not break the command
+                if line_sink is not None:
+                    try:
+                        if line_sink(clear_text) is False:
+                            sink_stop_requested = True
+                    except Exception as sink_error:
+                        self._logger.warning(f"Output sink failed and was detached: {sink_error}")
+                        line_sink = None
+
+                if progress_parser is not None:
+                    try:
+                        line_progress = progress_parser(clear_text)
+                    except Exception as parser_error:
+                        self._logger.warning(f"Progress parser failed and was detached: {parser_error}")
+                        progress_parser = None
+
             if echo_type != TerminalEchoType.LINE:
                 return clear_text
             else:
@@ -976,6 +1135,38 @@ class CorePlatform(CoreModuleInterface):
                     kwargs = dict()
                     kwargs['executable'] = env_shell
 
+            # ------------------------------------------------------------------
+            #
+            # Fast path: nothing to capture, colorize or track, let the child
+            # inherit our TTY and skip the PTY / select / decode machinery.
+            #
+            # ------------------------------------------------------------------
+
+            if (not capture_output and not apply_colorization and not searched_token and self._tracker is None
+                    and line_sink is None and progress_parser is None
+                    and echo_type in (TerminalEchoType.LINE, TerminalEchoType.BYTE)
+                    and self.auto_forge.work_mode == AutoForgeWorkModeType.INTERACTIVE):
+                self._logger.debug(f"Executing: {command_and_args} (Inherited TTY)")
+                sys.stdout.flush()
+                start_time = time.perf_counter()
+                process = subprocess.Popen(_command, shell=shell, cwd=cwd, env=proc_env, **kwargs)
+                try:
+                    process.wait(timeout=timeout if timeout > 0 else None)
+                except KeyboardInterrupt:
+                    # The child shares our process group and got the same SIGINT, let it wind down
+                    process.wait()
+
+                wall_time = time.perf_counter() - start_time
+                return_code = process.returncode
+                self._logger.debug(f"'{command}' returned {return_code} after {wall_time:.3f} seconds")
+
+                results = CommandResultType(response=None, return_code=return_code, command=command,
+                                            extra_data={"wall_time": wall_time})
+                if check and return_code != 0:
+                    results.message = f"child process exited with non zero return code {return_code}"
+                    raise CommandFailedException(results=results)
+                return results
+
             # ------------------------------------------------------------------
             #
             # Execute PTY / Normal.
@@ -1058,6 +1249,13 @@ class CorePlatform(CoreModuleInterface):
                                 line_buffer.clear()
 
                                 if len(text_line) > 0:
+                                    if line_progress:
+                                        text_line = f"{line_progress} {text_line}"
+                                        if line_progress != shown_progress and echo_type != TerminalEchoType.NONE:
+                                            shown_progress = line_progress
+                                            title_prefix = self._tool_box.strip_ansi(text=leading_text or "",
+                                                                                     bare_text=True)
+                                            self._tool_box.set_terminal_title(f"{title_prefix}{line_progress}".strip())
                                     if echo_type in [TerminalEchoType.LINE, TerminalEchoType.CLEAR_LINE,
                                                      TerminalEchoType.SINGLE_LINE]:
                                         _print_line(text_line)
@@ -1065,6 +1263,16 @@ class CorePlatform(CoreModuleInterface):
                                     if self._tracker is not None:
                                         self._tracker.set_body_in_place(text=text_line.strip())
 
+                    # The output sink asked us to stop (e.g. errors limit reached)
+                    if sink_stop_requested and process.poll() is None:
+                        self._logger.debug(f"'{command}' stopped early by output sink")
+                        process.terminate()
+                        try:
+                            process.wait(timeout=5.0)
+                        except subprocess.TimeoutExpired:
+                            process.kill()
+                        break
+
                 else:
                     # No data ready to read — check if process exited
                     if process.poll() is not None:
@@ -1094,6 +1302,8 @@ class CorePlatform(CoreModuleInterface):
             # Non-zero return code
             if check and return_code != 0:
                 results.message = f"child process exited with non zero return code {return_code}"
+                if sink_stop_requested:
+                    results.message = "stopped early by output sink"
                 raise CommandFailedException(results=results)
             # Token not found
             if searched_token and command_response and searched_token not in command_response:
@@ -1363,20 +1573,32 @@ class CorePlatform(CoreModuleInterface):
             extracted_path = self._tool_box.decompress_archive(archive_path=expanded_archive_path,
                                                                destination_path=expanded_destination_path,
                                                                delete_after=True,
-                                                               update_progress=self._tracker.set_body_in_place)
+                                                               update_progress=self._tracker.set_body_in_place if self._tracker else None)
             return CommandResultType(response=extracted_path, return_code=0)
 
         except Exception as decompress_error:
             raise decompress_error from decompress_error
 
-    def python_virtualenv_create(self, venv_path: str,
-                                 python_version: Optional[str] = None) -> Optional[CommandResultType]:
+    def python_virtualenv_create(self, venv_path: str, python_version: Optional[str] = None,
+                                 packages: Optional[list[str]] = None,
+                                 use_snapshot: bool = True,
+                                 snapshot_packages: Optional[list[str]] = None) -> Optional[CommandResultType]:
         """
         Create a Python virtual environment using a specified or default Python interpreter.
+        When the environment packages are specified, an environment previously built on this machine for the same
+        interpreter and requirements is restored from the snapshots cache instead of being recreated.
+        Packages installed by the following 'python_package_add' steps of a sequence ('snapshot_packages', set
+        by the sequence planner) are handled the same way: those steps are skipped when the environment was restored,
+        and the environment is stored once the last of them succeeded.
         Args:
             venv_path (str): Destination directory for the virtual environment.
             python_version (Optional[str]): Desired Python version (e.g., "3.9").
                                             If not specified, the system default Python 3 interpreter is used.
+            packages (Optional[list[str]]): Packages and requirements files to install into the new environment.
+            use_snapshot (bool): Restore from, and store into, the environments snapshots cache when enabled in
+                configuration.
+            snapshot_packages (Optional[list[str]]): Packages and requirements files which later steps install into
+                the new environment.
         Returns:
             Optional[CommandResultType]: Result object with command output and return code, or None on failure.
         """
@@ -1401,9 +1623,52 @@ class CorePlatform(CoreModuleInterface):
                 raise RuntimeError(f"Could not create virtual environment path '{venv_expanded_path}'")
 
             created_venv_path = results.response
+
+            # Snapshots are keyed by the base interpreter and the normalized requirements
+            snapshots: Optional[VenvSnapshots] = None
+            requirements: Optional[list[str]] = None
+            snapshot_key: Optional[str] = None
+            self._venv_snapshot_plans.pop(os.path.realpath(created_venv_path), None)
+            snapshot_packages = None if packages else snapshot_packages
+            if packages or snapshot_packages:
+                all_packages = [self._variables.expand(key=package) for package in packages or snapshot_packages]
+                packages = all_packages if packages else None
+                if use_snapshot and self._venv_snapshots_path:
+                    requirements = PythonWheelhouse.get_requirements(all_packages)
+                if requirements is not None:
+                    snapshots = VenvSnapshots(cache_path=self._variables.expand(key=self._venv_snapshots_path))
+                    snapshot_key = snapshots.get_key(python_binary=python_binary, requirements=requirements)
+
+            if snapshots is not None and snapshots.has_snapshot(snapshot_key):
+                if (snapshots.restore(key=snapshot_key, venv_path=created_venv_path) and
+                        snapshots.validate(venv_path=created_venv_path, requirements=requirements)):
+                    self._logger.debug(f"Virtual environment restored from snapshot '{snapshot_key}'")
+                    if snapshot_packages:
+                        self._venv_snapshot_plans[os.path.realpath(created_venv_path)] = {
+                            "restored": True, "key": snapshot_key, "requirements": set(requirements)}
+                    return CommandResultType(response=created_venv_path, return_code=0,
+                                             message=f"restored from snapshot '{snapshot_key}'")
+
+                self._logger.warning(f"Snapshot '{snapshot_key}' could not be restored, creating environment")
+                shutil.rmtree(created_venv_path, ignore_errors=True)
+                os.makedirs(created_venv_path, exist_ok=True)
+
             command_and_args = self._flatten_command(command=python_binary, arguments=f"-m venv {created_venv_path}")
+            results = self.execute_shell_command(command_and_args=command_and_args, override_interactive=False)
 
-            return self.execute_shell_command(command_and_args=command_and_args, override_interactive=False)
+            # The packages are installed by later steps, the last of them stores the snapshot
+            if snapshots is not None and snapshot_packages:
+                self._venv_snapshot_plans[os.path.realpath(created_venv_path)] = {
+                    "restored": False, "key": snapshot_key, "snapshots": snapshots, "requirements": requirements,
+                    "pending": set(requirements)}
+
+            if packages:
+                results = self.python_package_add(package_or_requirements=packages, venv_path=created_venv_path)
+                if snapshots is not None and results is not None and results.return_code == 0 and \
+                        snapshots.validate(venv_path=created_venv_path, requirements=requirements):
+                    snapshots.snapshot(venv_path=created_venv_path, key=snapshot_key, requirements=requirements)
+
+            return results
 
         except Exception as py_error:
             raise Exception(f"Failed to create virtual environment at '{venv_path}': {py_error}") from py_error
@@ -1431,13 +1696,66 @@ class CorePlatform(CoreModuleInterface):
         except Exception as py_env_error:
             raise Exception(f"could not update pip {py_env_error}") from py_env_error
 
-    def python_package_add(self, package_or_requirements: str, venv_path: Optional[str] = None) -> Optional[
-        CommandResultType]:
+    def _get_pip_install_arguments(self, packages_or_requirements: list[str]) -> list[str]:
+        """ Converts package specifications and requirements ('.txt') files into 'pip install' arguments. """
+        arguments: list[str] = []
+        for item in packages_or_requirements:
+            if item.endswith('.txt'):
+                arguments.extend(["-r", item])
+            else:
+                arguments.extend(shlex.split(item))
+        return arguments
+
+    def _python_wheelhouse_install(self, python_binary: str, packages_or_requirements: list[str],
+                                   install_arguments: list[str]) -> Optional[CommandResultType]:
+        """
+        Installs a requirements set from the local wheelhouse cache, building the wheelhouse on first use.
+        Args:
+            python_binary (str): The interpreter to install into.
+            packages_or_requirements (list[str]): Package specifications and requirements files.
+            install_arguments (list[str]): The matching 'pip install' arguments.
+        Returns:
+            Optional[CommandResultType]: The offline install results, None when the set could not be served from
+            the wheelhouse and should be installed from the index.
+        """
+        wheelhouse = PythonWheelhouse(cache_path=self._variables.expand(key=self._python_wheelhouse_path))
+        requirements = wheelhouse.get_requirements(packages_or_requirements)
+        if requirements is None:
+            return None  # VCS, local or editable requirements are always installed from their source
+
+        wheelhouse_path = wheelhouse.get_path(python_binary=python_binary, requirements=requirements)
+        if not wheelhouse.is_complete(wheelhouse_path):
+            staging_path = wheelhouse.prepare(wheelhouse_path)
+            arguments = ["-m", "pip", "wheel", "--wheel-dir", staging_path, *install_arguments]
+            results = self.execute_shell_command(
+                command_and_args=self._flatten_command(command=python_binary, arguments=arguments),
+                shell=False, override_interactive=False, check=False)
+            if results is None or results.return_code != 0 or \
+                    not wheelhouse.commit(wheelhouse_path, staging_path, requirements):
+                wheelhouse.discard(staging_path)
+                self._logger.warning("Could not build wheelhouse, installing from the package index")
+                return None
+
+        arguments = ["-m", "pip", "install", "--no-index", "--find-links", wheelhouse_path, *install_arguments]
+        results = self.execute_shell_command(
+            command_and_args=self._flatten_command(command=python_binary, arguments=arguments),
+            shell=False, override_interactive=False, check=False)
+        if results is None or results.return_code != 0:
+            self._logger.warning(f"Offline install from '{wheelhouse_path}' failed, installing from the package index")
+            return None
+        return results
+
+    def python_package_add(self, package_or_requirements: Union[str, list[str]], venv_path: Optional[str] = None,
+                           use_wheelhouse: bool = True) -> Optional[CommandResultType]:
         """
         Installs a package or a list of packages from a requirements file into a specified virtual environment using pip.
+        Several packages and requirements files may be passed as a list, and are then installed by a single pip
+        run, so dependencies are resolved once for the whole set.
         Args:
-            package_or_requirements (str): The package name to install or path to a requirements file.
+            package_or_requirements (Union[str, list[str]]): The package name to install or path to a requirements
+                file, or a list of those.
             venv_path (Optional[str]): The path to the virtual environment. If None use system default.
+            use_wheelhouse (bool): Install from the local wheels cache, when enabled in configuration.
         Returns:
             Optional[CommandResultType]: A result object containing the command output and return code,
             or None if an exception was raised.
@@ -1447,23 +1765,55 @@ class CorePlatform(CoreModuleInterface):
             command = self._get_python_binary_path(venv_path=venv_path)
 
             # Normalize inputs
-            package_or_requirements = self._tool_box.normalize_text(package_or_requirements)
-            if len(package_or_requirements) == 0:
+            if isinstance(package_or_requirements, str):
+                package_or_requirements = [package_or_requirements]
+            packages_or_requirements = [self._tool_box.normalize_text(item) for item in package_or_requirements]
+            packages_or_requirements = [item for item in packages_or_requirements if item]
+            if len(packages_or_requirements) == 0:
                 raise RuntimeError("no package or requirements file specified for pip")
 
             # Expand
-            package_or_requirements = self._variables.expand(key=package_or_requirements)
-
-            # Determine if the input is a package name or a path to a requirements file
-            if package_or_requirements.endswith('.txt'):
-                arguments = f"-m pip install -r {package_or_requirements}"
-            else:
-                arguments = f"-m pip install {package_or_requirements}"
+            packages_or_requirements = [self._variables.expand(key=item) for item in packages_or_requirements]
+            install_arguments = self._get_pip_install_arguments(packages_or_requirements)
+
+            # Environments restored from a snapshot already have the packages their sequence installs
+            snapshot_plan: Optional[dict[str, Any]] = None
+            step_requirements: Optional[list[str]] = None
+            if venv_path and self._venv_snapshot_plans:
+                snapshot_plan = self._venv_snapshot_plans.get(
+                    os.path.realpath(self._variables.expand(key=venv_path)))
+                step_requirements = PythonWheelhouse.get_requirements(packages_or_requirements) \
+                    if snapshot_plan is not None else None
+                if step_requirements is None:
+                    snapshot_plan = None
+                elif snapshot_plan["restored"] and set(step_requirements) <= snapshot_plan["requirements"]:
+                    return CommandResultType(response=None, return_code=0,
+                                             message=f"restored from snapshot '{snapshot_plan['key']}'")
+
+            results = None
+            if use_wheelhouse and self._python_wheelhouse_path:
+                results = self._python_wheelhouse_install(python_binary=command,
+                                                          packages_or_requirements=packages_or_requirements,
+                                                          install_arguments=install_arguments)
 
             # Execute the command
-            results = (
-                self.execute_shell_command(command_and_args=self._flatten_command(command=command, arguments=arguments),
-                                           shell=False, override_interactive=False))
+            if results is None:
+                arguments = ["-m", "pip", "install", *install_arguments]
+                results = self.execute_shell_command(
+                    command_and_args=self._flatten_command(command=command, arguments=arguments), shell=False,
+                    override_interactive=False)
+
+            # Once the last package step of a planned environment succeeded, the environment is stored
+            if snapshot_plan is not None and not snapshot_plan["restored"] and results is not None and \
+                    results.return_code == 0:
+                snapshot_plan["pending"].difference_update(step_requirements)
+                if not snapshot_plan["pending"]:
+                    venv_real_path = os.path.realpath(self._variables.expand(key=venv_path))
+                    self._venv_snapshot_plans.pop(venv_real_path, None)
+                    if snapshot_plan["snapshots"].validate(venv_path=venv_real_path,
+                                                           requirements=snapshot_plan["requirements"]):
+                        snapshot_plan["snapshots"].snapshot(venv_path=venv_real_path, key=snapshot_plan["key"],
+                                                            requirements=snapshot_plan["requirements"])
             return results
 
         except Exception as python_pip_error:
@@ -1537,9 +1887,12 @@ class CorePlatform(CoreModuleInterface):
             raise
 
     def git_clone_repo(self, repo_url: str, dest_repo_path: str, timeout: float = 0,
-                       clear_destination_path: bool = True) -> Optional[CommandResultType]:
+                       clear_destination_path: bool = True, use_mirror: bool = True, shared: bool = False,
+                       depth: Optional[int] = None, filter_spec: Optional[str] = None) -> Optional[CommandResultType]:
         """
         Clones a Git repository from a specified URL into a specified destination directory.
+        When the mirrors cache is enabled, a local bare mirror of the repository is created (or refreshed) first,
+        and the workspace clone borrows its objects so only the changes since the last update leave the network.
         Args:
             repo_url (str): The URL of the Git repository to clone.
             dest_repo_path (str): The local file system path where the repository should be cloned.
@@ -1547,6 +1900,12 @@ class CorePlatform(CoreModuleInterface):
                 A timeout of 0 indicates no timeout. Default is 0.
             clear_destination_path (bool): A flag to specify whether to clear the destination directory if it
                 already exists. Default is True.
+            use_mirror (bool): Clone through the local mirrors cache, when enabled in configuration.
+            shared (bool): Clone straight from the mirror using '--shared', the fastest option, though the clone
+                keeps depending on the mirror objects. Otherwise, the clone references the mirror and dissociates
+                from it once done. Ignored for shallow or partial clones.
+            depth (int, optional): Create a shallow clone with that many commits.
+            filter_spec (str, optional): Partial clone filter, e.g. 'blob:none'.
         Returns:
             Optional[CommandResultType]: A result object containing the command output and return code,
             or None if an exception was raised.
@@ -1564,9 +1923,40 @@ class CorePlatform(CoreModuleInterface):
             # Optionally clear the destination path
             self.path_erase(path=dest_repo_path, allow_non_empty=clear_destination_path)
 
+            # Refresh the local mirror, a stale mirror is still worth referencing when the remote can't be fetched
+            mirror_path: Optional[str] = None
+            if use_mirror and self._git_mirrors_path:
+                mirror_cache = GitMirrorCache(cache_path=self._variables.expand(key=self._git_mirrors_path))
+                try:
+                    mirror_path = mirror_cache.update(repo_url=repo_url, timeout=timeout)
+                except Exception as mirror_error:
+                    self._logger.warning(f"Could not update git mirror of '{repo_url}': {mirror_error}")
+                    if mirror_cache.has_mirror(repo_url=repo_url):
+                        mirror_path = mirror_cache.get_mirror_path(repo_url=repo_url)
+
             # Construct and execute the git clone command
             command = "git"
-            arguments = f"clone --progress {repo_url} {dest_repo_path}"
+            if mirror_path is not None and shared and not depth and not filter_spec:
+                arguments = ["clone", "--progress", "--shared", mirror_path, dest_repo_path]
+                command_result = self.execute_shell_command(
+                    command_and_args=self._flatten_command(command=command, arguments=arguments), timeout=timeout)
+                if command_result.return_code == 0:
+                    # Point the clone back to the real remote
+                    arguments = ["remote", "set-url", "origin", repo_url]
+                    self.execute_shell_command(
+                        command_and_args=self._flatten_command(command=command, arguments=arguments),
+                        cwd=dest_repo_path, timeout=timeout)
+                return command_result
+
+            arguments = ["clone", "--progress"]
+            if depth:
+                arguments.append(f"--depth={int(depth)}")
+            if filter_spec:
+                arguments.append(f"--filter={filter_spec}")
+            if mirror_path is not None:
+                arguments.extend(["--reference-if-able", mirror_path, "--dissociate"])
+            arguments.extend([repo_url, dest_repo_path])
+
             command_result = self.execute_shell_command(
                 command_and_args=self._flatten_command(command=command, arguments=arguments), timeout=timeout)
 
@@ -1677,6 +2067,7 @@ class CorePlatform(CoreModuleInterface):
 
         # Download files and create ZIP
         try:
+            downloads: list[tuple[str, str]] = []
             for file_info in files:
                 if file_info['type'] != 'file':
                     continue  # Skip subdirectories (for now)
@@ -1686,13 +2077,11 @@ class CorePlatform(CoreModuleInterface):
                 if allowed_extensions and not any(filename.lower().endswith(ext.lower()) for ext in allowed_extensions):
                     continue
 
-                file_url = file_info['download_url']
-                local_filename = os.path.join(destination_temp_path, file_info['name'])
-
-                # Use the provided download function
-                file_url = self._tool_box.normalize_to_github_api_url(url=file_url)
-                results: Optional[CommandResultType] = self.url_get(url=file_url, destination=local_filename)
+                file_url = self._tool_box.normalize_to_github_api_url(url=file_info['download_url'])
+                downloads.append((file_url, os.path.join(destination_temp_path, file_info['name'])))
 
+            # Fetch all the files concurrently over the pooled session connections
+            for results in self.url_get_many(downloads=downloads):
                 if not isinstance(results, CommandResultType) or results.return_code != 0:
                     raise RuntimeError("HTTP operation failed")
 
@@ -1711,13 +2100,75 @@ class CorePlatform(CoreModuleInterface):
         finally:
             shutil.rmtree(destination_temp_path)
 
+    def _get_http_session(self, proxy_server: Optional[str] = None, token: Optional[str] = None) -> HTTPSession:
+        """
+        Returns the pooled keep-alive HTTP session for a proxy / token combination, created once and reused by
+        all subsequent requests.
+        Args:
+            proxy_server (Optional[str]): Proxy server URL to route the requests through.
+            token (Optional[str]): Authorization token added to every request.
+        Returns:
+            HTTPSession: The shared session.
+        """
+        with self._http_sessions_lock:
+            session = self._http_sessions.get((proxy_server, token))
+            if session is None:
+                headers = {'Authorization': f'Bearer {token}'} if token else None
+                session = HTTPSession(proxy_server=proxy_server, headers=headers,
+                                      max_idle_per_host=max(8, self._download_max_connections))
+                self._http_sessions[(proxy_server, token)] = session
+            return session
+
+    def _create_download_engine(self, session: HTTPSession) -> DownloadEngine:
+        """
+        Creates a download engine bound to the shared downloads cache.
+        Args:
+            session (HTTPSession): The pooled HTTP session to download through.
+        Returns:
+            DownloadEngine: The engine instance.
+        """
+        cache_path = self._variables.expand(key=self._download_cache_path) if self._download_cache_path else None
+        return DownloadEngine(cache_path=cache_path, max_connections=self._download_max_connections,
+                              open_url=session.open)
+
+    def url_get_many(self, downloads: list[tuple[str, str]], max_workers: Optional[int] = None,
+                     **kwargs: Any) -> list[CommandResultType]:
+        """
+        Downloads several files concurrently, over the pooled connections of the session.
+        Args:
+            downloads (list[tuple[str, str]]): (url, destination file) pairs.
+            max_workers (Optional[int]): Maximum concurrent downloads, defaults to 'download_max_connections' * 2.
+            **kwargs: Any other 'url_get()' argument, applied to all the downloads.
+        Returns:
+            list[CommandResultType]: Results, in the order of 'downloads'. Raises on the first failed download.
+        """
+        if not downloads:
+            return []
+
+        tracker = self._tracker
+        max_workers = max(1, min(len(downloads), max_workers or self._download_max_connections * 2))
+        results: list[Optional[CommandResultType]] = [None] * len(downloads)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Download") as executor:
+            futures = {executor.submit(self.url_get, url=url, destination=destination, **kwargs): index
+                       for index, (url, destination) in enumerate(downloads)}
+            for completed_count, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+                if tracker is not None:
+                    tracker.set_body_in_place(text=f"{completed_count}/{len(downloads)} files")
+
+        return results
+
     def url_get(  # noqa: C901 # Acceptable complexity
             self, url: str, destination: Optional[str] = None, delete_if_exist: Optional[bool] = False,
             proxy_server: Optional[str] = None, token: Optional[str] = None, timeout: Optional[float] = None,
-            extra_headers: Optional[dict] = None) -> Optional[CommandResultType]:
+            extra_headers: Optional[dict] = None, sha256: Optional[str] = None,
+            use_cache: bool = True) -> Optional[CommandResultType]:
         """
         Downloads a file / list of files from a specified URL to a specified local path, with optional authentication,
         proxy support, and additional HTTP headers. When verbosity is on the download progress is shown.
+        Files are downloaded using parallel range requests when possible, interrupted downloads are resumed, and
+        completed downloads are kept in a shared cache so that other workspaces get them without downloading.
         Args:
             url (str): The URL from which to download the file.
             destination (Optional[str]): The local path / file where the downloaded file should be saved.
@@ -1728,6 +2179,8 @@ class CorePlatform(CoreModuleInterface):
                 configured token.
             timeout (Optional[float]): The timeout for the download operation, in seconds.
             extra_headers (Optional[dict]): Additional headers to include in the download request.
+            sha256 (Optional[str]): Expected file sha256, verified before the file is stored.
+            use_cache (bool): Use the shared downloads cache.
 
         Returns:
             CommandResultType, optional - or exception on error.
@@ -1784,98 +2237,363 @@ class CorePlatform(CoreModuleInterface):
                     if results.return_code != 0:
                         return results
 
-            # Set up the HTTP request
-            request = urllib.request.Request(url)
-            log_message = [f"HTTP request to {request.full_url}"]
+            # The session owns the proxy and authorization settings, only extra headers are set per request
+            session = self._get_http_session(proxy_server=proxy_server, token=token)
+            headers: dict[str, str] = dict(extra_headers) if extra_headers else {}
+            log_message = [f"HTTP request to {url}"]
 
-            # Add authorization token to the request headers if provided
             if token:
-                request.add_header('Authorization', f'Bearer {token}')
                 log_message.append(f"using token: {token[:4]}****...")
             else:
                 log_message.append(f"Token not specified")
 
-            # Include any extra headers specified
-            if extra_headers:
-                for header, value in extra_headers.items():
-                    request.add_header(header, value)
-
             # Configure proxy settings if a proxy URL is provided
             if proxy_server:
-                proxy_handler = urllib.request.ProxyHandler({'http': proxy_server, 'https': proxy_server})
-                opener = urllib.request.build_opener(proxy_handler)
-                urllib.request.install_opener(opener)
                 log_message.append(f"via proxy: {proxy_server}")
             else:
                 log_message.append(f"Proxy not specified")
 
             self._logger.debug(" | ".join(log_message))
 
-            # Perform the download operation
-            with urllib.request.urlopen(request, timeout=effective_timeout) as response:
+            if not is_url_path:
+                # Files are fetched by the download engine: parallel ranges, resume and shared cache
+                tracker = self._tracker
 
-                content_length = response.getheader('Content-Length')
+                def _update_progress(_downloaded: int, _total: Optional[int]) -> None:
+                    if tracker is not None and _total:
+                        # Update the tracker if we have it
+                        tracker.set_body_in_place(text=f"{(_downloaded / _total) * 100:.2f}%")
 
-                if content_length is None or is_url_path:
-                    content = response.read()
-                    if is_url_path:
-                        # When the URL points to a path, return the file listing
-                        files = json.loads(content.decode('utf-8'))
-                        return CommandResultType(response=url, return_code=0, extra_data=files,
-                                                 extra_value=content_length)
-                    else:
-                        with open(destination_file, 'wb') as f:
-                            f.write(content)
-                        written_bytes = len(content)
-                        return CommandResultType(response=url, return_code=0, extra_value=written_bytes,
-                                                 extra_data=content)
-                else:
-                    total_size = int(response.getheader('Content-Length').strip())
-                    downloaded_size = 0
-                    chunk_size = 1024 * 10  # 10KB chunk size
-                    self._logger.debug(f"Storing '{destination_file}' download, size: {total_size} bytes")
-
-                    with open(destination_file, 'wb') as out_file:
-                        while True:
-                            chunk = response.read(chunk_size)
-                            if not chunk:
-                                break
-                            out_file.write(chunk)
-                            downloaded_size += len(chunk)
-
-                            progress_percentage = (downloaded_size / total_size) * 100
-                            percentage_text = f"{progress_percentage:.2f}%"
-
-                            if self._tracker is not None:
-                                # Update the tracker if we have it
-                                self._tracker.set_body_in_place(text=percentage_text)
-
-                self._logger.debug(f"Total {total_size} bytes downloaded and written")
-                if total_size > 0:
-                    return CommandResultType(response=destination_file, return_code=0, extra_value=downloaded_size)
-                else:
+                results = self._create_download_engine(session=session).download(
+                    url=url, destination_file=destination_file, headers=headers, sha256=sha256,
+                    timeout=effective_timeout, use_cache=use_cache, progress=_update_progress)
+
+                self._logger.debug(f"Total {results.extra_value} bytes stored in '{destination_file}' "
+                                   f"({'cache' if results.extra_data.get('cached') else 'network'})")
+                if not results.extra_value:
                     # Received 0 bytes, this is probably not the desired results
-                    return CommandResultType(response=destination_file, return_code=1, extra_value=downloaded_size)
+                    results.return_code = 1
+                return results
+
+            # When the URL points to a path, return the file listing
+            request = urllib.request.Request(url, headers=headers)
+            with session.open(request, timeout=effective_timeout) as response:
+                content_length = response.getheader('Content-Length')
+                content = response.read()
+                files = json.loads(content.decode('utf-8'))
+                return CommandResultType(response=url, return_code=0, extra_data=files,
+                                         extra_value=content_length)
 
         except Exception as download_error:
             raise RuntimeError(f"download error '{remote_file or url}', {download_error}") from download_error
 
-    def run_sequence(self, sequence_data: dict[str, Any], tracker: Optional[ProgressTracker] = None) -> Optional[int]:
+    @staticmethod
+    def _can_merge_package_steps(previous: dict[str, Any], step: dict[str, Any]) -> bool:
+        """
+        Checks if a 'python_package_add' step could be folded into the preceding one, so both are installed by a
+        single pip run. Only steps which differ by their packages (and description) are merged, and only when the
+        later step is anonymous and implicitly follows the previous one.
+        """
+        if previous.get("method") != "python_package_add" or step.get("method") != "python_package_add":
+            return False
+        if "id" in step or "depends_on" in step or "response_store_key" in previous or "response_store_key" in step:
+            return False
+
+        step_keys = ("id", "depends_on", "description", "arguments")
+        if ({key: value for key, value in previous.items() if key not in step_keys} !=
+                {key: value for key, value in step.items() if key not in step_keys}):
+            return False
+
+        previous_arguments, arguments = previous.get("arguments"), step.get("arguments")
+        if not isinstance(previous_arguments, dict) or not isinstance(arguments, dict):
+            return False
+        mergeable_arguments = {"package_or_requirements", "venv_path", "use_wheelhouse"}
+        if not set(previous_arguments) <= mergeable_arguments or not set(arguments) <= mergeable_arguments:
+            return False
+        return all(previous_arguments.get(key) == arguments.get(key) for key in ("venv_path", "use_wheelhouse"))
+
+    @staticmethod
+    def _plan_venv_snapshots(nodes: list[_SequenceStep]) -> None:
+        """
+        Hands the packages which the steps following a bare 'python_virtualenv_create' install into the same
+        environment over to it, so the environment along with those packages could be restored from a snapshot.
+        Only the steps which implicitly follow each other are considered.
+        """
+        for index, node in enumerate(nodes):
+            arguments = node.data.get("arguments")
+            if (node.data.get("method") != "python_virtualenv_create" or not isinstance(arguments, dict) or
+                    arguments.get("packages") or arguments.get("use_snapshot") is False):
+                continue
+
+            snapshot_packages: list[str] = []
+            for following, previous in zip(nodes[index + 1:], nodes[index:]):
+                following_arguments = following.data.get("arguments")
+                if (following.data.get("method") not in ("python_package_add", "python_update_pip") or
+                        following.depends_on != [previous.step_id] or not isinstance(following_arguments, dict) or
+                        following_arguments.get("venv_path") != arguments.get("venv_path")):
+                    break
+                if following.data.get("method") == "python_package_add":
+                    packages = following_arguments.get("package_or_requirements", [])
+                    snapshot_packages.extend(packages if isinstance(packages, list) else [packages])
+
+            if snapshot_packages:
+                node.data = copy.deepcopy(node.data)
+                node.data["arguments"]["snapshot_packages"] = snapshot_packages
+
+    def _build_sequence_graph(self, steps: list[dict[str, Any]], merge_packages: bool = True) -> list[_SequenceStep]:
+        """
+        Converts the sequence steps into a dependency graph.
+        Steps may declare an optional 'id' and 'depends_on' (id or list of ids). A step without 'depends_on'
+        implicitly depends on the previous enabled step, so plain sequences keep running strictly in order,
+        while 'depends_on: []' marks a step as independent.
+        Args:
+            steps (list[dict[str, Any]]): The raw sequence steps.
+            merge_packages (bool): Fold consecutive 'python_package_add' steps targeting the same environment into
+                a single step.
+        Returns:
+            list[_SequenceStep]: Enabled steps in a stable topological (display) order.
+        """
+        nodes: list[_SequenceStep] = []
+        disabled_ids: set[str] = set()
+        merged_ids: dict[str, str] = {}
+        merged_counts: dict[str, int] = {}
+        self._sequence_has_dependencies = False
+
+        for index, step in enumerate(steps):
+            step_id = str(step.get("id", f"step_{index + 1}"))
+            if step.get("disabled", False):
+                disabled_ids.add(step_id)
+                continue
+            if any(node.step_id == step_id for node in nodes):
+                raise ValueError(f"duplicate step id '{step_id}'")
+
+            if merge_packages and nodes and self._can_merge_package_steps(nodes[-1].data, step):
+                previous = nodes[-1]
+                previous.data = copy.deepcopy(previous.data)
+                packages = previous.data["arguments"].get("package_or_requirements", [])
+                packages = packages if isinstance(packages, list) else [packages]
+                added = step["arguments"].get("package_or_requirements", [])
+                previous.data["arguments"]["package_or_requirements"] = \
+                    packages + (added if isinstance(added, list) else [added])
+                merged_ids[step_id] = previous.step_id
+                merged_counts[previous.step_id] = merged_counts.get(previous.step_id, 1) + 1
+                continue
+
+            depends_on = step.get("depends_on")
+            if depends_on is None:
+                dependencies = [nodes[-1].step_id] if nodes else []
+            else:
+                self._sequence_has_dependencies = True
+                dependencies = [depends_on] if isinstance(depends_on, str) else list(depends_on)
+
+            nodes.append(_SequenceStep(step_id=step_id, number=len(nodes) + 1, data=step,
+                                       depends_on=[str(dependency) for dependency in dependencies]))
+
+        for node in nodes:
+            if node.step_id in merged_counts:
+                description = node.data.get("description", "Installing Python packages")
+                node.data["description"] = f"{description} ({merged_counts[node.step_id]} steps merged)"
+        self._plan_venv_snapshots(nodes)
+
+        # Validate references, dependencies on disabled steps are considered satisfied
+        known_ids = {node.step_id for node in nodes}
+        for node in nodes:
+            node.depends_on = [merged_ids.get(dependency, dependency) for dependency in node.depends_on]
+            unknown = [dependency for dependency in node.depends_on
+                       if dependency not in known_ids and dependency not in disabled_ids]
+            if unknown:
+                raise ValueError(f"step '{node.step_id}' depends on unknown step(s): {', '.join(unknown)}")
+            node.depends_on = [dependency for dependency in node.depends_on if dependency in known_ids]
+
+        # Stable topological sort (Kahn), ties are broken by the definition order
+        by_id = {node.step_id: node for node in nodes}
+        remaining = {node.step_id: len(node.depends_on) for node in nodes}
+        dependents: dict[str, list[str]] = {node.step_id: [] for node in nodes}
+        for node in nodes:
+            for dependency in node.depends_on:
+                dependents[dependency].append(node.step_id)
+
+        ordered: list[_SequenceStep] = []
+        ready = [node.number for node in nodes if not node.depends_on]
+        heapq.heapify(ready)
+        while ready:
+            node = nodes[heapq.heappop(ready) - 1]
+            ordered.append(node)
+            for dependent in dependents[node.step_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    heapq.heappush(ready, by_id[dependent].number)
+
+        if len(ordered) != len(nodes):
+            cyclic = [node.step_id for node in nodes if remaining[node.step_id] > 0]
+            raise ValueError(f"circular step dependencies detected: {', '.join(cyclic)}")
+        return ordered
+
+    def _pre_expand(self, data: Any) -> Any:
+        """
+        Expands the internal variables which are already resolvable. Anything that is only known at run time
+        (environment variables, which earlier steps may still change, or 'load_value:' references) is left as is and
+        expanded when the step executes.
+        """
+        if isinstance(data, dict):
+            return {key: self._pre_expand(value) for key, value in data.items()}
+        if isinstance(data, list):
+            return [self._pre_expand(value) for value in data]
+        if isinstance(data, str) and "$" in data and "load_value:" not in data:
+            with suppress(Exception):
+                return self._variables.expand(key=data, allow_environment=False)
+        return data
+
+    def _compile_sequence_step(self, node: _SequenceStep) -> None:
+        """
+        Resolves the step method and binds its arguments once, before anything runs.
+        Args:
+            node (_SequenceStep): The step to compile, updated in place.
+        """
+        method_name = node.data.get("method")
+        arguments = node.data.get("arguments")
+
+        if not isinstance(method_name, str) or not method_name.strip() or arguments is None:
+            raise ValueError("missing or invalid 'method' or 'arguments', both are required")
+
+        node.method_name = method_name.strip().lower()  # Normalize
+        arguments = self._pre_expand(copy.deepcopy(arguments))
+
+        if node.method_name != "conditional":
+            node.call = self._bind_python_method(method_name=node.method_name, arguments=arguments, strict=True)
+            return
+
+        # Conditional blocks are executed dynamically, validate their inner steps
+        if not isinstance(arguments, dict) or not isinstance(arguments.get("condition"), dict):
+            raise ValueError("conditional step requires a 'condition'")
+        for inner_step in [arguments["condition"]] + list(arguments.get("if_false", [])):
+            self._bind_python_method(method_name=inner_step.get("method"), arguments=inner_step.get("arguments"),
+                                     strict=True)
+
+    def _compile_sequence(self, nodes: list[_SequenceStep]) -> None:
+        """
+        Compiles all the steps, reporting every invalid step at once.
+        Args:
+            nodes (list[_SequenceStep]): The steps to compile.
+        """
+        errors: list[str] = []
+        for node in nodes:
+            try:
+                self._compile_sequence_step(node)
+            except Exception as compile_error:
+                errors.append(f"step {node.number} ('{node.data.get('description', node.step_id)}'): {compile_error}")
+        if errors:
+            raise ValueError(f"invalid sequence, {len(errors)} step(s) failed validation:\n" + "\n".join(errors))
+
+    def _print_sequence_plan(self, nodes: list[_SequenceStep], max_workers: int) -> None:
+        """
+        Prints the compiled sequence plan.
+        Args:
+            nodes (list[_SequenceStep]): Compiled steps in execution order.
+            max_workers (int): Maximum concurrent steps.
+        """
+
+        def _format_value(_value: Any) -> str:
+            _text = json.dumps(_value, default=str) if not isinstance(_value, str) else repr(_value)
+            return _text if len(_text) <= 80 else f"{_text[:77]}..."
+
+        print(f"\n{Style.BRIGHT}Sequence plan{Style.RESET_ALL}: {len(nodes)} steps, up to {max_workers} concurrent\n")
+        for node in nodes:
+            print(f"{node.number:>3}. {Fore.CYAN}{node.data.get('description', '')}{Style.RESET_ALL} [{node.step_id}]")
+            if node.call is not None:
+                arguments = ", ".join(f"{key}={_format_value(value)}" for key, value in node.call.kwargs.items())
+                print(f"     {node.call.method_name}({arguments})")
+            else:
+                print(f"     {node.method_name}(...)")
+            if node.depends_on:
+                print(f"     depends on: {', '.join(node.depends_on)}")
+        print()
+
+    def _execute_sequence_step(self, node: _SequenceStep) -> Optional[CommandResultType]:
+        """
+        Executes a single, compiled sequence step.
+        Args:
+            node (_SequenceStep): The step to execute.
+        Returns:
+            Optional[CommandResultType]: The step results, raises an exception on error.
+        """
+        arguments = node.data.get("arguments")
+
+        # Steps which publish a value must always run, otherwise the value would be missing
+        cacheable = node.method_name in _SEQUENCE_CACHEABLE_METHODS or (
+                node.method_name in _SEQUENCE_OPT_IN_CACHEABLE_METHODS and node.data.get("cache") is True)
+        if (self._sequence_journal is not None and cacheable and node.call is not None and node.data.get("cache", True)
+                and not node.data.get("response_store_key")):
+            try:
+                # The bound (compile time) arguments are what runs, the references left for run time resolve now
+                node.expanded_arguments = self._variables.expand_any(data=dict(node.call.kwargs))
+                node.fingerprint = self._sequence_journal.fingerprint(step_id=node.step_id,
+                                                                      method_name=node.method_name,
+                                                                      arguments=node.expanded_arguments)
+            except Exception as fingerprint_error:
+                self._logger.debug(f"Step {node.number} is not cacheable: {fingerprint_error}")
+                node.fingerprint = None
+
+            if (node.fingerprint is not None and not self._sequence_force and
+                    self._sequence_journal.is_cached(step_id=node.step_id, fingerprint=node.fingerprint)):
+                self._logger.debug(f"Step {node.number} '{node.step_id}' is unchanged, skipping")
+                node.cached = True
+                return None
+
+        if node.call is None:
+            return self._handle_conditional_step(arguments, node.number - 1)
+        return self._invoke_python_method(call=node.call)
+
+    @staticmethod
+    def _get_critical_path(nodes: list[_SequenceStep]) -> tuple[float, list[str]]:
+        """
+        Finds the longest chain of dependent steps, which is what bounds the sequence duration.
+        Args:
+            nodes (list[_SequenceStep]): Executed steps in topological order.
+        Returns:
+            tuple[float, list[str]]: The chain duration and its step ids.
+        """
+        chain_time: dict[str, float] = {}
+        chain_prev: dict[str, Optional[str]] = {}
+        for node in nodes:
+            previous = max(node.depends_on, key=lambda _dependency: chain_time[_dependency], default=None)
+            chain_time[node.step_id] = node.duration + (chain_time[previous] if previous else 0.0)
+            chain_prev[node.step_id] = previous
+
+        tail: Optional[str] = max(chain_time, key=lambda _step_id: chain_time[_step_id])
+        critical_time = chain_time[tail]
+        chain: list[str] = []
+        while tail is not None:
+            chain.insert(0, tail)
+            tail = chain_prev[tail]
+        return critical_time, chain
+
+    def run_sequence(self, sequence_data: dict[str, Any], tracker: Optional[ProgressTracker] = None,
+                     force: bool = False, resume: bool = False, dry_run: bool = False) -> Optional[int]:
         """
         Load and execute a sequence of steps from a structured dictionary.
-        Each step is processed in order, and execution stops or resumes based on error policy.
+        Steps are executed in order unless they declare 'id' / 'depends_on', in which case independent steps
+        run concurrently in a bounded worker pool ('max_parallel_steps'). Status lines are always printed in
+        the same order, and execution stops or resumes based on each step error policy.
+        All steps are compiled upfront, so that unknown methods or invalid arguments are reported before
+        anything runs. Completed steps are fingerprinted in a workspace journal, steps found unchanged on the next run are
+        skipped and reported as 'CACHED'. Progress of the run itself is checkpointed, so that a failed run could be
+        resumed from its first incomplete step with the values stored by the completed steps restored.
         Args:
             sequence_data (dict[str, Any]): A dictionary containing the execution sequence definition.
             tracker (Optional[ProgressTracker]): An optional progress tracker. If not provided, a local one will be created.
+            force (bool): Ignore the journal and execute all steps.
+            resume (bool): Resume the last failed run of this sequence, skipping the steps it completed.
+            dry_run (bool): Only print the compiled execution plan.
         Returns:
             Optional[int]: Exit code. 0 on success, 1 on error.
         """
-        step_number: int = 0
         warnings_count: int = 0
         start_time: float = time.perf_counter()
-        last_step_results: Optional[CommandResultType] = None
         original_path = os.path.abspath(os.getcwd())  # Store entry path
         status_on_error: Optional[Union[dict, str]] = None
+        failed_node: Optional[_SequenceStep] = None
+        failure: Optional[Exception] = None
 
         if not self._tool_box.has_nested_list(sequence_data, require_non_empty_lists=True):
             raise ValueError(
@@ -1890,14 +2608,60 @@ class CorePlatform(CoreModuleInterface):
                 sys.stdout.write('\033[2K')  # Clear current line
                 print(expanded_msg)
 
+        def _resolve_status_on_error(_node: _SequenceStep) -> Optional[str]:
+            """ Resolve 'status_on_error' per distro if it's a dict """
+            _status_on_error = _node.data.get("status_on_error")
+            if isinstance(_status_on_error, dict):
+                distro = self._system_info.distro
+                return _status_on_error.get(distro, _status_on_error.get("default", None))
+            return _status_on_error  # already a string or None
+
+        def _run_node(_node: _SequenceStep) -> Optional[CommandResultType]:
+            """ Execute and time a single step, may run on a worker thread """
+            _node.start_time = time.perf_counter()
+            try:
+                return self._execute_sequence_step(_node)
+            finally:
+                _node.end_time = time.perf_counter()
+
         try:
             self._running_sequence = True  # Mark our state globally
+            self._venv_snapshot_plans.clear()
             self._steps_data = sequence_data.get("steps", [])
 
             # We should have gotten a non-empty list of steps to execute so
             if not isinstance(self._steps_data, list) or not self._steps_data:
                 raise ValueError("No valid steps found in the provided sequence.")
 
+            # Resolve the execution graph upfront, bad dependencies should fail before anything runs
+            ordered_nodes = self._build_sequence_graph(self._steps_data,
+                                                       merge_packages=sequence_data.get("merge_packages", True))
+            max_workers = max(1, int(sequence_data.get("max_parallel_steps",
+                                                       min(8, self._system_info.cpu_count or 1))))
+            self._compile_sequence(ordered_nodes)
+
+            if dry_run:
+                self._print_sequence_plan(ordered_nodes, max_workers=max_workers)
+                return 0
+
+            # Steps journal, stored in the workspace so that it's gone along with the workspace
+            self._sequence_force = force
+            self._sequence_journal = None
+            if sequence_data.get("cache", True):
+                self._sequence_journal = SequenceJournal(
+                    journal_file=os.path.join(self._workspace_path, ".sequence_journal.json"),
+                    salt=self.auto_forge.version)
+
+            # Checkpoint log, bound to this exact sequence definition
+            sequence_key = hashlib.sha256(
+                json.dumps(self._steps_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+            checkpoint = SequenceCheckpoint(
+                checkpoint_file=os.path.join(self._workspace_path, ".sequence_checkpoint.jsonl"),
+                sequence_key=sequence_key)
+            resumed_steps = checkpoint.start(resume=resume)
+            if resume and not resumed_steps:
+                self._logger.warning("No matching checkpoint found, running the sequence from its start")
+
             # Set up status view configuration, use class defaults when not specified
             self._status_new_line = sequence_data.get("status_new_line", self._status_new_line)
             self._status_title_length = sequence_data.get("status_title_length", self._status_title_length)
@@ -1918,61 +2682,131 @@ class CorePlatform(CoreModuleInterface):
             # First line reserved for package version
             self._tracker.set_complete_line(pre_text="AutoForge version", result_text=f"{self.auto_forge.version}")
 
-            # Step-by-step execution loop
-            for step in self._steps_data:
-                status_new_line: bool = step.get("status_new_line", self._status_new_line)
-
-                if step.get("disabled", False):
-                    continue
-
-                action_on_error: SequenceErrorActionType = (
-                    SequenceErrorActionType.from_label(step.get("action_on_error")))
-
-                status_on_error = step.get("status_on_error")
-                # Resolve status_on_error per distro if it's a dict
-                if isinstance(status_on_error, dict):
-                    distro = self._system_info.distro
-                    status_on_error = status_on_error.get(distro, status_on_error.get("default", None))
-                else:
-                    status_on_error = status_on_error  # already a string or None
-
-                self._tracker.set_pre(text=step.get("description"), new_line=status_new_line)
-                try:
-
-                    method_name = step.get("method")
-                    arguments = step.get("arguments")
-
-                    if not isinstance(method_name, str) or not method_name.strip() or arguments is None:
-                        raise RuntimeError(
-                            f"Missing or invalid 'method' or 'arguments' in step {step_number + 1}; both are required."
-                        )
-
-                    method_name = method_name.strip().lower()  # Normalize
-                    if method_name == "conditional":
-                        last_step_results = self._handle_conditional_step(arguments, step_number)
+            # A step is ready once all its dependencies completed. A lone ready step runs on this thread with
+            # live tracker updates, concurrent ones run silently in the pool while their status lines are
+            # flushed in display order, so the output is the same regardless of completion order.
+            outcomes: dict[str, tuple[str, int]] = {}
+            running: dict[Future, _SequenceStep] = {}
+            started: set[str] = set()
+            display_index: int = 0
+            display_pending: bool = False  # Whether the current display step pre-text was already printed
+
+            # Steps completed by the resumed run are done, restore the values they stored. Steps which only changed
+            # this process state (e.g. the environment) are executed again, so later steps see the same state.
+            for node in ordered_nodes:
+                if node.step_id in resumed_steps and node.method_name not in _SEQUENCE_IN_PROCESS_METHODS:
+                    for store_key, value in resumed_steps[node.step_id].items():
+                        self._tool_box.store_value(key=store_key, value=value)
+                    started.add(node.step_id)
+                    outcomes[node.step_id] = ("RESUMED", 0)
+
+            def _flush_status() -> None:
+                nonlocal display_index, display_pending
+                while display_index < len(ordered_nodes):
+                    _node = ordered_nodes[display_index]
+                    _outcome = outcomes.get(_node.step_id)
+                    if _outcome is None and _node.step_id not in started:
+                        return
+                    if not display_pending:
+                        self._tracker.set_pre(text=_node.data.get("description"),
+                                              new_line=_node.data.get("status_new_line", self._status_new_line))
+                        display_pending = True
+                    if _outcome is None or _node is failed_node:
+                        return  # Still running, or failed and reported by the error handler below
+                    self._tracker.set_result(text=_outcome[0], status_code=_outcome[1])
+                    display_pending = False
+                    display_index += 1
+
+            def _complete(_node: _SequenceStep, _results: Optional[CommandResultType],
+                          _error: Optional[Exception]) -> None:
+                nonlocal warnings_count, failed_node, failure, status_on_error
+                if self._sequence_journal is not None and _node.fingerprint is not None and not _node.cached:
+                    if _error is None and (_results is None or _results.return_code == 0):
+                        self._sequence_journal.record(step_id=_node.step_id, fingerprint=_node.fingerprint,
+                                                      arguments=_node.expanded_arguments)
                     else:
-                        last_step_results = self.execute_python_method(method_name=method_name, arguments=arguments)
+                        self._sequence_journal.invalidate(step_id=_node.step_id)
+                    self._sequence_journal.save()
 
-                except Exception as execution_error:
+                if _error is not None:
+                    action_on_error: SequenceErrorActionType = (
+                        SequenceErrorActionType.from_label(_node.data.get("action_on_error")))
 
                     # Default - not specified is treated a break
                     if action_on_error in (SequenceErrorActionType.BREAK, SequenceErrorActionType.DEFAULT):
-                        raise execution_error from execution_error
-
-                    elif action_on_error == SequenceErrorActionType.RESUME:
-                        self._tracker.set_result(text="WARNING", status_code=2)
-                        warning_msg = f"Ignored error during step {step_number + 1}: {execution_error}"
+                        if failed_node is None:
+                            failed_node, failure = _node, _error
+                            status_on_error = _resolve_status_on_error(_node)
+                        outcomes[_node.step_id] = ("Error", 1)
+                    else:
                         warnings_count = warnings_count + 1
-                        self._logger.warning(warning_msg)
-
-                if last_step_results and last_step_results.return_code == 0:
-                    store_key = step.get("response_store_key")
-                    if store_key and last_step_results.response:
-                        self._logger.debug(f"Storing value '{last_step_results.response}' in '{store_key}'")
-                        self._tool_box.store_value(key=store_key, value=last_step_results.response)
-
-                    self._tracker.set_result(text="OK", status_code=0)
-                step_number += 1
+                        self._logger.warning(f"Ignored error during step {_node.number}: {_error}")
+                        outcomes[_node.step_id] = ("WARNING", 2)
+                        checkpoint.append(step_id=_node.step_id)
+                    return
+
+                if _results is not None and _results.return_code != 0:
+                    self._logger.warning(f"Step {_node.number} returned {_results.return_code}")
+                    outcomes[_node.step_id] = ("WARNING", 2)
+                    checkpoint.append(step_id=_node.step_id)
+                    return
+
+                # Stored from this thread only, so later steps always see the value
+                stored_values: dict[str, Any] = {}
+                store_key = _node.data.get("response_store_key")
+                if _results is not None and store_key and _results.response:
+                    self._logger.debug(f"Storing value '{_results.response}' in '{store_key}'")
+                    self._tool_box.store_value(key=store_key, value=_results.response)
+                    stored_values[store_key] = _results.response
+                outcomes[_node.step_id] = ("CACHED", 0) if _node.cached else ("OK", 0)
+                checkpoint.append(step_id=_node.step_id, values=stored_values)
+
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Sequence") as executor:
+                while len(outcomes) < len(ordered_nodes):
+                    ready = [node for node in ordered_nodes if node.step_id not in started
+                             and all(dependency in outcomes for dependency in node.depends_on)]
+
+                    if failed_node is None:
+                        if len(ready) == 1 and not running:
+                            # Nothing else could run right now, execute on this thread
+                            node = ready[0]
+                            started.add(node.step_id)
+                            _flush_status()
+                            try:
+                                _complete(node, _run_node(node), None)
+                            except Exception as execution_error:
+                                _complete(node, None, execution_error)
+                            _flush_status()
+                            continue
+
+                        for node in ready[:max(0, max_workers - len(running))]:
+                            started.add(node.step_id)
+                            running[executor.submit(_run_node, node)] = node
+                        _flush_status()
+
+                    if not running:
+                        break  # Stopped on error, let nothing new start
+
+                    done, _ = wait(list(running.keys()), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        node = running.pop(future)
+                        try:
+                            _complete(node, future.result(), None)
+                        except Exception as execution_error:
+                            _complete(node, None, execution_error)
+                    _flush_status()
+
+            if failure is not None:
+                raise failure
+            checkpoint.clear()  # Nothing left to resume
+
+            # Critical path summary, only meaningful when the sequence defines explicit dependencies
+            if self._sequence_has_dependencies and len(ordered_nodes) > 1:
+                critical_time, chain = self._get_critical_path(ordered_nodes)
+                self._logger.info(f"Sequence critical path ({critical_time:.2f}s): {' -> '.join(chain)}")
+                self._tracker.set_complete_line(
+                    pre_text=f"Critical path ({len(chain)} steps)",
+                    result_text=f"{self._tool_box.format_duration(seconds=critical_time, add_ms=False)}")
 
             duration: float = (time.perf_counter()) - start_time
             # Last line reserved for duration
@@ -1984,12 +2818,16 @@ class CorePlatform(CoreModuleInterface):
             return 0
 
         except Exception as steps_error:
-            self._tracker.set_result(text="Error", status_code=1)
+            if self._tracker is not None:
+                self._tracker.set_result(text="Error", status_code=1)
             print()
             status_on_error and print(status_on_error)  # Echo custom step message if set
-            raise RuntimeError(f"Step {step_number + 1} failed: {steps_error}") from steps_error
+            if failed_node is None:
+                raise RuntimeError(f"Sequence failed: {steps_error}") from steps_error
+            raise RuntimeError(f"Step {failed_node.number} failed: {steps_error}") from steps_error
 
         finally:
             self._running_sequence = False
+            self._sequence_journal = None
             os.chdir(original_path)  # Restore original path
             self._tracker = None